@@ -0,0 +1,44 @@
+"""区域渲染基准：每帧重新绘制区域外观 vs 共享的合成表面
+
+用法（在stardew_clone目录下）：
+    python -m benchmarks.bench_areas [帧数]
+"""
+import sys
+import time
+
+from benchmarks.common import BenchGame
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    
+    game = BenchGame()
+    from scenes.farm_scene import FarmScene
+    from entities.area import Area
+    from config import TILE_SIZE
+    scene = FarmScene(game)
+    scene.setup()
+    screen = game.screen
+    camera = (scene.camera_x, scene.camera_y)
+    
+    # 每帧重新绘制（相当于缓存前每帧填充、缩放翻转边框、渲染标签的开销）
+    start = time.perf_counter()
+    for _ in range(frames):
+        for area in scene.areas:
+            composite, (offset_x, offset_y) = Area._build_composite(area.area_type, area.width, area.height)
+            screen.blit(composite, (area.x * TILE_SIZE + offset_x - camera[0], area.y * TILE_SIZE + offset_y - camera[1]))
+    rebuild = (time.perf_counter() - start) / frames
+    
+    start = time.perf_counter()
+    for _ in range(frames):
+        for area in scene.areas:
+            area.render(screen, camera)
+    cached = (time.perf_counter() - start) / frames
+    
+    print(f"区域: {len(scene.areas)}，帧数: {frames}，合成缓存项: {len(Area._composite_cache)}")
+    print(f"每帧重新绘制: {rebuild * 1000:.3f} ms")
+    print(f"合成表面:     {cached * 1000:.3f} ms（{rebuild / cached:.0f}x）")
+
+
+if __name__ == "__main__":
+    main()
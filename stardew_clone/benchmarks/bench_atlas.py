@@ -0,0 +1,49 @@
+"""纹理图集基准：逐个解码原图 vs 打包图集 vs 磁盘缓存图集
+
+用法（在stardew_clone目录下）：
+    python -m benchmarks.bench_atlas
+"""
+import os
+import tempfile
+import time
+
+from benchmarks.common import BenchGame
+
+
+def main():
+    BenchGame()
+    from config import ATLAS_SIZES, ATLAS_PAGE_SIZE
+    from utils.image_manager import ImageManager
+    from utils.texture_atlas import TextureAtlas
+    
+    # 逐个解码并缩放（相当于没有图集时首次绘制每个图像的开销）
+    manager = ImageManager()
+    sources = TextureAtlas.list_sources(manager.base_path, ATLAS_SIZES)
+    start = time.perf_counter()
+    for category, name, _ in sources:
+        for size in ATLAS_SIZES[category]:
+            if isinstance(size, float):
+                image = manager.load_image(category, name)
+                size = (int(image.get_width() * size), int(image.get_height() * size))
+            manager.load_scaled_image(category, name, size if isinstance(size, tuple) else (size, size))
+    per_image = time.perf_counter() - start
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        start = time.perf_counter()
+        atlas = TextureAtlas.load_or_build(manager.base_path, ATLAS_SIZES, ATLAS_PAGE_SIZE, cache_dir)
+        cold = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        cached = TextureAtlas.load_or_build(manager.base_path, ATLAS_SIZES, ATLAS_PAGE_SIZE, cache_dir)
+        warm = time.perf_counter() - start
+        assert len(cached.regions) == len(atlas.regions)
+        cache_bytes = sum(os.path.getsize(os.path.join(cache_dir, f)) for f in os.listdir(cache_dir))
+    
+    print(f"源图像: {len(sources)}，区域: {len(atlas.regions)}，图集页: {len(atlas.pages)}")
+    print(f"逐个解码缩放:   {per_image * 1000:.1f} ms")
+    print(f"打包图集(冷):   {cold * 1000:.1f} ms")
+    print(f"磁盘缓存(热):   {warm * 1000:.1f} ms（{per_image / warm:.0f}x，缓存 {cache_bytes / 1024:.0f} KB）")
+
+
+if __name__ == "__main__":
+    main()
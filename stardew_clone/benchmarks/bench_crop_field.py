@@ -0,0 +1,96 @@
+"""作物每日生长基准：逐个作物的对象路径与NumPy列式存储（CropField）的对比
+
+对象路径对每株作物调用Crop.grow()，列式路径用向量化运算计算生长，再把变化的行用一次executemany写回。
+另外用合成数据测量超大农场（默认100万株）的向量化生长耗时。
+
+用法（在stardew_clone目录下）：
+    python -m benchmarks.bench_crop_field [作物数量] [合成数据行数]
+"""
+import sys
+import time
+
+from benchmarks.common import BenchGame
+
+
+def plant_watered(db, player_id, count):
+    """用一次executemany种下count株已浇水的作物（多种作物类型）"""
+    import datetime
+    from config import CROP_TYPES, FARM_WIDTH
+    crop_types = list(CROP_TYPES)
+    now = datetime.datetime.now()
+    db.cursor.executemany(
+        "INSERT INTO crops (player_id, crop_type, x, y, planted_at, growth_stage, is_watered) VALUES (?, ?, ?, ?, ?, 0, 1)",
+        [(player_id, crop_types[i % len(crop_types)], i % FARM_WIDTH, i // FARM_WIDTH, now) for i in range(count)]
+    )
+    db.conn.commit()
+
+
+def timed(func):
+    """执行func并返回耗时（毫秒）"""
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    synthetic = int(sys.argv[2]) if len(sys.argv) > 2 else 1000000
+
+    from entities.crop import Crop
+    from entities.crop_field import CropField
+    if not CropField.available():
+        print("未安装numpy，无法使用列式作物存储")
+        return
+
+    results = {}
+    for mode in ("对象", "列式"):
+        game = BenchGame()
+        db = game.db
+        plant_watered(db, game.player_id, count)
+        crops = Crop.load_for_player(db, game.player_id, game=game)
+
+        if mode == "对象":
+            def grow():
+                for crop in crops:
+                    crop.grow()
+            grow_ms = timed(grow)
+            write_ms = timed(db.flush)
+        else:
+            field = CropField.from_crops(crops)
+            changed = []
+            grow_ms = timed(lambda: changed.append(field.advance_day()))
+            write_ms = timed(lambda: (field.write_back(db, changed[0]), db.flush()))
+
+        stages = db.cursor.execute("SELECT SUM(growth_stage), SUM(is_watered) FROM crops").fetchone()
+        results[mode] = (grow_ms, write_ms, tuple(stages))
+        db.close()
+
+    print(f"作物数量: {count}")
+    for mode, (grow_ms, write_ms, stages) in results.items():
+        print(f"{mode}路径: 生长 {grow_ms:.1f} ms，写回 {write_ms:.1f} ms，合计 {grow_ms + write_ms:.1f} ms")
+    if results["对象"][2] != results["列式"][2]:
+        print(f"错误：两种路径的数据库结果不一致 {results['对象'][2]} != {results['列式'][2]}")
+        sys.exit(1)
+
+    # 超大农场：只测量向量化生长（一半作物已浇水）
+    import numpy as np
+    from config import CROP_TYPES
+    crop_types = list(CROP_TYPES)
+    field = CropField.from_columns(
+        np.arange(1, synthetic + 1),
+        [crop_types[i % len(crop_types)] for i in range(synthetic)],
+        np.arange(synthetic) % 1000,
+        np.arange(synthetic) // 1000,
+        np.zeros(synthetic, dtype=np.int32),
+        np.arange(synthetic) % 2 == 0
+    )
+    timings = []
+    for _ in range(5):
+        field.water_all()
+        timings.append(timed(field.advance_day))
+    timings.sort()
+    print(f"合成农场 {synthetic} 株: 每天生长 {timings[len(timings) // 2]:.2f} ms（中位数，共5天）")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""作物查找基准：线性扫描列表 vs 作物登记表（CropRegistry）
+
+模拟使用工具时按ID查找作物和收获时删除作物。
+
+用法（在stardew_clone目录下）：
+    python -m benchmarks.bench_crop_lookup [作物数量] [操作次数]
+"""
+import sys
+import time
+import random
+
+from benchmarks.common import BenchGame
+
+
+class BenchCrop:
+    """只有ID和坐标的作物，避免构建大量真实作物的开销"""
+
+    def __init__(self, crop_id, x, y):
+        self.id = crop_id
+        self.x = x
+        self.y = y
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    operations = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    BenchGame()
+    from entities.crop_registry import CropRegistry
+    crops = [BenchCrop(i + 1, i % 1000, i // 1000) for i in range(count)]
+    random.seed(0)
+    targets = random.sample(range(1, count + 1), operations)
+
+    # 原来的做法：线性扫描查找，list.pop删除
+    crop_list = list(crops)
+    start = time.perf_counter()
+    for crop_id in targets:
+        for i, crop in enumerate(crop_list):
+            if crop.id == crop_id:
+                crop_list.pop(i)
+                break
+    linear = (time.perf_counter() - start) / operations
+
+    # 登记表：字典查找，swap-remove删除
+    registry = CropRegistry(crops)
+    start = time.perf_counter()
+    for crop_id in targets:
+        crop = registry.get(crop_id)
+        registry.remove(crop)
+    indexed = (time.perf_counter() - start) / operations
+
+    # 按瓦片坐标查找
+    start = time.perf_counter()
+    for crop in crops[:operations]:
+        registry.at(crop.x, crop.y)
+    by_tile = (time.perf_counter() - start) / operations
+
+    print(f"作物数量: {count}，操作次数: {operations}")
+    print(f"线性扫描: {linear * 1e6:.1f} us/次")
+    print(f"登记表: {indexed * 1e6:.2f} us/次（{linear / indexed:.0f}x），按坐标查找 {by_tile * 1e6:.2f} us/次")
+    if sorted(crop.id for crop in registry) != sorted(crop.id for crop in crop_list):
+        print("错误：两种方式删除后剩下的作物不一致")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""作物渲染基准：统计每帧的Surface分配次数和耗时
+
+通过包装 pygame.Surface 和 pygame.transform.scale 统计渲染期间新建的表面数量。
+
+用法（在stardew_clone目录下）：
+    python -m benchmarks.bench_crop_render [作物数量] [帧数]
+"""
+import sys
+import time
+
+import pygame
+
+from benchmarks.common import BenchGame, plant_field
+
+
+class AllocationCounter:
+    """在with块内统计新建的Surface数量"""
+    
+    def __init__(self):
+        self.count = 0
+        self._surface = pygame.Surface
+        self._scale = pygame.transform.scale
+    
+    def __enter__(self):
+        counter = self
+        original_surface = self._surface
+        original_scale = self._scale
+        
+        class CountingSurface(original_surface):
+            def __init__(self, *args, **kwargs):
+                counter.count += 1
+                super().__init__(*args, **kwargs)
+        
+        def counting_scale(*args, **kwargs):
+            counter.count += 1
+            return original_scale(*args, **kwargs)
+        
+        pygame.Surface = CountingSurface
+        pygame.transform.scale = counting_scale
+        return self
+    
+    def __exit__(self, *exc):
+        pygame.Surface = self._surface
+        pygame.transform.scale = self._scale
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    
+    game = BenchGame()
+    from config import TILE_SIZE
+    from entities.crop import Crop
+    plant_field(game.db, game.player_id, count)
+    crops = Crop.load_for_player(game.db, game.player_id, game=game)
+    for crop in crops[::2]:
+        crop.is_watered = True
+    screen = game.screen
+    
+    # 第一帧填充缓存
+    for crop in crops:
+        crop.render(screen, TILE_SIZE)
+    
+    with AllocationCounter() as counter:
+        start = time.perf_counter()
+        for _ in range(frames):
+            for crop in crops:
+                crop.render(screen, TILE_SIZE)
+        elapsed = (time.perf_counter() - start) / frames
+    
+    print(f"作物: {len(crops)}，帧数: {frames}")
+    print(f"每帧Surface分配: {counter.count / frames:.1f}")
+    print(f"每帧耗时: {elapsed * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""装饰渲染基准：每帧排序+缩放+旋转 vs 预变换精灵图层
+
+用法（在stardew_clone目录下）：
+    python -m benchmarks.bench_decorations [帧数]
+"""
+import sys
+import time
+
+import pygame
+
+from benchmarks.common import BenchGame
+
+
+def render_per_frame(scene, screen):
+    """缓存前的绘制方式：每帧排序并对每个装饰做缩放和旋转"""
+    from config import TILE_SIZE
+    for decoration in sorted(scene.decorations, key=lambda x: x["z_index"]):
+        x, y = decoration["position"]
+        image = decoration["image"]
+        width = int(image.get_width() * decoration["size"])
+        height = int(image.get_height() * decoration["size"])
+        scaled_image = pygame.transform.scale(image, (width, height))
+        rotated_image = pygame.transform.rotate(scaled_image, decoration["rotation"])
+        screen.blit(rotated_image, (x * TILE_SIZE - scene.camera_x - rotated_image.get_width() // 2,
+                                    y * TILE_SIZE - scene.camera_y - rotated_image.get_height() // 2))
+    for tree in scene.trees:
+        x, y = tree["position"]
+        image = tree["image"]
+        width = int(image.get_width() * tree["size"])
+        height = int(image.get_height() * tree["size"])
+        scaled_image = pygame.transform.scale(image, (width, height))
+        screen.blit(scaled_image, (x * TILE_SIZE - scene.camera_x - width // 4,
+                                   y * TILE_SIZE - scene.camera_y - height // 2))
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    
+    game = BenchGame()
+    from scenes.farm_scene import FarmScene
+    scene = FarmScene(game)
+    scene.setup()
+    screen = game.screen
+    
+    start = time.perf_counter()
+    for _ in range(frames):
+        render_per_frame(scene, screen)
+    per_frame = (time.perf_counter() - start) / frames
+    
+    start = time.perf_counter()
+    for _ in range(frames):
+        scene.render_decorations(screen)
+        scene.render_trees(screen)
+    layered = (time.perf_counter() - start) / frames
+    
+    print(f"装饰: {len(scene.decorations)}，树木: {len(scene.trees)}，帧数: {frames}")
+    print(f"每帧变换:   {per_frame * 1000:.3f} ms")
+    print(f"预变换图层: {layered * 1000:.3f} ms（{per_frame / layered:.0f}x，"
+          f"可见装饰 {scene.decoration_layer.visible_count}，可见树木 {scene.tree_layer.visible_count}）")
+
+
+if __name__ == "__main__":
+    main()
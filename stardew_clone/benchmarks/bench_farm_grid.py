@@ -0,0 +1,78 @@
+"""农场网格基准：字典网格与紧凑网格（FarmGrid）的内存占用和整张网格查询耗时
+
+用法（在stardew_clone目录下）：
+    python -m benchmarks.bench_farm_grid [边长]
+"""
+import sys
+import time
+import tracemalloc
+
+from benchmarks.common import BenchGame
+
+
+def build_dict_grid(size):
+    """原来的网格：列表的列表，耕地和作物是字典"""
+    grid = [[None for _ in range(size)] for _ in range(size)]
+    for y in range(size):
+        for x in range(size):
+            if (x + y) % 3 == 0:
+                grid[y][x] = {"type": "tilled", "watered": x % 2 == 0}
+            elif (x + y) % 3 == 1:
+                grid[y][x] = {"type": "crop", "id": y * size + x}
+    return grid
+
+
+def build_farm_grid(size):
+    """紧凑网格，内容与build_dict_grid相同"""
+    from entities.farm_grid import FarmGrid
+    grid = FarmGrid(size, size)
+    for y in range(size):
+        for x in range(size):
+            if (x + y) % 3 == 0:
+                grid.set_tilled(x, y, watered=x % 2 == 0)
+            elif (x + y) % 3 == 1:
+                grid.set_crop(x, y, y * size + x)
+    return grid
+
+
+def measure(build, size):
+    """构建网格并返回(网格, 占用的内存字节数)"""
+    tracemalloc.start()
+    grid = build(size)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return grid, memory
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    BenchGame()
+    tiles = size * size
+    dict_grid, dict_memory = measure(build_dict_grid, size)
+    farm_grid, farm_memory = measure(build_farm_grid, size)
+
+    # 查询所有未浇水的耕地
+    start = time.perf_counter()
+    dict_result = [
+        (x, y)
+        for y in range(size)
+        for x in range(size)
+        if dict_grid[y][x] and dict_grid[y][x]["type"] == "tilled" and not dict_grid[y][x].get("watered", False)
+    ]
+    dict_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    farm_result = farm_grid.positions(farm_grid.TILLED)
+    farm_time = time.perf_counter() - start
+
+    print(f"网格: {size}x{size}（{tiles} 个瓦片）")
+    print(f"字典网格: {dict_memory / tiles:.1f} 字节/瓦片，查询未浇水耕地 {dict_time * 1000:.1f} ms")
+    print(f"紧凑网格: {farm_memory / tiles:.1f} 字节/瓦片，查询未浇水耕地 {farm_time * 1000:.1f} ms")
+    if dict_result != farm_result:
+        print("错误：两种网格的查询结果不一致")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
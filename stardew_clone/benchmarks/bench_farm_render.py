@@ -0,0 +1,64 @@
+"""农场地面渲染基准：逐瓦片绘制 vs 分块缓存
+
+逐瓦片绘制的开销随农场面积增长，分块缓存每帧只blit与屏幕相交的区块。
+
+用法（在stardew_clone目录下）：
+    python -m benchmarks.bench_farm_render [帧数]
+"""
+import sys
+import time
+
+from benchmarks.common import BenchGame
+
+
+def make_grid(width, height):
+    """生成一块一半是耕地的网格"""
+    from entities.farm_grid import FarmGrid
+    grid = FarmGrid(width, height)
+    for y in range(height):
+        for x in range(width):
+            if (x + y) % 2 == 0:
+                grid.set_tilled(x, y, watered=x % 3 == 0)
+    return grid
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    
+    game = BenchGame()
+    from config import TILE_SIZE, RENDER_CHUNK_SIZE, RENDER_MAX_CACHED_CHUNKS
+    from utils.tile_map_renderer import TileMapRenderer
+    screen = game.screen
+    
+    print(f"帧数: {frames}")
+    for width, height in [(16, 12), (64, 48), (256, 192)]:
+        grid = make_grid(width, height)
+        
+        # 逐瓦片绘制：整张地图每帧重新绘制（相当于缓存前的每帧开销）
+        naive = TileMapRenderer(width, height, TILE_SIZE, chunk_size=max(width, height))
+        naive_frames = max(1, frames // (width * height // 192))
+        start = time.perf_counter()
+        for _ in range(naive_frames):
+            screen.blit(naive._bake_chunk(0, 0, grid), (0, 0))
+        per_tile = (time.perf_counter() - start) / naive_frames
+        
+        # 分块缓存，每帧修改一个瓦片并平移相机
+        renderer = TileMapRenderer(width, height, TILE_SIZE,
+                                   chunk_size=RENDER_CHUNK_SIZE,
+                                   max_cached_chunks=RENDER_MAX_CACHED_CHUNKS)
+        renderer.render(screen, grid, False, 0, 0)
+        start = time.perf_counter()
+        for i in range(frames):
+            x, y = i % width, (i // width) % height
+            grid.set_tilled(x, y, watered=True)
+            renderer.invalidate_tile(x, y)
+            renderer.render(screen, grid, False, i % TILE_SIZE, 0)
+        chunked = (time.perf_counter() - start) / frames
+        
+        print(f"{width}x{height}: 逐瓦片 {per_tile * 1000:.3f} ms，"
+              f"分块缓存 {chunked * 1000:.3f} ms（{per_tile / chunked:.0f}x，"
+              f"每帧blit {renderer.chunks_drawn} 个区块）")
+
+
+if __name__ == "__main__":
+    main()
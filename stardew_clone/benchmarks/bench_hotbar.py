@@ -0,0 +1,41 @@
+"""物品栏渲染微基准：每帧重新合成 vs 使用缓存表面
+
+用法（在stardew_clone目录下）：
+    python -m benchmarks.bench_hotbar [帧数]
+"""
+import sys
+import time
+
+from benchmarks.common import BenchGame
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    
+    game = BenchGame()
+    from entities.inventory import Inventory
+    inventory = Inventory(game.db, game.player_id, game=game)
+    inventory.add_items([("小麦", "作物", 5), ("牛饲料", "饲料", 3), ("番茄", "作物", 2)])
+    screen = game.screen
+    x, y = 10, screen.get_height() - 74
+    
+    # 每帧重新合成（相当于缓存前的每帧开销）
+    start = time.perf_counter()
+    for _ in range(frames):
+        screen.blit(inventory._build_hotbar_surface(), (x, y))
+    rebuild = (time.perf_counter() - start) / frames
+    
+    # 使用缓存表面
+    inventory.render(screen, x, y)
+    start = time.perf_counter()
+    for _ in range(frames):
+        inventory.render(screen, x, y)
+    cached = (time.perf_counter() - start) / frames
+    
+    print(f"物品槽: {len(inventory.slots)}，帧数: {frames}")
+    print(f"每帧重新合成: {rebuild * 1000:.3f} ms")
+    print(f"缓存表面:     {cached * 1000:.3f} ms（{rebuild / cached:.0f}x）")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""主菜单渲染基准：每帧重新绘制静态背景 vs 预先绘制的背景表面
+
+用法（在stardew_clone目录下）：
+    python -m benchmarks.bench_main_menu [帧数]
+"""
+import sys
+import time
+
+from benchmarks.common import BenchGame
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    game = BenchGame()
+    from scenes.main_menu import MainMenu
+    menu = MainMenu(game)
+    screen = game.screen
+    width, height = screen.get_size()
+
+    # 每帧重新绘制背景（相当于缓存前逐行绘制渐变、逐格创建草地纹理、绘制栅栏和房屋的开销）
+    start = time.perf_counter()
+    for _ in range(frames):
+        MainMenu._backdrop_cache.clear()
+        menu.render(screen)
+    rebuild = (time.perf_counter() - start) / frames
+
+    MainMenu.get_backdrop(width, height)
+    start = time.perf_counter()
+    for _ in range(frames):
+        menu.render(screen)
+    cached = (time.perf_counter() - start) / frames
+
+    print(f"窗口: {width}x{height}，帧数: {frames}")
+    print(f"每帧重新绘制背景: {rebuild * 1000:.3f} ms")
+    print(f"缓存的背景表面:   {cached * 1000:.3f} ms（{rebuild / cached:.0f}x）")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""资源预加载基准：主线程逐个加载 vs 线程池解码 + 主线程分片转换
+
+不使用纹理图集，加载assets/images下的全部PNG。
+
+用法（在stardew_clone目录下）：
+    python -m benchmarks.bench_preload [线程数]
+"""
+import sys
+import time
+
+from benchmarks.common import BenchGame
+
+
+def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    
+    BenchGame()
+    from utils.image_manager import ImageManager
+    from utils.asset_preloader import AssetPreloader
+    
+    # 主线程逐个加载（相当于渲染时按需加载的总开销）
+    manager = ImageManager()
+    manifest = AssetPreloader.build_manifest(manager)
+    start = time.perf_counter()
+    for _, category, name in manifest:
+        manager.load_image(category, name)
+    sequential = time.perf_counter() - start
+    
+    # 线程池解码，主线程每帧最多处理8ms
+    manager = ImageManager()
+    preloader = AssetPreloader(manager, manifest, max_workers=workers, frame_budget_ms=8)
+    start = time.perf_counter()
+    preloader.start()
+    frames = 0
+    longest = 0
+    while True:
+        frame_start = time.perf_counter()
+        done = preloader.update()
+        longest = max(longest, time.perf_counter() - frame_start)
+        frames += 1
+        if done:
+            break
+        time.sleep(1 / 60)  # 模拟其余的帧时间
+    preloaded = time.perf_counter() - start
+    
+    print(f"图像: {len(manifest)}，线程数: {workers}")
+    print(f"主线程逐个加载: {sequential * 1000:.0f} ms（全部阻塞主线程）")
+    print(f"后台预加载:     {preloaded * 1000:.0f} ms，{frames} 帧，主线程单帧最长 {longest * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
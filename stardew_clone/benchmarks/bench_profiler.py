@@ -0,0 +1,66 @@
+"""帧耗时分析器开销基准：关闭/开启分析时计时范围和农场渲染的耗时
+
+用法（在stardew_clone目录下）：
+    python -m benchmarks.bench_profiler [帧数] [导出路径]
+"""
+import sys
+import time
+
+from benchmarks.common import BenchGame
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    dump_path = sys.argv[2] if len(sys.argv) > 2 else None
+
+    game = BenchGame()
+    from scenes.farm_scene import FarmScene
+    from utils.profiler import profiler
+    scene = FarmScene(game)
+    scene.setup()
+    screen = game.screen
+
+    # 单个计时范围的开销
+    calls = 200000
+    results = {}
+    for enabled in (False, True):
+        profiler.set_enabled(enabled)
+        profiler.begin_frame()
+        start = time.perf_counter()
+        for _ in range(calls):
+            with profiler.scope("bench.scope"):
+                pass
+        results[enabled] = (time.perf_counter() - start) / calls
+        profiler.end_frame()
+    profiler.clear()
+
+    # 农场一帧的更新和渲染（先预热缓存）
+    for _ in range(20):
+        scene.render(screen)
+    frame_times = {}
+    for enabled in (False, True):
+        profiler.set_enabled(enabled)
+        start = time.perf_counter()
+        for _ in range(frames):
+            profiler.begin_frame()
+            scene.update()
+            scene.render(screen)
+            profiler.end_frame()
+        frame_times[enabled] = (time.perf_counter() - start) / frames
+
+    print(f"计时范围（关闭）: {results[False] * 1e9:.0f} ns/次")
+    print(f"计时范围（开启）: {results[True] * 1e9:.0f} ns/次")
+    print(f"农场帧（关闭）:   {frame_times[False] * 1000:.3f} ms")
+    print(f"农场帧（开启）:   {frame_times[True] * 1000:.3f} ms")
+
+    percentiles = profiler.frame_percentiles()
+    print(f"帧耗时 p50/p95/p99: {percentiles[50]:.3f} / {percentiles[95]:.3f} / {percentiles[99]:.3f} ms")
+    for name, elapsed in profiler.scope_averages():
+        print(f"  {name}: {elapsed:.3f} ms")
+
+    if dump_path:
+        print(f"已导出 {profiler.dump(dump_path)} 帧到 {dump_path}")
+
+
+if __name__ == "__main__":
+    main()
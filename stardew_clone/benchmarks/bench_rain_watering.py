@@ -0,0 +1,51 @@
+"""雨天每帧SQL语句数回归基准
+
+用法（在stardew_clone目录下）：
+    python -m benchmarks.bench_rain_watering [作物数量] [帧数]
+
+稳定下雨时每帧执行的SQL语句应为0。
+"""
+import sys
+import time
+
+from benchmarks.common import BenchGame, plant_field, count_statements
+
+
+def main():
+    crop_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 600
+    
+    game = BenchGame()
+    plant_field(game.db, game.player_id, crop_count)
+    game.db.update_weather(game.player_id, "雨天")
+    game.db.flush()
+    
+    from scenes.farm_scene import FarmScene
+    scene = FarmScene(game)
+    
+    # 读档时开始下雨，一次性浇水
+    statements = count_statements(game.db)
+    scene.setup()
+    watered = sum(1 for crop in scene.crops if crop.is_watered)
+    print(f"作物: {crop_count}，开始下雨后已浇水: {watered}")
+    
+    # 稳定下雨的帧
+    statements.clear()
+    start = time.perf_counter()
+    for _ in range(frames):
+        scene.fixed_update(1 / 60)
+        scene.update()
+    elapsed = time.perf_counter() - start
+    game.db.conn.set_trace_callback(None)
+    
+    per_frame = len(statements) / frames
+    print(f"雨天帧数: {frames}，SQL语句总数: {len(statements)}，每帧: {per_frame:.2f}")
+    print(f"每帧update耗时: {elapsed / frames * 1000:.3f} ms")
+    
+    if statements:
+        print("回归：雨天稳定状态下每帧仍在执行SQL语句")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
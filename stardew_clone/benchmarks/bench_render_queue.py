@@ -0,0 +1,56 @@
+"""实体渲染基准：逐个blit vs 渲染队列批量blits
+
+用法（在stardew_clone目录下）：
+    python -m benchmarks.bench_render_queue [作物数量] [帧数]
+"""
+import sys
+import time
+
+from benchmarks.common import BenchGame, plant_field
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    
+    game = BenchGame()
+    from config import TILE_SIZE
+    from scenes.farm_scene import FarmScene
+    from utils.render_queue import RenderQueue
+    plant_field(game.db, game.player_id, count)
+    scene = FarmScene(game)
+    scene.setup()
+    screen = game.screen
+    crops = scene.crops
+    for crop in crops[::2]:
+        crop.is_watered = True
+    
+    # 逐个blit
+    start = time.perf_counter()
+    for _ in range(frames):
+        for crop in crops:
+            crop.render(screen, TILE_SIZE, (scene.camera_x, scene.camera_y))
+    direct = (time.perf_counter() - start) / frames
+    
+    # 渲染队列：剔除视口外的作物后每个图层一次blits
+    queue = RenderQueue()
+    start = time.perf_counter()
+    for _ in range(frames):
+        queue.begin(scene.camera_x, scene.camera_y, screen.get_width(), screen.get_height())
+        for crop in crops:
+            crop.submit(queue, TILE_SIZE, RenderQueue.LAYER_CROPS)
+        stats = queue.flush(screen)
+    batched = (time.perf_counter() - start) / frames
+    
+    # 完整场景一帧
+    scene.render(screen)
+    
+    print(f"作物: {len(crops)}，帧数: {frames}")
+    print(f"逐个blit:   {direct * 1000:.3f} ms")
+    print(f"渲染队列:   {batched * 1000:.3f} ms（{direct / batched:.1f}x）")
+    print(f"作物队列统计: {stats}")
+    print(f"场景统计:     {scene.render_stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""农场场景启动基准：setup耗时和SQL语句数随作物数量的变化
+
+用法（在stardew_clone目录下）：
+    python -m benchmarks.bench_scene_setup [作物数量 ...]
+"""
+import sys
+import time
+
+from benchmarks.common import BenchGame, plant_field, count_statements
+
+
+def measure(crop_count):
+    """测量加载crop_count株作物的农场场景的setup耗时
+    
+    Returns:
+        (setup耗时秒数, 执行的SQL语句数)
+    """
+    game = BenchGame()
+    plant_field(game.db, game.player_id, crop_count)
+    
+    from scenes.farm_scene import FarmScene
+    scene = FarmScene(game)
+    
+    statements = count_statements(game.db)
+    start = time.perf_counter()
+    scene.setup()
+    elapsed = time.perf_counter() - start
+    game.db.conn.set_trace_callback(None)
+    
+    assert len(scene.crops) == crop_count
+    game.db.close()
+    return elapsed, len(statements)
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [0, 1000, 10000, 50000]
+    
+    print(f"{'作物数量':>10} {'setup耗时(ms)':>14} {'SQL语句数':>10}")
+    for crop_count in counts:
+        elapsed, statements = measure(crop_count)
+        print(f"{crop_count:>10} {elapsed * 1000:>14.1f} {statements:>10}")
+
+
+if __name__ == "__main__":
+    main()
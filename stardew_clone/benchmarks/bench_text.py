@@ -0,0 +1,57 @@
+"""文字渲染基准：农场界面每帧直接调用font.render vs 字体管理器的文字缓存
+
+用法（在stardew_clone目录下）：
+    python -m benchmarks.bench_text [帧数]
+"""
+import sys
+import time
+
+from benchmarks.common import BenchGame
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    game = BenchGame()
+    from scenes.farm_scene import FarmScene
+    from utils.font_manager import font_manager
+    scene = FarmScene(game)
+    scene.setup()
+    screen = game.screen
+
+    # 界面文字（名称、经验、金钱、能量、时间）每帧内容基本不变
+    lines = [
+        (scene.font_medium, f"{scene.player.name} (等级 {scene.player.level})", (255, 255, 255)),
+        (scene.font, f"经验: {scene.player.exp}", (255, 255, 255)),
+        (scene.font, f"金钱: {scene.player.money}", (255, 255, 0)),
+        (scene.font, f"能量: {int(scene.player.energy)}/{scene.player.max_energy}", (255, 255, 255)),
+        (scene.font, "时间: 06:00", (255, 255, 255))
+    ]
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        for font, text, color in lines:
+            screen.blit(font.render(text, True, color), (0, 0))
+    raw = (time.perf_counter() - start) / frames
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        for font, text, color in lines:
+            screen.blit(font_manager.render(font, text, True, color), (0, 0))
+        font_manager.end_frame()
+    cached = (time.perf_counter() - start) / frames
+
+    # 整个农场界面（包括物品栏）每帧的文字渲染耗时
+    for _ in range(frames):
+        scene.render(screen)
+        font_manager.end_frame()
+    stats = font_manager.get_stats()
+
+    print(f"文字行: {len(lines)}，帧数: {frames}")
+    print(f"font.render:  {raw * 1000:.3f} ms")
+    print(f"文字缓存:     {cached * 1000:.3f} ms（{raw / cached:.0f}x）")
+    print(f"农场界面每帧文字渲染: {stats['frame_time_ms']:.3f} ms，命中率 {stats['hit_rate'] * 100:.1f}%，缓存 {stats['cached']} 项")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""区域查询基准：逐个区域检查contains_point vs 按瓦片预先计算的区域索引（ZoneMap）
+
+用法（在stardew_clone目录下）：
+    python -m benchmarks.bench_zone_map [区域数量] [查询次数]
+"""
+import sys
+import time
+import random
+
+from benchmarks.common import BenchGame
+
+
+def main():
+    zone_count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+
+    BenchGame()
+    from entities.area import Area
+    from entities.zone_map import ZoneMap
+    random.seed(0)
+    width, height = 256, 192
+    area_types = [Area.PLANTING, Area.BREEDING, Area.HOUSING, Area.GENERAL]
+    areas = [
+        Area(random.randrange(width - 8), random.randrange(height - 8),
+             random.randint(2, 8), random.randint(2, 8), random.choice(area_types))
+        for _ in range(zone_count)
+    ]
+
+    zones = ZoneMap(width, height)
+    start = time.perf_counter()
+    zones.rebuild(areas)
+    rebuild = time.perf_counter() - start
+
+    points = [(random.randrange(width), random.randrange(height)) for _ in range(queries)]
+
+    # 逐个区域检查（原来的写法）
+    start = time.perf_counter()
+    scanned = [
+        any(area.area_type == Area.PLANTING and area.contains_point(x, y) for area in areas)
+        for x, y in points
+    ]
+    scan = (time.perf_counter() - start) / queries
+
+    # 区域索引
+    start = time.perf_counter()
+    indexed = [zones.contains(x, y, Area.PLANTING) for x, y in points]
+    lookup = (time.perf_counter() - start) / queries
+
+    print(f"农场: {width}x{height}，区域: {zone_count}，查询: {queries}")
+    print(f"重建索引: {rebuild * 1000:.1f} ms")
+    print(f"逐个区域检查: {scan * 1e6:.2f} us/次")
+    print(f"区域索引:     {lookup * 1e6:.2f} us/次（{scan / lookup:.0f}x）")
+    if scanned != indexed:
+        print("错误：两种查询的结果不一致")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
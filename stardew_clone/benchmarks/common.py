@@ -0,0 +1,73 @@
+"""基准测试公共工具：在无窗口环境下构建游戏和农场场景"""
+import os
+import sys
+import tempfile
+
+# 使用虚拟的视频/音频驱动，基准测试不需要真实窗口和声卡
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# 游戏代码使用相对于游戏根目录的导入和资源路径
+GAME_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if GAME_ROOT not in sys.path:
+    sys.path.insert(0, GAME_ROOT)
+os.chdir(GAME_ROOT)
+
+import pygame
+from config import WINDOW_WIDTH, WINDOW_HEIGHT, FARM_WIDTH, FARM_HEIGHT
+from database.db_manager import DatabaseManager
+
+
+class BenchGame:
+    """基准测试用的最小游戏对象，提供场景需要的screen/db/image_manager/player_id"""
+    
+    def __init__(self, db_path=None, write_behind=True):
+        """初始化
+        
+        Args:
+            db_path: 数据库文件路径，None表示使用临时文件
+            write_behind: 是否启用数据库延迟写入
+        """
+        pygame.init()
+        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.clock = pygame.time.Clock()
+        
+        if db_path is None:
+            db_path = os.path.join(tempfile.mkdtemp(prefix="farm_bench_"), "bench.db")
+        self.db = DatabaseManager(db_path, write_behind=write_behind)
+        
+        from utils.image_manager import ImageManager, set_image_manager
+        self.image_manager = ImageManager()
+        set_image_manager(self.image_manager)
+        
+        self.player_id = self.db.create_new_player("基准测试")
+        self.db.flush()
+    
+    def change_scene(self, scene_name, **kwargs):
+        """基准测试中不切换场景"""
+        pass
+
+
+def plant_field(db, player_id, count, crop_type="小麦"):
+    """在数据库中直接种下count株作物（按行填满农场，超出农场范围的继续向下排列）
+    
+    Args:
+        db: 数据库管理器实例
+        player_id: 玩家ID
+        count: 作物数量
+        crop_type: 作物类型
+    """
+    for i in range(count):
+        db.add_crop(player_id, crop_type, i % FARM_WIDTH, i // FARM_WIDTH)
+    db.flush()
+
+
+def count_statements(db):
+    """开始统计数据库执行的SQL语句数量
+    
+    Returns:
+        一个列表，每执行一条语句追加一项；调用db.conn.set_trace_callback(None)停止统计
+    """
+    statements = []
+    db.conn.set_trace_callback(statements.append)
+    return statements
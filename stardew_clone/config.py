@@ -9,6 +9,28 @@ TILE_SIZE = 64  # 每个瓦片的像素大小
 FPS = 60
 GAME_TITLE = "星露谷物语克隆版"
 
+# 数据库设置
+DB_WRITE_BEHIND = True  # 延迟写入：修改先合并在内存中，在结束当天、切换场景、退出时一次性提交
+DB_FLUSH_INTERVAL = 30  # 延迟写入的自动提交间隔（秒），None表示只在上述时机提交
+
+# 数据库连接参数配置
+DB_PROFILES = {
+    # SQLite默认设置：回滚日志 + 每次提交完全同步
+    "safe": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL"
+    },
+    # 性能优先：WAL日志，提交时不等待fsync（断电最多丢失最近的提交，不会损坏数据库）
+    "performance": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 64 * 1024 * 1024,  # 64MB内存映射
+        "cache_size": -16000,           # 约16MB页缓存（负数表示KB）
+        "temp_store": "MEMORY"
+    }
+}
+DB_PROFILE = "performance"  # 当前使用的连接参数配置
+
 # 颜色定义
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -18,11 +40,59 @@ BLUE = (0, 0, 255)
 
 # 游戏内时间设置
 DAY_LENGTH = 24 * 60  # 一天的游戏内分钟数
-TIME_SCALE = 30  # 现实1秒 = 游戏内60秒
+TIME_SCALE = 60  # 模拟速率：现实1秒 = 游戏内60分钟（每个固定步长推进1分钟）
+SIM_SPEEDS = [1, 10, 100]  # 快进倍数（农场中按Tab切换）
+SIM_MAX_FRAME_TIME = 0.25  # 单帧计入模拟的最长时间（秒），避免卡顿后一次补算过多
+SIM_MAX_STEPS_PER_FRAME = 2000  # 单帧最多执行的模拟步数，超出的时间被丢弃
 
 # 农场设置
 FARM_WIDTH = 16  # 农场宽度（瓦片数）
 FARM_HEIGHT = 12  # 农场高度（瓦片数）
+CROP_FIELD_ENABLED = True  # 用NumPy列式存储向量化计算作物每天的生长（需要numpy，未安装时逐个作物计算）
+
+# 渲染设置
+RENDER_CHUNK_SIZE = 8  # 农场地面渲染区块的边长（瓦片数）
+RENDER_MAX_CACHED_CHUNKS = 64  # 最多缓存的地面区块数量
+TEXT_CACHE_SIZE = 512  # 文字表面缓存的最大条目数
+DEBUG_HUD = False  # 是否默认显示调试信息（按F3切换）
+
+# 帧耗时分析（按F4切换，F5导出样本）
+PROFILER_ENABLED = False
+PROFILER_HISTORY = 3600  # 保留的帧样本数（用于导出）
+PROFILER_WINDOW = 300  # 计算p50/p95/p99时使用的最近帧数
+PROFILER_DUMP_PATH = "profile/frames.csv"  # 导出路径（相对于游戏目录），扩展名为.json时导出JSON
+
+# 纹理图集设置
+# 启动时把assets/images下的PNG按游戏实际绘制的尺寸预先缩放，打包到少量图集表面中
+ATLAS_ENABLED = True
+# 每个图像类别需要的尺寸：整数表示正方形边长，浮点数表示相对原图的缩放倍数
+# 44为物品栏图标尺寸（物品槽64减去20的边距）
+ATLAS_SIZES = {
+    "crops": [TILE_SIZE, 44],
+    "seeds": [44],
+    "tools": [44],
+    "feeds": [44],
+    "items": [44],
+    "animals": [int(TILE_SIZE * 1.5)],
+    "player": [1.5]
+}
+ATLAS_PAGE_SIZE = 1024  # 每张图集的边长（像素）
+ASSET_CACHE_DIR = "cache"  # 磁盘资源缓存目录（相对于游戏目录），None表示不使用磁盘缓存
+
+# 启动时在加载界面中用后台线程预加载图像，避免进入场景后首帧卡顿
+PRELOAD_ENABLED = True
+PRELOAD_WORKERS = 4  # 解码线程数
+PRELOAD_FRAME_BUDGET_MS = 8  # 每帧在主线程转换图像的时间上限（毫秒）
+
+# 游戏中用到的SVG及其输出尺寸，None表示SVG原始尺寸（供 python -m utils.bake_assets 预先栅格化）
+SVG_SIZES = {
+    "decorations/tree.svg": [(TILE_SIZE * 2, TILE_SIZE * 2.5)],
+    "houses/pixel_house.svg": [None],
+    "borders/planting_border.svg": [None],
+    "borders/breeding_border.svg": [None],
+    "borders/housing_border.svg": [None],
+    "borders/general_border.svg": [None]
+}
 
 # 作物设置
 CROP_TYPES = {
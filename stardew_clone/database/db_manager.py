@@ -1,16 +1,33 @@
 import sqlite3
 import os
+import time
 import datetime
 from pathlib import Path
+from database.migrations import migrate
+from utils.profiler import profiler
 
 class DatabaseManager:
     """数据库管理类，负责初始化数据库和提供数据操作方法"""
     
-    def __init__(self, db_path="game.db"):
+    # sqlite3连接的预编译语句缓存大小
+    STATEMENT_CACHE_SIZE = 256
+    
+    # 背包物品数量增减的单语句UPSERT，依赖inventory(player_id, item_name, item_type)唯一索引
+    INVENTORY_UPSERT_SQL = (
+        "INSERT INTO inventory (player_id, item_name, quantity, item_type) VALUES (?, ?, ?, ?) "
+        "ON CONFLICT(player_id, item_name, item_type) DO UPDATE SET quantity = quantity + excluded.quantity "
+        "RETURNING id, quantity"
+    )
+    
+    def __init__(self, db_path="game.db", write_behind=False, flush_interval=None, pragmas=None):
         """初始化数据库连接
         
         Args:
             db_path: 数据库文件路径
+            write_behind: 是否启用延迟写入模式（修改先合并到内存变更集，在flush时一次性提交）
+            flush_interval: 延迟写入模式下的自动提交间隔（秒），None表示只在显式flush时提交
+            pragmas: 连接参数字典，如 {"journal_mode": "WAL", "synchronous": "NORMAL"}，
+                见config.py中的DB_PROFILES
         """
         # 确保数据库目录存在
         db_dir = os.path.dirname(db_path)
@@ -18,10 +35,31 @@ class DatabaseManager:
             os.makedirs(db_dir)
             
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path)
+        self.conn = sqlite3.connect(db_path, cached_statements=self.STATEMENT_CACHE_SIZE)
         self.conn.row_factory = sqlite3.Row  # 使查询结果可以通过列名访问
         self.cursor = self.conn.cursor()
         
+        # 应用连接参数
+        self.pragmas = dict(pragmas or {})
+        self.apply_pragmas(self.pragmas)
+        
+        # UPDATE语句缓存：{(表名, 字段元组): SQL}，字段按名称排序，
+        # 保证相同字段集合总是生成同一条SQL，从而命中sqlite3的预编译语句缓存
+        self._update_sql_cache = {}
+        
+        # 延迟写入（unit of work）状态
+        self.write_behind = write_behind
+        self.flush_interval = flush_interval
+        self._pending_updates = {}  # {(表名, 行ID): {字段: 值}}，同一行的多次修改合并为一次
+        self._uncommitted_rows = 0  # 已执行但尚未提交的行数
+        self._last_flush_time = time.monotonic()
+        self.flush_stats = {
+            "flush_count": 0,       # 提交次数
+            "last_latency_ms": 0.0, # 最近一次提交耗时（毫秒）
+            "last_rows": 0,         # 最近一次提交的行数
+            "total_rows": 0         # 累计提交的行数
+        }
+        
         # 初始化数据库表
         self.init_database()
     
@@ -41,15 +79,6 @@ class DatabaseManager:
         )
         ''')
         
-        # 检查并添加缺少的列
-        self.cursor.execute("PRAGMA table_info(player)")
-        columns = [column[1] for column in self.cursor.fetchall()]
-        
-        # 如果weather列不存在，添加它
-        if 'weather' not in columns:
-            self.cursor.execute("ALTER TABLE player ADD COLUMN weather TEXT DEFAULT '晴天'")
-            self.conn.commit()
-        
         # 创建作物表
         self.cursor.execute('''
         CREATE TABLE IF NOT EXISTS crops (
@@ -134,6 +163,142 @@ class DatabaseManager:
         
         # 提交事务
         self.conn.commit()
+        
+        # 执行结构迁移（新增列、耕地表、索引等，版本记录在PRAGMA user_version中）
+        migrate(self.conn)
+    
+    def apply_pragmas(self, pragmas):
+        """设置连接参数
+        
+        Args:
+            pragmas: {参数名: 值} 字典
+        """
+        for name, value in pragmas.items():
+            # PRAGMA不支持参数绑定，参数来自config.py中的配置
+            self.cursor.execute(f"PRAGMA {name} = {value}")
+            self.cursor.fetchall()
+    
+    def _update_sql(self, table, columns):
+        """获取规范化的单行UPDATE语句
+        
+        Args:
+            table: 表名
+            columns: 已排序的字段名元组
+            
+        Returns:
+            SQL字符串
+        """
+        key = (table, columns)
+        query = self._update_sql_cache.get(key)
+        if query is None:
+            assignments = ", ".join(f"{c} = ?" for c in columns)
+            query = f"UPDATE {table} SET {assignments} WHERE id = ?"
+            self._update_sql_cache[key] = query
+        return query
+    
+    def _commit(self, rows=1):
+        """提交事务；延迟写入模式下只记录行数，等待flush时统一提交
+        
+        Args:
+            rows: 本次写入影响的行数
+        """
+        if self.write_behind:
+            self._uncommitted_rows += rows
+        else:
+            self.conn.commit()
+    
+    def _execute_update(self, table, row_id, fields):
+        """立即执行单行UPDATE语句（不提交）
+        
+        Args:
+            table: 表名
+            row_id: 行ID
+            fields: 要更新的字段和值
+        """
+        columns = tuple(sorted(fields))
+        params = [fields[c] for c in columns]
+        params.append(row_id)
+        self.cursor.execute(self._update_sql(table, columns), params)
+    
+    def _queue_update(self, table, row_id, fields):
+        """按行更新数据；延迟写入模式下合并到内存变更集
+        
+        Args:
+            table: 表名
+            row_id: 行ID
+            fields: 要更新的字段和值
+        """
+        if not fields:
+            return
+        if self.write_behind:
+            self._pending_updates.setdefault((table, row_id), {}).update(fields)
+        else:
+            self._execute_update(table, row_id, fields)
+            self.conn.commit()
+    
+    def _apply_pending(self, table=None):
+        """把内存变更集中的修改写入数据库（不提交）
+        
+        读取某张表之前需要先调用，保证读到的是最新数据。
+        
+        Args:
+            table: 只写入指定表的修改，None表示全部
+        """
+        if not self._pending_updates:
+            return
+        
+        # 按(表名, 字段集合)分组，每组使用一次executemany
+        groups = {}
+        for key in list(self._pending_updates.keys()):
+            if table is not None and key[0] != table:
+                continue
+            fields = self._pending_updates.pop(key)
+            columns = tuple(sorted(fields.keys()))
+            params = [fields[c] for c in columns]
+            params.append(key[1])
+            groups.setdefault((key[0], columns), []).append(params)
+        
+        for (group_table, columns), rows in groups.items():
+            self.cursor.executemany(self._update_sql(group_table, columns), rows)
+            self._uncommitted_rows += len(rows)
+    
+    def _discard_pending(self, table, row_id):
+        """丢弃某一行尚未写入的修改（行被删除时使用）"""
+        self._pending_updates.pop((table, row_id), None)
+    
+    def flush(self):
+        """把所有延迟的修改写入数据库并在一个事务中提交
+        
+        Returns:
+            本次提交的统计信息字典
+        """
+        start = time.perf_counter()
+        with profiler.scope("db.apply_pending"):
+            self._apply_pending()
+        rows = self._uncommitted_rows
+        if rows or self.conn.in_transaction:
+            with profiler.scope("db.commit"):
+                self.conn.commit()
+        self._uncommitted_rows = 0
+        self._last_flush_time = time.monotonic()
+        
+        if rows:
+            self.flush_stats["flush_count"] += 1
+            self.flush_stats["last_latency_ms"] = (time.perf_counter() - start) * 1000
+            self.flush_stats["last_rows"] = rows
+            self.flush_stats["total_rows"] += rows
+        return dict(self.flush_stats)
+    
+    def maybe_flush(self):
+        """到达自动提交间隔时提交延迟的修改，由游戏主循环每帧调用"""
+        if not self.write_behind or self.flush_interval is None:
+            return
+        if time.monotonic() - self._last_flush_time >= self.flush_interval:
+            self.flush()
+    
+    def has_pending_changes(self):
+        """检查是否有尚未提交的修改"""
+        return bool(self._pending_updates) or self._uncommitted_rows > 0
     
     def create_new_player(self, name):
         """创建新玩家
@@ -149,7 +314,6 @@ class DatabaseManager:
             "INSERT INTO player (name, last_login, day, level, exp, money, weather) VALUES (?, ?, ?, ?, ?, ?, ?)",
             (name, now, 1, 1, 0, 1000, "晴天")
         )
-        self.conn.commit()
         
         player_id = self.cursor.lastrowid
         
@@ -171,7 +335,7 @@ class DatabaseManager:
             seeds
         )
         
-        self.conn.commit()
+        self._commit(1 + len(tools) + len(seeds))
         return player_id
     
     def get_player(self, player_id):
@@ -183,6 +347,7 @@ class DatabaseManager:
         Returns:
             玩家信息字典
         """
+        self._apply_pending("player")
         self.cursor.execute("SELECT * FROM player WHERE id = ?", (player_id,))
         player_row = self.cursor.fetchone()
         if player_row is None:
@@ -201,13 +366,7 @@ class DatabaseManager:
             player_id: 玩家ID
             **kwargs: 要更新的字段和值
         """
-        # 构建更新语句
-        fields = [f"{k} = ?" for k in kwargs.keys()]
-        query = f"UPDATE player SET {', '.join(fields)} WHERE id = ?"
-        params = list(kwargs.values())
-        params.append(player_id)
-        self.cursor.execute(query, params)
-        self.conn.commit()
+        self._queue_update("player", player_id, kwargs)
         
     def update_weather(self, player_id, weather):
         """更新天气状态
@@ -216,11 +375,7 @@ class DatabaseManager:
             player_id: 玩家ID
             weather: 天气状态（"晴天"或"雨天"）
         """
-        self.cursor.execute(
-            "UPDATE player SET weather = ? WHERE id = ?",
-            (weather, player_id)
-        )
-        self.conn.commit()
+        self._queue_update("player", player_id, {"weather": weather})
         
     def get_weather(self, player_id):
         """获取当前天气状态
@@ -231,6 +386,7 @@ class DatabaseManager:
         Returns:
             天气状态字符串
         """
+        self._apply_pending("player")
         self.cursor.execute("SELECT weather FROM player WHERE id = ?", (player_id,))
         result = self.cursor.fetchone()
         if result and "weather" in result:
@@ -254,8 +410,9 @@ class DatabaseManager:
             "INSERT INTO crops (player_id, crop_type, x, y, planted_at) VALUES (?, ?, ?, ?, ?)",
             (player_id, crop_type, x, y, now)
         )
-        self.conn.commit()
-        return self.cursor.lastrowid
+        crop_id = self.cursor.lastrowid
+        self._commit()
+        return crop_id
     
     def get_crops(self, player_id):
         """获取玩家的所有作物
@@ -266,7 +423,8 @@ class DatabaseManager:
         Returns:
             作物列表
         """
-        self.cursor.execute("SELECT * FROM crops WHERE player_id = ?", (player_id,))
+        self._apply_pending("crops")
+        self.cursor.execute("SELECT * FROM crops WHERE player_id = ? ORDER BY id", (player_id,))
         return [dict(row) for row in self.cursor.fetchall()]
     
     def update_crop(self, crop_id, **kwargs):
@@ -276,14 +434,42 @@ class DatabaseManager:
             crop_id: 作物ID
             **kwargs: 要更新的字段和值
         """
-        fields = [f"{k} = ?" for k in kwargs.keys()]
-        query = f"UPDATE crops SET {', '.join(fields)} WHERE id = ?"
+        self._queue_update("crops", crop_id, kwargs)
+    
+    def update_crops_growth(self, rows):
+        """批量更新作物的生长阶段和浇水状态（一次executemany）
         
-        params = list(kwargs.values())
-        params.append(crop_id)
+        Args:
+            rows: [(生长阶段, 是否浇水, 作物ID), ...]
+            
+        Returns:
+            更新的行数
+        """
+        # 先写入内存中尚未落库的作物修改，避免之后用旧值覆盖本次更新
+        self._apply_pending("crops")
+        rows = list(rows)
+        self.cursor.executemany("UPDATE crops SET growth_stage = ?, is_watered = ? WHERE id = ?", rows)
+        self._commit(len(rows))
+        return len(rows)
+    
+    def water_all_crops(self, player_id):
+        """把玩家所有未浇水的作物标记为已浇水（单条批量UPDATE）
         
-        self.cursor.execute(query, params)
-        self.conn.commit()
+        Args:
+            player_id: 玩家ID
+            
+        Returns:
+            本次被浇水的作物数量
+        """
+        # 先写入内存中尚未落库的作物修改，避免之后覆盖本次浇水状态
+        self._apply_pending("crops")
+        self.cursor.execute(
+            "UPDATE crops SET is_watered = 1 WHERE player_id = ? AND is_watered = 0",
+            (player_id,)
+        )
+        watered = self.cursor.rowcount
+        self._commit(watered)
+        return watered
     
     def delete_crop(self, crop_id):
         """删除作物
@@ -291,8 +477,9 @@ class DatabaseManager:
         Args:
             crop_id: 作物ID
         """
+        self._discard_pending("crops", crop_id)
         self.cursor.execute("DELETE FROM crops WHERE id = ?", (crop_id,))
-        self.conn.commit()
+        self._commit()
     
     def add_animal(self, player_id, animal_type, name):
         """添加动物
@@ -310,8 +497,9 @@ class DatabaseManager:
             "INSERT INTO animals (player_id, animal_type, name, produce_time) VALUES (?, ?, ?, ?)",
             (player_id, animal_type, name, now)
         )
-        self.conn.commit()
-        return self.cursor.lastrowid
+        animal_id = self.cursor.lastrowid
+        self._commit()
+        return animal_id
     
     def get_animals(self, player_id):
         """获取玩家的所有动物
@@ -322,6 +510,7 @@ class DatabaseManager:
         Returns:
             动物列表
         """
+        self._apply_pending("animals")
         self.cursor.execute("SELECT * FROM animals WHERE player_id = ?", (player_id,))
         return [dict(row) for row in self.cursor.fetchall()]
         
@@ -334,6 +523,7 @@ class DatabaseManager:
         Returns:
             区域列表
         """
+        self._apply_pending("areas")
         self.cursor.execute("SELECT * FROM areas WHERE player_id = ?", (player_id,))
         return [dict(row) for row in self.cursor.fetchall()]
     
@@ -355,8 +545,9 @@ class DatabaseManager:
             "INSERT INTO areas (player_id, area_type, x, y, width, height) VALUES (?, ?, ?, ?, ?, ?)",
             (player_id, area_type, x, y, width, height)
         )
-        self.conn.commit()
-        return self.cursor.lastrowid
+        area_id = self.cursor.lastrowid
+        self._commit()
+        return area_id
     
     def update_area(self, area_id, **kwargs):
         """更新区域信息
@@ -365,13 +556,7 @@ class DatabaseManager:
             area_id: 区域ID
             **kwargs: 要更新的字段和值
         """
-        # 构建更新语句
-        fields = [f"{k} = ?" for k in kwargs.keys()]
-        query = f"UPDATE areas SET {', '.join(fields)} WHERE id = ?"
-        params = list(kwargs.values())
-        params.append(area_id)
-        self.cursor.execute(query, params)
-        self.conn.commit()
+        self._queue_update("areas", area_id, kwargs)
     
     def update_animal(self, animal_id, **kwargs):
         """更新动物信息
@@ -380,14 +565,7 @@ class DatabaseManager:
             animal_id: 动物ID
             **kwargs: 要更新的字段和值
         """
-        fields = [f"{k} = ?" for k in kwargs.keys()]
-        query = f"UPDATE animals SET {', '.join(fields)} WHERE id = ?"
-        
-        params = list(kwargs.values())
-        params.append(animal_id)
-        
-        self.cursor.execute(query, params)
-        self.conn.commit()
+        self._queue_update("animals", animal_id, kwargs)
     
     def add_inventory_item(self, player_id, item_name, quantity, item_type):
         """添加物品到背包
@@ -401,30 +579,45 @@ class DatabaseManager:
         Returns:
             物品ID
         """
-        # 检查是否已有该物品
-        self.cursor.execute(
-            "SELECT id, quantity FROM inventory WHERE player_id = ? AND item_name = ? AND item_type = ?",
-            (player_id, item_name, item_type)
-        )
-        existing = self.cursor.fetchone()
+        row = self.apply_inventory_changes(player_id, [(item_name, item_type, quantity)])[(item_name, item_type)]
+        return row["id"]
+    
+    def apply_inventory_changes(self, player_id, changes):
+        """批量增减背包物品数量，在一个事务中完成
         
-        if existing:
-            # 更新现有物品数量
-            new_quantity = existing['quantity'] + quantity
-            self.cursor.execute(
-                "UPDATE inventory SET quantity = ? WHERE id = ?",
-                (new_quantity, existing['id'])
-            )
-            self.conn.commit()
-            return existing['id']
-        else:
-            # 添加新物品
-            self.cursor.execute(
-                "INSERT INTO inventory (player_id, item_name, quantity, item_type) VALUES (?, ?, ?, ?)",
-                (player_id, item_name, quantity, item_type)
-            )
-            self.conn.commit()
-            return self.cursor.lastrowid
+        同一物品的多次变化先合并，每种物品执行一条UPSERT，
+        最后用一条DELETE清除数量不大于0的物品。
+        
+        Args:
+            player_id: 玩家ID
+            changes: [(物品名称, 物品类型, 数量变化), ...]，数量变化为负数表示移除
+            
+        Returns:
+            {(物品名称, 物品类型): {"id": 物品ID, "quantity": 新数量}}，新数量不大于0表示物品已被删除
+        """
+        # 合并同一物品的数量变化
+        deltas = {}
+        for item_name, item_type, delta in changes:
+            key = (item_name, item_type)
+            deltas[key] = deltas.get(key, 0) + delta
+        
+        # 先写入内存中尚未落库的背包修改，保证增量基于最新数量
+        self._apply_pending("inventory")
+        
+        results = {}
+        for (item_name, item_type), delta in deltas.items():
+            self.cursor.execute(self.INVENTORY_UPSERT_SQL, (player_id, item_name, delta, item_type))
+            row = self.cursor.fetchone()
+            results[(item_name, item_type)] = {"id": row["id"], "quantity": row["quantity"]}
+        
+        removed = [row["id"] for row in results.values() if row["quantity"] <= 0]
+        if removed:
+            for item_id in removed:
+                self._discard_pending("inventory", item_id)
+            self.cursor.execute("DELETE FROM inventory WHERE player_id = ? AND quantity <= 0", (player_id,))
+        
+        self._commit(len(results) + len(removed))
+        return results
     
     def get_inventory(self, player_id):
         """获取玩家背包
@@ -435,7 +628,8 @@ class DatabaseManager:
         Returns:
             背包物品列表
         """
-        self.cursor.execute("SELECT * FROM inventory WHERE player_id = ?", (player_id,))
+        self._apply_pending("inventory")
+        self.cursor.execute("SELECT * FROM inventory WHERE player_id = ? ORDER BY id", (player_id,))
         return [dict(row) for row in self.cursor.fetchall()]
     
     def update_inventory_item(self, item_id, quantity):
@@ -447,14 +641,12 @@ class DatabaseManager:
         """
         if quantity <= 0:
             # 数量为0则删除物品
+            self._discard_pending("inventory", item_id)
             self.cursor.execute("DELETE FROM inventory WHERE id = ?", (item_id,))
+            self._commit()
         else:
             # 更新数量
-            self.cursor.execute(
-                "UPDATE inventory SET quantity = ? WHERE id = ?",
-                (quantity, item_id)
-            )
-        self.conn.commit()
+            self._queue_update("inventory", item_id, {"quantity": quantity})
     
     def get_tools(self, player_id):
         """获取玩家工具
@@ -465,6 +657,7 @@ class DatabaseManager:
         Returns:
             工具列表
         """
+        self._apply_pending("tools")
         self.cursor.execute("SELECT * FROM tools WHERE player_id = ?", (player_id,))
         return [dict(row) for row in self.cursor.fetchall()]
     
@@ -475,14 +668,7 @@ class DatabaseManager:
             tool_id: 工具ID
             **kwargs: 要更新的字段和值
         """
-        fields = [f"{k} = ?" for k in kwargs.keys()]
-        query = f"UPDATE tools SET {', '.join(fields)} WHERE id = ?"
-        
-        params = list(kwargs.values())
-        params.append(tool_id)
-        
-        self.cursor.execute(query, params)
-        self.conn.commit()
+        self._queue_update("tools", tool_id, kwargs)
     
     def add_sale(self, player_id, item_name, quantity, price_total):
         """添加销售记录
@@ -501,8 +687,9 @@ class DatabaseManager:
             "INSERT INTO sales_log (player_id, item_name, quantity, price_total, sold_at) VALUES (?, ?, ?, ?, ?)",
             (player_id, item_name, quantity, price_total, now)
         )
-        self.conn.commit()
-        return self.cursor.lastrowid
+        sale_id = self.cursor.lastrowid
+        self._commit()
+        return sale_id
     
     def get_sales_history(self, player_id, limit=10):
         """获取销售历史
@@ -521,9 +708,11 @@ class DatabaseManager:
         return [dict(row) for row in self.cursor.fetchall()]
     
     def close(self):
-        """关闭数据库连接"""
+        """关闭数据库连接，关闭前提交所有延迟的修改"""
         if self.conn:
+            self.flush()
             self.conn.close()
+            self.conn = None
             
     def __del__(self):
         """析构函数，确保数据库连接被关闭"""
@@ -535,16 +724,6 @@ class DatabaseManager:
             player_id: 玩家ID
             tilled_list: [{"x": int, "y": int, "watered": bool}]
         """
-        # 创建表（如未创建）
-        self.cursor.execute('''
-        CREATE TABLE IF NOT EXISTS tilled_land (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            player_id INTEGER,
-            x INTEGER,
-            y INTEGER,
-            watered INTEGER DEFAULT 0,
-            UNIQUE(player_id, x, y)
-        )''')
         # 先删除该玩家所有耕地记录
         self.cursor.execute("DELETE FROM tilled_land WHERE player_id = ?", (player_id,))
         # 插入新的耕地数据
@@ -553,7 +732,7 @@ class DatabaseManager:
                 "INSERT INTO tilled_land (player_id, x, y, watered) VALUES (?, ?, ?, ?)",
                 (player_id, info["x"], info["y"], int(info.get("watered", False)))
             )
-        self.conn.commit()
+        self._commit(len(tilled_list) + 1)
 
     def get_tilled_land(self, player_id):
         """获取玩家所有耕地信息
@@ -562,15 +741,6 @@ class DatabaseManager:
         Returns:
             [{"x": int, "y": int, "watered": bool}, ...]
         """
-        self.cursor.execute('''
-        CREATE TABLE IF NOT EXISTS tilled_land (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            player_id INTEGER,
-            x INTEGER,
-            y INTEGER,
-            watered INTEGER DEFAULT 0,
-            UNIQUE(player_id, x, y)
-        )''')
         self.cursor.execute("SELECT x, y, watered FROM tilled_land WHERE player_id = ?", (player_id,))
         rows = self.cursor.fetchall()
         return [{"x": row["x"], "y": row["y"], "watered": bool(row["watered"])} for row in rows]
@@ -581,10 +751,11 @@ class DatabaseManager:
             player_id: 玩家ID
         """
         # 删除玩家相关数据
+        self._apply_pending()
         self.cursor.execute("DELETE FROM player WHERE id = ?", (player_id,))
         self.cursor.execute("DELETE FROM crops WHERE player_id = ?", (player_id,))
         self.cursor.execute("DELETE FROM animals WHERE player_id = ?", (player_id,))
         self.cursor.execute("DELETE FROM inventory WHERE player_id = ?", (player_id,))
         self.cursor.execute("DELETE FROM tools WHERE player_id = ?", (player_id,))
         self.cursor.execute("DELETE FROM sales_log WHERE player_id = ?", (player_id,))
-        self.conn.commit()
\ No newline at end of file
+        self._commit(6)
\ No newline at end of file
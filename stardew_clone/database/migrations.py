@@ -0,0 +1,120 @@
+"""数据库结构迁移
+
+数据库当前的结构版本保存在 PRAGMA user_version 中。每个迁移对应一个版本号，
+DatabaseManager 初始化时会按顺序执行所有比当前版本新的迁移，每个迁移在
+单独的事务中执行并同时更新 user_version，中途失败会整体回滚。
+
+新增迁移时只需在 MIGRATIONS 末尾追加 (版本号, 说明, 迁移函数)，不要修改已发布的迁移。
+"""
+
+
+def _add_player_weather(cursor):
+    """为旧存档的player表添加weather列"""
+    cursor.execute("PRAGMA table_info(player)")
+    columns = [column[1] for column in cursor.fetchall()]
+    if 'weather' not in columns:
+        cursor.execute("ALTER TABLE player ADD COLUMN weather TEXT DEFAULT '晴天'")
+
+
+def _create_tilled_land(cursor):
+    """创建耕地表"""
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS tilled_land (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        player_id INTEGER,
+        x INTEGER,
+        y INTEGER,
+        watered INTEGER DEFAULT 0,
+        UNIQUE(player_id, x, y)
+    )''')
+
+
+def _add_player_indexes(cursor):
+    """为按玩家查询的表添加索引"""
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_crops_player_pos ON crops (player_id, x, y)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_animals_player ON animals (player_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_tools_player ON tools (player_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_areas_player ON areas (player_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_sales_log_player_sold_at ON sales_log (player_id, sold_at)")
+
+
+def _add_inventory_unique(cursor):
+    """背包中每个玩家的同名同类物品只保留一行，并添加唯一索引以支持单语句UPSERT"""
+    # 合并历史上重复的物品行：数量累加到ID最小的一行
+    cursor.execute('''
+    UPDATE inventory
+    SET quantity = (
+        SELECT SUM(dup.quantity) FROM inventory AS dup
+        WHERE dup.player_id IS inventory.player_id
+          AND dup.item_name = inventory.item_name
+          AND dup.item_type = inventory.item_type
+    )
+    WHERE id IN (
+        SELECT MIN(id) FROM inventory
+        GROUP BY player_id, item_name, item_type
+        HAVING COUNT(*) > 1
+    )''')
+    cursor.execute('''
+    DELETE FROM inventory
+    WHERE id NOT IN (
+        SELECT MIN(id) FROM inventory
+        GROUP BY player_id, item_name, item_type
+    )''')
+    cursor.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_inventory_player_item "
+        "ON inventory (player_id, item_name, item_type)"
+    )
+
+
+# (版本号, 说明, 迁移函数)
+MIGRATIONS = [
+    (1, "player表添加weather列", _add_player_weather),
+    (2, "创建耕地表", _create_tilled_land),
+    (3, "按玩家查询的索引", _add_player_indexes),
+    (4, "背包物品唯一约束", _add_inventory_unique),
+]
+
+# 最新的数据库结构版本
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn):
+    """读取数据库当前的结构版本
+
+    Args:
+        conn: sqlite3连接
+
+    Returns:
+        PRAGMA user_version 的值
+    """
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn):
+    """执行所有尚未应用的迁移
+
+    Args:
+        conn: sqlite3连接
+
+    Returns:
+        迁移后的结构版本
+    """
+    current = get_schema_version(conn)
+    for version, description, apply in MIGRATIONS:
+        if version <= current:
+            continue
+        if conn.in_transaction:
+            conn.commit()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("BEGIN")
+            apply(cursor)
+            # PRAGMA不支持参数绑定，version来自上面的常量表
+            cursor.execute(f"PRAGMA user_version = {int(version)}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            print(f"数据库迁移失败（版本 {version}：{description}）")
+            raise
+        current = version
+    return current
@@ -5,6 +5,12 @@ from config import ANIMAL_TYPES
 class Animal:
     """动物类，管理动物的状态和产出"""
     
+    # 所有动物共享的边框图像：{(尺寸, 颜色, 线宽): 表面}
+    _border_cache = {}
+    
+    # 没有图像管理器时使用的占位符图像：{(动物类型, 尺寸): 表面}
+    _placeholder_cache = {}
+    
     def __init__(self, db_manager, animal_id=None, player_id=None, animal_type=None, name=None, load_from_db=True, game=None):
         """初始化动物
         
@@ -43,6 +49,36 @@ class Animal:
             # 创建新动物
             self.create_new_animal(player_id, animal_type, name)
     
+    @classmethod
+    def from_row(cls, db_manager, row, game=None):
+        """用已查询出的数据库行构建动物，不再额外查询数据库
+        
+        Args:
+            db_manager: 数据库管理器实例
+            row: animals表的一行（sqlite3.Row或字典）
+            game: 游戏实例，用于获取图像管理器
+            
+        Returns:
+            Animal实例
+        """
+        animal = cls(db_manager, load_from_db=False, game=game)
+        animal._apply_row(row)
+        return animal
+    
+    @classmethod
+    def load_for_player(cls, db_manager, player_id, game=None):
+        """用一次查询加载玩家的所有动物
+        
+        Args:
+            db_manager: 数据库管理器实例
+            player_id: 玩家ID
+            game: 游戏实例，用于获取图像管理器
+            
+        Returns:
+            Animal实例列表
+        """
+        return [cls.from_row(db_manager, row, game=game) for row in db_manager.get_animals(player_id)]
+    
     def create_new_animal(self, player_id, animal_type, name):
         """创建新动物
         
@@ -78,23 +114,31 @@ class Animal:
         animal_data = self.db.cursor.fetchone()
         
         if animal_data:
-            self.id = animal_data["id"]
-            self.player_id = animal_data["player_id"]
-            self.animal_type = animal_data["animal_type"]
-            self.name = animal_data["name"]
-            self.age = animal_data["age"]
-            self.is_fed = bool(animal_data["is_fed"])
-            # 使用字典索引访问，如果字段不存在则使用默认值0
-            self.x = animal_data["x"] if "x" in animal_data.keys() else 0
-            self.y = animal_data["y"] if "y" in animal_data.keys() else 0
-            
-            # 解析产出时间
-            if animal_data["produce_time"]:
-                self.produce_time = datetime.datetime.fromisoformat(animal_data["produce_time"])
-            
-            # 加载动物配置
-            if self.animal_type in ANIMAL_TYPES:
-                self.config = ANIMAL_TYPES[self.animal_type]
+            self._apply_row(animal_data)
+    
+    def _apply_row(self, animal_data):
+        """用数据库行填充动物属性
+        
+        Args:
+            animal_data: animals表的一行（sqlite3.Row或字典）
+        """
+        self.id = animal_data["id"]
+        self.player_id = animal_data["player_id"]
+        self.animal_type = animal_data["animal_type"]
+        self.name = animal_data["name"]
+        self.age = animal_data["age"]
+        self.is_fed = bool(animal_data["is_fed"])
+        # 使用字典索引访问，如果字段不存在则使用默认值0
+        self.x = animal_data["x"] if "x" in animal_data.keys() else 0
+        self.y = animal_data["y"] if "y" in animal_data.keys() else 0
+        
+        # 解析产出时间
+        if animal_data["produce_time"]:
+            self.produce_time = datetime.datetime.fromisoformat(animal_data["produce_time"])
+        
+        # 加载动物配置
+        if self.animal_type in ANIMAL_TYPES:
+            self.config = ANIMAL_TYPES[self.animal_type]
     
     def save(self):
         """保存动物数据到数据库"""
@@ -232,7 +276,79 @@ class Animal:
             if pygame.time.get_ticks() % 1000 < 500:  # 每秒闪烁一次
                 pygame.draw.rect(screen, (255, 215, 0), animal_rect, 3)  # 3像素宽的金色边框
                 
-    def move(self, dx, dy, farm_grid, areas=None):
+    def submit(self, render_queue, x, y, size, layer):
+        """把动物的绘制命令提交到渲染队列
+        
+        与render的绘制内容相同，喂食和可产出的边框使用缓存的边框图像。
+        
+        Args:
+            render_queue: 渲染队列
+            x: X坐标
+            y: Y坐标
+            size: 大小
+            layer: 图层
+        """
+        size = int(size)
+        render_queue.submit(self.get_image(size), x, y, layer)
+        
+        # 如果已喂食，绘制绿色边框
+        if self.is_fed:
+            render_queue.submit(Animal.get_border(size, (0, 255, 0), 2), x, y, layer)
+        
+        # 如果可以产出，绘制闪烁效果
+        if self.can_produce() and pygame.time.get_ticks() % 1000 < 500:
+            render_queue.submit(Animal.get_border(size, (255, 215, 0), 3), x, y, layer)
+    
+    def get_image(self, size):
+        """获取缩放后的动物图像
+        
+        Args:
+            size: 大小
+            
+        Returns:
+            动物图像
+        """
+        if self.game and hasattr(self.game, 'image_manager'):
+            return self.game.image_manager.load_scaled_image('animals', self.animal_type, (size, size))
+        
+        key = (self.animal_type, size)
+        placeholder = Animal._placeholder_cache.get(key)
+        if placeholder is None:
+            # 根据动物类型选择颜色
+            if self.animal_type == "牛":
+                color = (200, 200, 200)  # 灰白色
+            elif self.animal_type == "羊":
+                color = (255, 255, 255)  # 白色
+            elif self.animal_type == "鸡":
+                color = (255, 255, 0)    # 黄色
+            else:
+                color = (150, 75, 0)     # 棕色
+            placeholder = pygame.Surface((size, size))
+            placeholder.fill(color)
+            Animal._placeholder_cache[key] = placeholder
+        return placeholder
+    
+    @classmethod
+    def get_border(cls, size, color, width):
+        """获取透明背景的矩形边框图像
+        
+        Args:
+            size: 边长
+            color: 边框颜色
+            width: 边框线宽
+            
+        Returns:
+            边框图像
+        """
+        key = (size, color, width)
+        border = cls._border_cache.get(key)
+        if border is None:
+            border = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.rect(border, color, border.get_rect(), width)
+            cls._border_cache[key] = border
+        return border
+    
+    def move(self, dx, dy, farm_grid, areas=None, zones=None):
         """移动动物
         
         Args:
@@ -240,6 +356,7 @@ class Animal:
             dy: Y方向移动量
             farm_grid: 农场网格，用于碰撞检测
             areas: 区域列表，用于检查区域限制
+            zones: 区域索引（ZoneMap），提供时代替逐个区域检查
             
         Returns:
             是否成功移动
@@ -256,7 +373,10 @@ class Animal:
             # 检查目标位置是否有障碍物
             if farm_grid[tile_y][tile_x] is None or farm_grid[tile_y][tile_x].get("type") != "crop":
                 # 检查是否在饲养区内
-                if areas:
+                if zones is not None:
+                    if not zones.contains(tile_x, tile_y, "breeding"):
+                        return False  # 不在饲养区内，不允许移动
+                elif areas:
                     in_breeding_area = False
                     for area in areas:
                         if hasattr(area, 'area_type') and area.area_type == 'breeding' and area.contains_point(tile_x, tile_y):
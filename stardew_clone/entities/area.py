@@ -1,5 +1,4 @@
 import pygame
-import os
 from config import TILE_SIZE
 
 class Area:
@@ -11,6 +10,42 @@ class Area:
     HOUSING = "housing"    # 住宅区
     GENERAL = "general"    # 通用区域
     
+    # 区域边界颜色
+    BORDER_COLORS = {
+        PLANTING: (0, 200, 0),      # 绿色
+        BREEDING: (200, 150, 0),    # 棕色
+        HOUSING: (0, 100, 200),     # 蓝色
+        GENERAL: (150, 150, 150)    # 灰色
+    }
+    
+    # 边框图片（相对于images目录）
+    BORDER_FILES = {
+        PLANTING: "borders/planting_border.svg",
+        BREEDING: "borders/breeding_border.svg",
+        HOUSING: "borders/housing_border.svg",
+        GENERAL: "borders/general_border.svg"
+    }
+    
+    # 区域特定图像
+    AREA_IMAGE_FILES = {
+        HOUSING: "houses/pixel_house.svg",  # 默认房屋样式
+        # 其他区域类型的特定图像可以在这里添加
+    }
+    
+    # 区域类型标识
+    AREA_LABELS = {
+        PLANTING: "种植区",
+        BREEDING: "饲养区",
+        HOUSING: "住宅区",
+        GENERAL: "通用区"
+    }
+    
+    # 所有区域共享的外观缓存：{(区域类型, 宽度, 高度): (合成表面, 偏移)}
+    _composite_cache = {}
+    
+    # 包含该区域的区域索引（ZoneMap），调整大小后需要重建
+    zone_map = None
+    
     def __init__(self, x, y, width, height, area_type, db_manager=None, area_id=None, player_id=None, game=None):
         """初始化区域
         
@@ -36,20 +71,7 @@ class Area:
         self.player_id = player_id
         
         # 区域边界颜色
-        self.border_colors = {
-            self.PLANTING: (0, 200, 0),      # 绿色
-            self.BREEDING: (200, 150, 0),    # 棕色
-            self.HOUSING: (0, 100, 200),     # 蓝色
-            self.GENERAL: (150, 150, 150)    # 灰色
-        }
-        
-        # 加载边框图片
-        self.border_images = {}
-        self._load_border_images()
-        
-        # 加载区域特定图像
-        self.area_images = {}
-        self._load_area_images()
+        self.border_colors = self.BORDER_COLORS
         
         if area_id:
             # 从数据库加载区域
@@ -111,161 +133,129 @@ class Area:
         return (self.x <= x < self.x + self.width and 
                 self.y <= y < self.y + self.height)
     
-    def _load_border_images(self):
-        """加载区域边框图片"""
-        border_types = {
-            self.PLANTING: "planting_border.svg",
-            self.BREEDING: "breeding_border.svg",
-            self.HOUSING: "housing_border.svg",
-            self.GENERAL: "general_border.svg"
-        }
+    def resize(self, width, height):
+        """调整区域大小并保存到数据库
         
-        # 尝试加载对应类型的边框图片
-        border_file = border_types.get(self.area_type)
-        if border_file:
-            border_path = os.path.join("assets", "images", "borders", border_file)
-            try:
-                if os.path.exists(border_path):
-                    self.border_images[self.area_type] = pygame.image.load(border_path).convert_alpha()
-            except Exception as e:
-                print(f"无法加载边框图片 {border_path}: {e}")
+        Args:
+            width: 新的宽度（瓦片数）
+            height: 新的高度（瓦片数）
+        """
+        self.width = width
+        self.height = height
+        self.save()
+        if self.zone_map is not None:
+            self.zone_map.rebuild()
     
-    def _load_area_images(self):
-        """加载区域特定图像，如住宅区的房屋图像"""
-        # 区域特定图像映射
-        area_image_types = {
-            self.HOUSING: "pixel_house.svg",  # 默认房屋样式
-            # 其他区域类型的特定图像可以在这里添加
-        }
+    @staticmethod
+    def _load_svg(path):
+        """通过图像管理器加载SVG图像（使用其磁盘栅格化缓存）
         
-        # 尝试加载对应类型的区域图片
-        area_file = area_image_types.get(self.area_type)
-        if area_file:
-            area_path = os.path.join("assets", "images", "houses", area_file)
-            try:
-                if os.path.exists(area_path):
-                    self.area_images[self.area_type] = pygame.image.load(area_path).convert_alpha()
-            except Exception as e:
-                print(f"无法加载区域图片 {area_path}: {e}")
-
+        Args:
+            path: SVG文件路径（相对于images目录）
+            
+        Returns:
+            图像对象，加载失败时返回None
+        """
+        from utils.image_manager import image_manager
+        if image_manager is None:
+            return None
+        return image_manager.load_svg(path, placeholder=False)
     
-    def render(self, screen, camera_offset=(0, 0)):
-        """渲染区域边界
+    def get_composite(self):
+        """获取区域外观（填充、边框、区域图像和标签）的合成表面
+        
+        合成结果按(区域类型, 宽度, 高度)缓存并在所有区域实例之间共享，区域大小改变时自然使用新的缓存项。
+        
+        Returns:
+            (合成表面, 表面左上角相对区域左上角的像素偏移)
+        """
+        key = (self.area_type, self.width, self.height)
+        composite = Area._composite_cache.get(key)
+        if composite is None:
+            composite = Area._build_composite(*key)
+            Area._composite_cache[key] = composite
+        return composite
+    
+    @classmethod
+    def _build_composite(cls, area_type, width, height):
+        """绘制区域外观的合成表面
         
         Args:
-            screen: pygame屏幕对象
-            camera_offset: 相机偏移量
+            area_type: 区域类型
+            width: 区域宽度（瓦片数）
+            height: 区域高度（瓦片数）
+            
+        Returns:
+            (合成表面, 表面左上角相对区域左上角的像素偏移)
         """
         # 获取区域边界颜色
-        border_color = self.border_colors.get(self.area_type, (150, 150, 150))
+        border_color = cls.BORDER_COLORS.get(area_type, (150, 150, 150))
+        width_px = width * TILE_SIZE
+        height_px = height * TILE_SIZE
+        
+        # 区域特定图像（如住宅区的房屋）居中显示，可能超出区域范围
+        area_img = None
+        area_file = cls.AREA_IMAGE_FILES.get(area_type)
+        if area_file:
+            area_img = cls._load_svg(area_file)
+        bounds = pygame.Rect(0, 0, width_px, height_px)
+        if area_img:
+            img_width, img_height = area_img.get_size()
+            img_rect = pygame.Rect((width_px - img_width) // 2, (height_px - img_height) // 2, img_width, img_height)
+            bounds = bounds.union(img_rect)
         
-        # 计算屏幕坐标
-        screen_x = self.x * TILE_SIZE - camera_offset[0]
-        screen_y = self.y * TILE_SIZE - camera_offset[1]
-        width_px = self.width * TILE_SIZE
-        height_px = self.height * TILE_SIZE
+        # 合成表面的坐标原点为bounds左上角
+        surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        x0 = -bounds.x
+        y0 = -bounds.y
         
         # 住宅区不绘制半透明填充和边框
-        if self.area_type != self.HOUSING:
+        if area_type != cls.HOUSING:
             # 绘制半透明填充
-            s = pygame.Surface((width_px, height_px), pygame.SRCALPHA)
-            s.fill((border_color[0], border_color[1], border_color[2], 50))  # 增加透明度填充
-            screen.blit(s, (screen_x, screen_y))
-        
-        # 检查是否有边框图片
-        if self.area_type != self.HOUSING and self.area_type in self.border_images and self.border_images[self.area_type]:
-            # 使用边框图片
-            border_img = self.border_images[self.area_type]
-            
-            # 绘制四个角落
-            corner_size = 32  # 角落大小
-            
-            # 缩放图片以适应角落大小
-            scaled_img = pygame.transform.scale(border_img, (corner_size, corner_size))
-            
-            # 左上角
-            screen.blit(scaled_img, (screen_x, screen_y))
-            
-            # 右上角 (水平翻转)
-            flipped_h = pygame.transform.flip(scaled_img, True, False)
-            screen.blit(flipped_h, (screen_x + width_px - corner_size, screen_y))
-            
-            # 左下角 (垂直翻转)
-            flipped_v = pygame.transform.flip(scaled_img, False, True)
-            screen.blit(flipped_v, (screen_x, screen_y + height_px - corner_size))
-            
-            # 右下角 (水平和垂直翻转)
-            flipped_hv = pygame.transform.flip(scaled_img, True, True)
-            screen.blit(flipped_hv, (screen_x + width_px - corner_size, screen_y + height_px - corner_size))
-            
-            # 绘制边框线
-            # 上边框
-            for x in range(corner_size, width_px - corner_size, corner_size):
-                screen.blit(pygame.transform.scale(border_img, (corner_size, 8)), 
-                           (screen_x + x, screen_y))
-            
-            # 下边框
-            for x in range(corner_size, width_px - corner_size, corner_size):
-                screen.blit(pygame.transform.scale(pygame.transform.flip(border_img, False, True), 
-                                                 (corner_size, 8)), 
-                           (screen_x + x, screen_y + height_px - 8))
-            
-            # 左边框
-            for y in range(corner_size, height_px - corner_size, corner_size):
-                screen.blit(pygame.transform.scale(border_img, (8, corner_size)), 
-                           (screen_x, screen_y + y))
-            
-            # 右边框
-            for y in range(corner_size, height_px - corner_size, corner_size):
-                screen.blit(pygame.transform.scale(pygame.transform.flip(border_img, True, False), 
-                                                 (8, corner_size)), 
-                           (screen_x + width_px - 8, screen_y + y))
-        elif self.area_type != self.HOUSING:
-            # 使用默认矩形边框（非住宅区）
-            # 绘制边界
-            pygame.draw.rect(
-                screen, 
-                border_color, 
-                (screen_x, screen_y, width_px, height_px), 
-                4  # 边框宽度
-            )
-            
-            # 绘制内边框，增强视觉效果
-            pygame.draw.rect(
-                screen, 
-                (255, 255, 255), 
-                (screen_x + 2, screen_y + 2, width_px - 4, height_px - 4), 
-                1  # 内边框宽度
-            )
-        
-        # 绘制区域特定图像（如住宅区的房屋）
-        if self.area_type in self.area_images and self.area_images[self.area_type]:
-            area_img = self.area_images[self.area_type]
-            
-            # 计算图像位置（居中显示）
-            img_width, img_height = area_img.get_rect().size
-            img_x = screen_x + (width_px - img_width) // 2
-            img_y = screen_y + (height_px - img_height) // 2
+            surface.fill((border_color[0], border_color[1], border_color[2], 50), (x0, y0, width_px, height_px))
             
-            # 绘制区域图像
-            screen.blit(area_img, (img_x, img_y))
+            border_file = cls.BORDER_FILES.get(area_type)
+            border_img = cls._load_svg(border_file) if border_file else None
+            if border_img:
+                # 使用边框图片
+                corner_size = 32  # 角落大小
+                
+                # 缩放图片以适应角落大小
+                scaled_img = pygame.transform.scale(border_img, (corner_size, corner_size))
+                
+                # 四个角落（左上、右上水平翻转、左下垂直翻转、右下水平和垂直翻转）
+                surface.blit(scaled_img, (x0, y0))
+                surface.blit(pygame.transform.flip(scaled_img, True, False), (x0 + width_px - corner_size, y0))
+                surface.blit(pygame.transform.flip(scaled_img, False, True), (x0, y0 + height_px - corner_size))
+                surface.blit(pygame.transform.flip(scaled_img, True, True), (x0 + width_px - corner_size, y0 + height_px - corner_size))
+                
+                # 绘制边框线，每条边的图块只缩放一次
+                top = pygame.transform.scale(border_img, (corner_size, 8))
+                bottom = pygame.transform.scale(pygame.transform.flip(border_img, False, True), (corner_size, 8))
+                left = pygame.transform.scale(border_img, (8, corner_size))
+                right = pygame.transform.scale(pygame.transform.flip(border_img, True, False), (8, corner_size))
+                for x in range(corner_size, width_px - corner_size, corner_size):
+                    surface.blit(top, (x0 + x, y0))
+                    surface.blit(bottom, (x0 + x, y0 + height_px - 8))
+                for y in range(corner_size, height_px - corner_size, corner_size):
+                    surface.blit(left, (x0, y0 + y))
+                    surface.blit(right, (x0 + width_px - 8, y0 + y))
+            else:
+                # 使用默认矩形边框
+                pygame.draw.rect(surface, border_color, (x0, y0, width_px, height_px), 4)
+                # 绘制内边框，增强视觉效果
+                pygame.draw.rect(surface, (255, 255, 255), (x0 + 2, y0 + 2, width_px - 4, height_px - 4), 1)
         
-        # 绘制区域类型标识
-        area_labels = {
-            self.PLANTING: "种植区",
-            self.BREEDING: "饲养区",
-            self.HOUSING: "住宅区",
-            self.GENERAL: "通用区"
-        }
-        
-        # 使用全局字体管理器获取字体，参考main_menu.py的方式
-        from utils.font_manager import font_manager
-        font = font_manager.get_font(24)  # 增大字体
-        
-        label = area_labels.get(self.area_type, "未知区域")
+        # 绘制区域图像
+        if area_img:
+            surface.blit(area_img, (x0 + img_rect.x, y0 + img_rect.y))
         
         # 只为非住宅区绘制标签
-        if self.area_type != self.HOUSING:
+        if area_type != cls.HOUSING:
+            from utils.font_manager import font_manager
+            font = font_manager.get_font(24)
+            label = cls.AREA_LABELS.get(area_type, "未知区域")
+            
             # 创建文本背景
             text = font.render(label, True, (255, 255, 255))  # 白色文字
             text_width, text_height = text.get_size()
@@ -273,5 +263,27 @@ class Area:
             text_bg.fill((border_color[0], border_color[1], border_color[2], 200))  # 高透明度背景
             
             # 绘制文本背景和文本
-            screen.blit(text_bg, (screen_x + 5, screen_y + 5))
-            screen.blit(text, (screen_x + 10, screen_y + 8))
\ No newline at end of file
+            surface.blit(text_bg, (x0 + 5, y0 + 5))
+            surface.blit(text, (x0 + 10, y0 + 8))
+        
+        return surface, (bounds.x, bounds.y)
+    
+    def render(self, screen, camera_offset=(0, 0)):
+        """渲染区域
+        
+        Args:
+            screen: pygame屏幕对象
+            camera_offset: 相机偏移量
+        """
+        composite, (offset_x, offset_y) = self.get_composite()
+        screen.blit(composite, (self.x * TILE_SIZE + offset_x - camera_offset[0], self.y * TILE_SIZE + offset_y - camera_offset[1]))
+    
+    def submit(self, render_queue, layer):
+        """把区域的绘制命令提交到渲染队列
+        
+        Args:
+            render_queue: 渲染队列
+            layer: 图层
+        """
+        composite, (offset_x, offset_y) = self.get_composite()
+        render_queue.submit(composite, self.x * TILE_SIZE + offset_x, self.y * TILE_SIZE + offset_y, layer)
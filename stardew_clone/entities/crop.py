@@ -5,6 +5,15 @@ from config import CROP_TYPES
 class Crop:
     """作物类，管理作物的生长和状态"""
     
+    # 所有作物共享的渲染缓存：{(作物类型, 生长阶段, 瓦片大小): 缩放后的图像}
+    _sprite_cache = {}
+    
+    # 所有作物共享的浇水标记
+    _water_indicator = None
+    
+    # 绑定的列式作物存储（CropField），绑定后生长阶段和浇水状态保存在存储的数组中
+    _field = None
+    
     def __init__(self, db_manager, crop_id=None, player_id=None, crop_type=None, x=None, y=None, load_from_db=True, game=None):
         """初始化作物
         
@@ -41,6 +50,36 @@ class Crop:
             # 创建新作物
             self.create_new_crop(player_id, crop_type, x, y)
     
+    @classmethod
+    def from_row(cls, db_manager, row, game=None):
+        """用已查询出的数据库行构建作物，不再额外查询数据库
+        
+        Args:
+            db_manager: 数据库管理器实例
+            row: crops表的一行（sqlite3.Row或字典）
+            game: 游戏实例，用于获取图像管理器
+            
+        Returns:
+            Crop实例
+        """
+        crop = cls(db_manager, load_from_db=False, game=game)
+        crop._apply_row(row)
+        return crop
+    
+    @classmethod
+    def load_for_player(cls, db_manager, player_id, game=None):
+        """用一次查询加载玩家的所有作物
+        
+        Args:
+            db_manager: 数据库管理器实例
+            player_id: 玩家ID
+            game: 游戏实例，用于获取图像管理器
+            
+        Returns:
+            Crop实例列表
+        """
+        return [cls.from_row(db_manager, row, game=game) for row in db_manager.get_crops(player_id)]
+    
     def create_new_crop(self, player_id, crop_type, x, y):
         """创建新作物
         
@@ -78,21 +117,61 @@ class Crop:
         crop_data = self.db.cursor.fetchone()
         
         if crop_data:
-            self.id = crop_data["id"]
-            self.player_id = crop_data["player_id"]
-            self.crop_type = crop_data["crop_type"]
-            self.x = crop_data["x"]
-            self.y = crop_data["y"]
-            self.growth_stage = crop_data["growth_stage"]
-            self.is_watered = bool(crop_data["is_watered"])
-            
-            # 解析种植时间
-            if crop_data["planted_at"]:
-                self.planted_at = datetime.datetime.fromisoformat(crop_data["planted_at"])
-            
-            # 加载作物配置
-            if self.crop_type in CROP_TYPES:
-                self.config = CROP_TYPES[self.crop_type]
+            self._apply_row(crop_data)
+    
+    def _apply_row(self, crop_data):
+        """用数据库行填充作物属性
+        
+        Args:
+            crop_data: crops表的一行（sqlite3.Row或字典）
+        """
+        self.id = crop_data["id"]
+        self.player_id = crop_data["player_id"]
+        self.crop_type = crop_data["crop_type"]
+        self.x = crop_data["x"]
+        self.y = crop_data["y"]
+        self.growth_stage = crop_data["growth_stage"]
+        self.is_watered = bool(crop_data["is_watered"])
+        
+        # 解析种植时间
+        if crop_data["planted_at"]:
+            self.planted_at = datetime.datetime.fromisoformat(crop_data["planted_at"])
+        
+        # 加载作物配置
+        if self.crop_type in CROP_TYPES:
+            self.config = CROP_TYPES[self.crop_type]
+    
+    @property
+    def growth_stage(self):
+        """生长阶段"""
+        field = self._field
+        if field is None:
+            return self._growth_stage
+        return int(field.growth_stage[field.rows[self.id]])
+    
+    @growth_stage.setter
+    def growth_stage(self, value):
+        field = self._field
+        if field is None:
+            self._growth_stage = value
+        else:
+            field.growth_stage[field.rows[self.id]] = value
+    
+    @property
+    def is_watered(self):
+        """今天是否已浇水"""
+        field = self._field
+        if field is None:
+            return self._is_watered
+        return bool(field.is_watered[field.rows[self.id]])
+    
+    @is_watered.setter
+    def is_watered(self, value):
+        field = self._field
+        if field is None:
+            self._is_watered = value
+        else:
+            field.is_watered[field.rows[self.id]] = value
     
     def save(self):
         """保存作物数据到数据库"""
@@ -180,37 +259,103 @@ class Crop:
         screen_x = self.x * tile_size - camera_offset[0]
         screen_y = self.y * tile_size - camera_offset[1]
         
-        # 加载作物图像
+        # 绘制作物图像
+        screen.blit(self.get_current_sprite(tile_size), (screen_x, screen_y))
+        
+        # 如果已浇水，绘制水滴标记
+        if self.is_watered:
+            screen.blit(Crop.get_water_indicator(), (screen_x + tile_size - 10, screen_y))
+    
+    def submit(self, render_queue, tile_size, layer):
+        """把作物的绘制命令提交到渲染队列
+        
+        Args:
+            render_queue: 渲染队列
+            tile_size: 瓦片大小
+            layer: 图层
+        """
+        world_x = self.x * tile_size
+        world_y = self.y * tile_size
+        if render_queue.cull(world_x, world_y, tile_size, tile_size):
+            return
+        render_queue.submit(self.get_current_sprite(tile_size), world_x, world_y, layer)
+        
+        # 如果已浇水，绘制水滴标记
+        if self.is_watered:
+            render_queue.submit(Crop.get_water_indicator(), world_x + tile_size - 10, world_y, layer)
+    
+    def get_current_sprite(self, tile_size):
+        """获取当前生长阶段的作物图像
+        
+        Args:
+            tile_size: 瓦片大小
+            
+        Returns:
+            缩放后的图像
+        """
         # 根据生长阶段加载不同的图像
         growth_percent = self.growth_stage / self.config["growth_time"]
         
         # 将生长百分比映射到4个生长阶段（0-3）
         stage = min(int(growth_percent * 4), 3)
         
+        image_manager = self.game.image_manager if self.game and hasattr(self.game, 'image_manager') else None
+        return Crop.get_sprite(self.crop_type, stage, tile_size, image_manager)
+    
+    @classmethod
+    def get_sprite(cls, crop_type, stage, tile_size, image_manager=None):
+        """获取缩放到瓦片大小的作物图像，结果在所有作物之间共享
+        
+        Args:
+            crop_type: 作物类型
+            stage: 生长阶段（0-3）
+            tile_size: 瓦片大小
+            image_manager: 图像管理器，为None时使用占位符图像
+            
+        Returns:
+            缩放后的图像
+        """
+        # 占位符与作物类型无关
+        key = (crop_type if image_manager else None, stage, tile_size)
+        sprite = cls._sprite_cache.get(key)
+        if sprite is not None:
+            return sprite
+        
+        # 优先使用纹理图集中预先缩放的图像
+        if image_manager:
+            sprite = image_manager.get_atlas_image('crops', f"{crop_type}_stage{stage + 1}", (tile_size, tile_size))
+            if sprite is not None:
+                cls._sprite_cache[key] = sprite
+                return sprite
+        
         # 加载作物图像
-        if self.game and hasattr(self.game, 'image_manager'):
-            crop_images = self.game.image_manager.load_crop_stages(self.crop_type, 4)
+        if image_manager:
+            crop_images = image_manager.load_crop_stages(crop_type, 4)
         else:
             # 创建占位符图像
             crop_images = []
             for i in range(4):
                 placeholder = pygame.Surface((32, 32), pygame.SRCALPHA)
-                green_value = max(50, 255 - (i * 50))  # 随着阶段增加，绿色变深
                 placeholder.fill((139, 69, 19))  # 棕色底色
                 crop_images.append(placeholder)
         
         # 确保生长阶段在有效范围内
-        stage = min(stage, len(crop_images) - 1)
+        stage_image = crop_images[min(stage, len(crop_images) - 1)]
         
         # 调整图像大小
-        scaled_image = pygame.transform.scale(crop_images[stage], (tile_size, tile_size))
-        
-        # 绘制作物图像
-        screen.blit(scaled_image, (screen_x, screen_y))
+        sprite = pygame.transform.scale(stage_image, (tile_size, tile_size))
+        cls._sprite_cache[key] = sprite
+        return sprite
+    
+    @classmethod
+    def get_water_indicator(cls):
+        """获取浇水标记（蓝色小圆圈）
         
-        # 如果已浇水，绘制水滴标记
-        if self.is_watered:
-            # 加载水滴图像或绘制一个蓝色小圆圈表示已浇水
+        Returns:
+            浇水标记图像
+        """
+        if cls._water_indicator is None:
             water_indicator = pygame.Surface((10, 10), pygame.SRCALPHA)
             pygame.draw.circle(water_indicator, (0, 0, 255, 180), (5, 5), 5)
-            screen.blit(water_indicator, (screen_x + tile_size - 10, screen_y))
\ No newline at end of file
+            cls._water_indicator = water_indicator
+        return cls._water_indicator
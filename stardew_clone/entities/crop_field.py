@@ -0,0 +1,204 @@
+from config import CROP_TYPES
+
+try:
+    import numpy as np
+except ImportError:  # numpy是可选依赖，未安装时农场使用逐个作物的路径
+    np = None
+
+
+class CropField:
+    """列式作物存储
+
+    把所有作物的类型、位置、生长阶段和浇水状态保存在NumPy数组中（每种属性一列，每株作物一行），
+    结束当天时用几次向量化运算完成所有作物的生长，只把变化的行用一次executemany写回数据库。
+
+    Crop对象绑定到存储后，其growth_stage和is_watered直接读写存储中的对应行，
+    因此浇水、收获、渲染等逐个作物的逻辑不需要修改。删除作物时用最后一行填补空位（swap-remove）。
+    """
+
+    # 作物类型编号：CROP_TYPES中的顺序，未知类型为UNKNOWN_TYPE
+    TYPE_NAMES = list(CROP_TYPES)
+    TYPE_IDS = {name: index for index, name in enumerate(TYPE_NAMES)}
+    UNKNOWN_TYPE = 255
+
+    # 未知类型的作物没有成熟阶段（与Crop.is_fully_grown一致，永远不会成熟）
+    NO_MAX_STAGE = 2 ** 31 - 1
+
+    def __init__(self, capacity=64):
+        """初始化空的作物存储
+
+        Args:
+            capacity: 初始容量（行数），不足时自动加倍
+        """
+        if np is None:
+            raise ImportError("列式作物存储需要安装numpy")
+        self.count = 0
+        self.rows = {}  # {作物ID: 行号}
+        self._allocate(max(1, capacity))
+
+    @staticmethod
+    def available():
+        """是否可以使用列式存储（已安装numpy）"""
+        return np is not None
+
+    @classmethod
+    def max_stage_for(cls, crop_type):
+        """作物类型的成熟阶段"""
+        config = CROP_TYPES.get(crop_type)
+        return config["growth_time"] if config else cls.NO_MAX_STAGE
+
+    def _allocate(self, capacity):
+        """分配（或扩大）各列数组，保留已有的行
+
+        Args:
+            capacity: 新容量
+        """
+        columns = {
+            "ids": np.int64,
+            "crop_type_id": np.uint8,
+            "x": np.int32,
+            "y": np.int32,
+            "growth_stage": np.int32,
+            "is_watered": np.bool_,
+            "max_stage": np.int32
+        }
+        for name, dtype in columns.items():
+            array = np.zeros(capacity, dtype=dtype)
+            old = getattr(self, name, None)
+            if old is not None:
+                array[:self.count] = old[:self.count]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    @classmethod
+    def from_columns(cls, ids, crop_types, x, y, growth_stage, is_watered):
+        """用列数据批量构建存储（不绑定Crop对象）
+
+        Args:
+            ids: 作物ID序列
+            crop_types: 作物类型名称序列
+            x: X坐标序列
+            y: Y坐标序列
+            growth_stage: 生长阶段序列
+            is_watered: 浇水状态序列
+
+        Returns:
+            CropField实例
+        """
+        count = len(ids)
+        field = cls(capacity=count)
+        field.ids[:count] = ids
+        field.crop_type_id[:count] = [cls.TYPE_IDS.get(crop_type, cls.UNKNOWN_TYPE) for crop_type in crop_types]
+        field.x[:count] = x
+        field.y[:count] = y
+        field.growth_stage[:count] = growth_stage
+        field.is_watered[:count] = is_watered
+        # 成熟阶段按类型编号查表
+        max_stages = np.full(256, cls.NO_MAX_STAGE, dtype=np.int32)
+        for type_id, crop_type in enumerate(cls.TYPE_NAMES):
+            max_stages[type_id] = cls.max_stage_for(crop_type)
+        field.max_stage[:count] = max_stages[field.crop_type_id[:count]]
+        field.count = count
+        field.rows = {crop_id: row for row, crop_id in enumerate(field.ids[:count].tolist())}
+        return field
+
+    @classmethod
+    def from_crops(cls, crops):
+        """用已加载的作物构建存储，并把作物绑定到存储
+
+        Args:
+            crops: Crop对象列表
+
+        Returns:
+            CropField实例
+        """
+        field = cls.from_columns(
+            [crop.id for crop in crops],
+            [crop.crop_type for crop in crops],
+            [crop.x for crop in crops],
+            [crop.y for crop in crops],
+            [crop.growth_stage for crop in crops],
+            [crop.is_watered for crop in crops]
+        )
+        for crop in crops:
+            crop._field = field
+        return field
+
+    def add(self, crop):
+        """添加一株作物并绑定
+
+        Args:
+            crop: 尚未绑定的Crop对象（需要已有ID）
+        """
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+        row = self.count
+        self.ids[row] = crop.id
+        self.crop_type_id[row] = self.TYPE_IDS.get(crop.crop_type, self.UNKNOWN_TYPE)
+        self.x[row] = crop.x
+        self.y[row] = crop.y
+        self.growth_stage[row] = crop.growth_stage
+        self.is_watered[row] = crop.is_watered
+        self.max_stage[row] = self.max_stage_for(crop.crop_type)
+        self.rows[crop.id] = row
+        self.count += 1
+        crop._field = self
+
+    def remove(self, crop):
+        """移除一株作物（用最后一行填补空位），作物解除绑定后保留当前状态
+
+        Args:
+            crop: 已绑定的Crop对象
+        """
+        growth_stage = crop.growth_stage
+        is_watered = crop.is_watered
+        crop._field = None
+        crop.growth_stage = growth_stage
+        crop.is_watered = is_watered
+
+        row = self.rows.pop(crop.id)
+        last = self.count - 1
+        if row != last:
+            for array in (self.ids, self.crop_type_id, self.x, self.y, self.growth_stage, self.is_watered, self.max_stage):
+                array[row] = array[last]
+            self.rows[int(self.ids[row])] = row
+        self.count = last
+
+    def water_all(self):
+        """把所有作物标记为已浇水（与DatabaseManager.water_all_crops一致）"""
+        self.is_watered[:self.count] = True
+
+    def advance_day(self):
+        """所有作物生长一天：已浇水且未成熟的作物生长阶段加1并重置浇水状态
+
+        Returns:
+            发生变化的行号数组
+        """
+        count = self.count
+        growth_stage = self.growth_stage[:count]
+        is_watered = self.is_watered[:count]
+        grown = np.flatnonzero(is_watered & (growth_stage < self.max_stage[:count]))
+        growth_stage[grown] += 1
+        is_watered[grown] = False
+        return grown
+
+    def write_back(self, db_manager, rows):
+        """把指定行的生长阶段和浇水状态写回数据库（一次executemany）
+
+        Args:
+            db_manager: 数据库管理器实例
+            rows: 行号数组
+
+        Returns:
+            写回的行数
+        """
+        if len(rows) == 0:
+            return 0
+        return db_manager.update_crops_growth(zip(
+            self.growth_stage[rows].tolist(),
+            self.is_watered[rows].astype(np.int8).tolist(),
+            self.ids[rows].tolist()
+        ))
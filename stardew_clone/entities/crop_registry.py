@@ -0,0 +1,82 @@
+class CropRegistry:
+    """作物登记表
+
+    用列表保存作物（遍历和渲染），同时维护按作物ID和按瓦片坐标的字典索引，
+    使用工具时查找作物、收获时删除作物都是O(1)，与作物数量无关。
+
+    删除时用最后一株作物填补空位（swap-remove），与CropField的行顺序保持一致。
+    遍历顺序只在增删时变化，同一组作物每帧的遍历顺序相同；
+    作物通过RenderQueue按图层和深度排序后绘制，因此删除不会改变画面。
+    """
+
+    def __init__(self, crops=()):
+        """初始化
+
+        Args:
+            crops: 初始作物（例如从数据库加载的作物列表）
+        """
+        self._crops = []
+        self._positions = {}  # {作物ID: 在列表中的下标}
+        self._by_tile = {}    # {(x, y): 作物}
+        for crop in crops:
+            self.add(crop)
+
+    def __len__(self):
+        return len(self._crops)
+
+    def __iter__(self):
+        return iter(self._crops)
+
+    def __getitem__(self, index):
+        return self._crops[index]
+
+    def __contains__(self, crop):
+        return self.get(crop.id) is crop
+
+    def get(self, crop_id):
+        """按ID查找作物
+
+        Args:
+            crop_id: 作物ID
+
+        Returns:
+            作物，不存在时返回None
+        """
+        position = self._positions.get(crop_id)
+        return self._crops[position] if position is not None else None
+
+    def at(self, x, y):
+        """查找种在某个瓦片上的作物
+
+        Args:
+            x: 瓦片X坐标
+            y: 瓦片Y坐标
+
+        Returns:
+            作物，不存在时返回None
+        """
+        return self._by_tile.get((x, y))
+
+    def add(self, crop):
+        """添加作物
+
+        Args:
+            crop: 作物（需要已有ID）
+        """
+        self._positions[crop.id] = len(self._crops)
+        self._crops.append(crop)
+        self._by_tile[(crop.x, crop.y)] = crop
+
+    def remove(self, crop):
+        """删除作物（用最后一株作物填补空位）
+
+        Args:
+            crop: 作物
+        """
+        position = self._positions.pop(crop.id)
+        last = self._crops.pop()
+        if last is not crop:
+            self._crops[position] = last
+            self._positions[last.id] = position
+        if self._by_tile.get((crop.x, crop.y)) is crop:
+            del self._by_tile[(crop.x, crop.y)]
@@ -0,0 +1,236 @@
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # numpy是可选依赖，未安装时整张网格的查询逐个瓦片计算
+    np = None
+
+
+class FarmGrid:
+    """紧凑的农场网格
+
+    每个瓦片只占一个字节的状态码（bytearray）和一个int32的作物ID（array），
+    代替原来每个瓦片一个字典（约200字节），因此很大的农场也只需要几MB内存。
+
+    兼容原来的访问方式：grid[y][x]返回None（空地）或行为类似字典的瓦片视图
+    （tile["type"]、tile["id"]、tile.get("watered")，tile["watered"] = True会写回网格），
+    grid[y][x] = {...}或None会转换为状态码。
+    安装了numpy时codes是共享同一块内存的二维数组视图，整张网格的查询（如所有未浇水的耕地）用向量化掩码完成。
+    """
+
+    # 瓦片状态码
+    EMPTY = 0
+    TILLED = 1
+    WATERED = 2  # 已浇水的耕地
+    CROP = 3
+
+    def __init__(self, width, height):
+        """初始化空网格
+
+        Args:
+            width: 宽度（瓦片数）
+            height: 高度（瓦片数）
+        """
+        self.width = width
+        self.height = height
+        self.states = bytearray(width * height)
+        self.crop_ids = array("i", bytes(4 * width * height))
+        # 与states/crop_ids共享内存的NumPy视图（形状为(高度, 宽度)）
+        if np is not None:
+            self.codes = np.frombuffer(self.states, dtype=np.uint8).reshape(height, width)
+            self.ids = np.frombuffer(self.crop_ids, dtype=np.int32).reshape(height, width)
+        else:
+            self.codes = None
+            self.ids = None
+
+    def __len__(self):
+        return self.height
+
+    def __getitem__(self, y):
+        if not 0 <= y < self.height:
+            raise IndexError(y)
+        return _GridRow(self, y)
+
+    def __iter__(self):
+        for y in range(self.height):
+            yield _GridRow(self, y)
+
+    def code(self, x, y):
+        """瓦片的状态码"""
+        return self.states[y * self.width + x]
+
+    def crop_id(self, x, y):
+        """瓦片上作物的ID，没有作物时返回None"""
+        index = y * self.width + x
+        return self.crop_ids[index] if self.states[index] == self.CROP else None
+
+    def set_empty(self, x, y):
+        """把瓦片设为空地"""
+        index = y * self.width + x
+        self.states[index] = self.EMPTY
+        self.crop_ids[index] = 0
+
+    def set_tilled(self, x, y, watered=False):
+        """把瓦片设为耕地
+
+        Args:
+            x: 瓦片X坐标
+            y: 瓦片Y坐标
+            watered: 是否已浇水
+        """
+        index = y * self.width + x
+        self.states[index] = self.WATERED if watered else self.TILLED
+        self.crop_ids[index] = 0
+
+    def set_crop(self, x, y, crop_id):
+        """把瓦片设为作物
+
+        Args:
+            x: 瓦片X坐标
+            y: 瓦片Y坐标
+            crop_id: 作物ID
+        """
+        index = y * self.width + x
+        self.states[index] = self.CROP
+        self.crop_ids[index] = crop_id
+
+    def set(self, x, y, tile):
+        """用字典形式的瓦片数据设置瓦片
+
+        Args:
+            x: 瓦片X坐标
+            y: 瓦片Y坐标
+            tile: None（空地）、{"type": "tilled", "watered": bool}或{"type": "crop", "id": int}
+        """
+        if tile is None:
+            self.set_empty(x, y)
+        elif tile["type"] == "tilled":
+            self.set_tilled(x, y, tile.get("watered", False))
+        elif tile["type"] == "crop":
+            self.set_crop(x, y, tile["id"])
+        else:
+            raise ValueError(f"未知的瓦片类型: {tile['type']}")
+
+    def mask(self, *codes):
+        """状态码属于codes的瓦片掩码
+
+        Args:
+            *codes: 状态码
+
+        Returns:
+            形状为(高度, 宽度)的布尔数组
+        """
+        if np is None:
+            raise ImportError("网格掩码需要安装numpy")
+        return np.isin(self.codes, codes)
+
+    def positions(self, *codes):
+        """状态码属于codes的所有瓦片坐标（按行排列）
+
+        Args:
+            *codes: 状态码
+
+        Returns:
+            [(x, y), ...]
+        """
+        if np is not None:
+            ys, xs = np.nonzero(self.mask(*codes))
+            return list(zip(xs.tolist(), ys.tolist()))
+        width = self.width
+        return [(index % width, index // width) for index, state in enumerate(self.states) if state in codes]
+
+    def tilled_tiles(self):
+        """所有耕地
+
+        Returns:
+            [(x, y, 是否已浇水), ...]
+        """
+        return [(x, y, self.code(x, y) == self.WATERED) for x, y in self.positions(self.TILLED, self.WATERED)]
+
+    def water_tilled(self):
+        """给所有未浇水的耕地浇水
+
+        Returns:
+            本次浇水的瓦片坐标列表
+        """
+        changed = self.positions(self.TILLED)
+        if np is not None:
+            self.codes[self.codes == self.TILLED] = self.WATERED
+        else:
+            for x, y in changed:
+                self.states[y * self.width + x] = self.WATERED
+        return changed
+
+
+class _GridRow:
+    """网格的一行，支持row[x]读取和row[x] = tile赋值"""
+
+    __slots__ = ("grid", "y")
+
+    def __init__(self, grid, y):
+        self.grid = grid
+        self.y = y
+
+    def __len__(self):
+        return self.grid.width
+
+    def __getitem__(self, x):
+        grid = self.grid
+        if not 0 <= x < grid.width:
+            raise IndexError(x)
+        if grid.states[self.y * grid.width + x] == FarmGrid.EMPTY:
+            return None
+        return _TileView(grid, x, self.y)
+
+    def __setitem__(self, x, tile):
+        if not 0 <= x < self.grid.width:
+            raise IndexError(x)
+        self.grid.set(x, self.y, tile)
+
+
+class _TileView:
+    """瓦片视图，读写时直接访问网格中的状态码，行为类似原来的瓦片字典"""
+
+    __slots__ = ("grid", "x", "y")
+
+    def __init__(self, grid, x, y):
+        self.grid = grid
+        self.x = x
+        self.y = y
+
+    def to_dict(self):
+        """转换为字典形式的瓦片数据"""
+        code = self.grid.code(self.x, self.y)
+        if code == FarmGrid.CROP:
+            return {"type": "crop", "id": self.grid.crop_id(self.x, self.y)}
+        if code == FarmGrid.EMPTY:
+            return None
+        return {"type": "tilled", "watered": code == FarmGrid.WATERED}
+
+    def get(self, key, default=None):
+        tile = self.to_dict()
+        return tile.get(key, default) if tile else default
+
+    def __getitem__(self, key):
+        tile = self.to_dict()
+        if tile is None:
+            raise KeyError(key)
+        return tile[key]
+
+    def __contains__(self, key):
+        tile = self.to_dict()
+        return tile is not None and key in tile
+
+    def __setitem__(self, key, value):
+        code = self.grid.code(self.x, self.y)
+        if key != "watered" or code not in (FarmGrid.TILLED, FarmGrid.WATERED):
+            raise KeyError(key)
+        self.grid.set_tilled(self.x, self.y, bool(value))
+
+    def __eq__(self, other):
+        if isinstance(other, _TileView):
+            other = other.to_dict()
+        return self.to_dict() == other
+
+    def __repr__(self):
+        return repr(self.to_dict())
@@ -19,6 +19,22 @@ class Inventory:
         self.slot_size = 64     # 物品槽大小
         self.margin = 10        # 物品槽之间的间距
         
+        # 物品和工具（按数据库ID排序）
+        self.items = []
+        self.tools = []
+        # 所有物品槽的固定顺序：物品在前，工具在后
+        self.slots = []
+        # 索引：(物品名称, 物品类型) -> 物品，物品ID -> 物品
+        self._items_by_key = {}
+        self._items_by_id = {}
+        # 索引：工具名称 -> 工具
+        self._tools_by_name = {}
+        # 版本号，每次物品栏内容变化时加1，渲染器和市场可据此缓存派生数据
+        self.version = 0
+        # 物品栏缓存表面及其对应的(版本号, 选中槽)
+        self._hotbar_surface = None
+        self._hotbar_key = None
+        
         # 加载物品和工具
         self.refresh()
     
@@ -26,6 +42,15 @@ class Inventory:
         """从数据库刷新物品和工具"""
         self.items = self.db.get_inventory(self.player_id)
         self.tools = self.db.get_tools(self.player_id)
+        self._items_by_key = {(item["item_name"], item["item_type"]): item for item in self.items}
+        self._items_by_id = {item["id"]: item for item in self.items}
+        self._tools_by_name = {tool["tool_name"]: tool for tool in self.tools}
+        self._rebuild_slots()
+    
+    def _rebuild_slots(self):
+        """重建物品槽顺序并增加版本号"""
+        self.slots = self.items + self.tools
+        self.version += 1
     
     def get_selected_item(self):
         """获取当前选中的物品或工具
@@ -33,9 +58,8 @@ class Inventory:
         Returns:
             选中的物品或工具，如果没有则返回None
         """
-        all_items = self.items + self.tools
-        if 0 <= self.selected_slot < len(all_items):
-            return all_items[self.selected_slot]
+        if 0 <= self.selected_slot < len(self.slots):
+            return self.slots[self.selected_slot]
         return None
     
     def add_item(self, item_name, quantity, item_type):
@@ -46,8 +70,18 @@ class Inventory:
             quantity: 数量
             item_type: 物品类型
         """
-        self.db.add_inventory_item(self.player_id, item_name, quantity, item_type)
-        self.refresh()
+        self.add_items([(item_name, item_type, quantity)])
+    
+    def add_items(self, changes):
+        """批量添加物品（例如一次收获整片田），只访问一次数据库
+        
+        Args:
+            changes: [(物品名称, 物品类型, 数量), ...]
+        """
+        if not changes:
+            return
+        results = self.db.apply_inventory_changes(self.player_id, changes)
+        self._patch_items(results)
     
     def remove_item(self, item_id, quantity):
         """从物品栏移除物品
@@ -59,16 +93,73 @@ class Inventory:
         Returns:
             是否成功移除
         """
-        for item in self.items:
-            if item["id"] == item_id:
-                if item["quantity"] >= quantity:
-                    # 更新物品数量
-                    new_quantity = item["quantity"] - quantity
-                    self.db.update_inventory_item(item_id, new_quantity)
-                    self.refresh()
-                    return True
-                break
-        return False
+        item = self._items_by_id.get(item_id)
+        if item is None:
+            return False
+        return self.remove_items([(item["item_name"], item["item_type"], quantity)])
+    
+    def remove_items(self, changes):
+        """批量移除物品，数量不足时不做任何修改
+        
+        Args:
+            changes: [(物品名称, 物品类型, 数量), ...]
+            
+        Returns:
+            是否成功移除
+        """
+        # 先检查所有物品数量是否足够
+        needed = {}
+        for item_name, item_type, quantity in changes:
+            key = (item_name, item_type)
+            needed[key] = needed.get(key, 0) + quantity
+        for (item_name, item_type), quantity in needed.items():
+            if not self.has_item(item_name, item_type, quantity):
+                return False
+        
+        results = self.db.apply_inventory_changes(
+            self.player_id,
+            [(item_name, item_type, -quantity) for item_name, item_type, quantity in changes]
+        )
+        self._patch_items(results)
+        return True
+    
+    def _patch_items(self, results):
+        """用数据库返回的新数量就地更新物品列表，不重新查询数据库
+        
+        Args:
+            results: apply_inventory_changes的返回值
+        """
+        slots_changed = False
+        for key, row in results.items():
+            existing = self._items_by_key.get(key)
+            
+            if row["quantity"] <= 0:
+                # 数量用完，移除物品
+                if existing is not None:
+                    self.items.remove(existing)
+                    del self._items_by_key[key]
+                    del self._items_by_id[existing["id"]]
+                    slots_changed = True
+            elif existing is not None:
+                existing["quantity"] = row["quantity"]
+            else:
+                # 新物品追加到末尾，与按ID排序的查询结果顺序一致
+                item = {
+                    "id": row["id"],
+                    "player_id": self.player_id,
+                    "item_name": key[0],
+                    "quantity": row["quantity"],
+                    "item_type": key[1]
+                }
+                self.items.append(item)
+                self._items_by_key[key] = item
+                self._items_by_id[item["id"]] = item
+                slots_changed = True
+        
+        if slots_changed:
+            self._rebuild_slots()
+        else:
+            self.version += 1
     
     def has_item(self, item_name, item_type, quantity=1):
         """检查物品栏是否有指定物品
@@ -81,11 +172,8 @@ class Inventory:
         Returns:
             是否有足够的物品
         """
-        for item in self.items:
-            if item["item_name"] == item_name and item["item_type"] == item_type:
-                if item["quantity"] >= quantity:
-                    return True
-        return False
+        item = self._items_by_key.get((item_name, item_type))
+        return item is not None and item["quantity"] >= quantity
     
     def get_item_id(self, item_name, item_type):
         """获取指定物品的ID
@@ -97,10 +185,19 @@ class Inventory:
         Returns:
             物品ID，如果没有找到则返回None
         """
-        for item in self.items:
-            if item["item_name"] == item_name and item["item_type"] == item_type:
-                return item["id"]
-        return None
+        item = self._items_by_key.get((item_name, item_type))
+        return item["id"] if item is not None else None
+    
+    def has_tool(self, tool_name):
+        """检查是否拥有指定工具
+        
+        Args:
+            tool_name: 工具名称
+            
+        Returns:
+            是否拥有该工具
+        """
+        return tool_name in self._tools_by_name
     
     def handle_event(self, event):
         """处理物品栏相关的事件
@@ -115,15 +212,13 @@ class Inventory:
             # 数字键1-9选择物品槽
             if pygame.K_1 <= event.key <= pygame.K_9:
                 slot = event.key - pygame.K_1
-                all_items = self.items + self.tools
-                if slot < len(all_items):
+                if slot < len(self.slots):
                     self.selected_slot = slot
                     return True
             # 鼠标滚轮切换物品槽 (应该用原始列表长度)
             elif event.key == pygame.K_TAB:
-                all_items_origin = self.items + self.tools # 使用原始列表
-                if all_items_origin:
-                    self.selected_slot = (self.selected_slot + 1) % len(all_items_origin)
+                if self.slots:
+                    self.selected_slot = (self.selected_slot + 1) % len(self.slots)
                     return True
         
         return False
@@ -131,71 +226,90 @@ class Inventory:
     def render(self, screen, x, y):
         """渲染物品栏
         
+        物品栏预先合成到一个缓存表面上，只有物品栏内容或选中槽变化时才重新合成，
+        每帧只需要一次blit。
+        
         Args:
             screen: pygame屏幕对象
             x: 物品栏左上角X坐标
             y: 物品栏左上角Y坐标
         """
-        # 过滤掉所有 item_type 为“产品”的物品，只显示“种子”、工具和其他可用物品
-        filtered_items = []
-        filtered_indices = []
-        for idx, item in enumerate(self.items):
-            if item["item_type"] != "产品":
-                filtered_items.append(item)
-                filtered_indices.append(idx)
-        all_items = filtered_items + self.tools
-    
-        # 计算当前选中槽在过滤后 all_items 中的索引
-        selected_index = None
-        all_items_origin = self.items + self.tools # 原始完整列表
+        cache_key = (self.version, self.selected_slot)
+        if self._hotbar_surface is None or self._hotbar_key != cache_key:
+            self._hotbar_surface = self._build_hotbar_surface()
+            self._hotbar_key = cache_key
+        screen.blit(self._hotbar_surface, (x, y))
     
-        if 0 <= self.selected_slot < len(all_items_origin):
-            # Case 1: Selected item is a tool
-            if self.selected_slot >= len(self.items):
-                tool_index_in_origin = self.selected_slot - len(self.items)
-                selected_index = len(filtered_items) + tool_index_in_origin
-            else:
-                original_item_index = self.selected_slot
-                original_selected_item = self.items[original_item_index]
-                if original_selected_item.get("item_type") != "产品":
-                    num_preceding_filtered = 0
-                    for i in range(original_item_index):
-                        if self.items[i].get("item_type") != "产品":
-                            num_preceding_filtered += 1
-                    selected_index = num_preceding_filtered
+    def _get_icon(self, category, name, size):
+        """获取缩放好的物品图标
+        
+        Args:
+            category: 图像类别
+            name: 图像名称
+            size: 图标边长
+            
+        Returns:
+            缩放后的图像
+        """
+        return self.game.image_manager.load_scaled_image(category, name, (size, size))
     
+    def _build_hotbar_surface(self):
+        """合成物品栏表面
+        
+        Returns:
+            包含所有物品槽的透明表面
+        """
+        # 过滤掉所有 item_type 为“产品”的物品，只显示“种子”、工具和其他可用物品；
+        # 同时记录当前选中槽在过滤后列表中的位置
+        all_items = []
+        selected_index = None
+        for slot_index, item in enumerate(self.slots):
+            if item.get("item_type") == "产品":
+                continue
+            if slot_index == self.selected_slot:
+                selected_index = len(all_items)
+            all_items.append(item)
+        
+        # 根据物品槽数量计算表面大小
+        cols = max(1, min(len(all_items), self.slots_per_row))
+        rows = max(1, (len(all_items) + self.slots_per_row - 1) // self.slots_per_row)
+        surface = pygame.Surface(
+            (cols * (self.slot_size + self.margin) - self.margin, rows * (self.slot_size + self.margin) - self.margin),
+            pygame.SRCALPHA
+        )
+        
+        has_images = self.game and hasattr(self.game, 'image_manager')
+        font = font_manager.get_font(14)
+        icon_size = self.slot_size - 20
+        
         for i, item in enumerate(all_items):
             row = i // self.slots_per_row
             col = i % self.slots_per_row
-            slot_x = x + col * (self.slot_size + self.margin)
-            slot_y = y + row * (self.slot_size + self.margin)
+            slot_x = col * (self.slot_size + self.margin)
+            slot_y = row * (self.slot_size + self.margin)
     
             slot_rect = pygame.Rect(slot_x, slot_y, self.slot_size, self.slot_size)
-            pygame.draw.rect(screen, (100, 100, 100), slot_rect)
-            if self.game and hasattr(self.game, 'image_manager') and "item_type" in item:
+            pygame.draw.rect(surface, (100, 100, 100), slot_rect)
+            if has_images and "item_type" in item:
                 if item["item_type"] == "种子":
-                    pygame.draw.rect(screen, (210, 180, 140), slot_rect)
+                    pygame.draw.rect(surface, (210, 180, 140), slot_rect)
                 elif item["item_type"] == "作物":
-                    pygame.draw.rect(screen, (144, 238, 144), slot_rect)
+                    pygame.draw.rect(surface, (144, 238, 144), slot_rect)
                 elif item["item_type"] == "产品":
-                    pygame.draw.rect(screen, (173, 216, 230), slot_rect)
+                    pygame.draw.rect(surface, (173, 216, 230), slot_rect)
                 elif item["item_type"] == "饲料":
-                    pygame.draw.rect(screen, (255, 218, 185), slot_rect)
+                    pygame.draw.rect(surface, (255, 218, 185), slot_rect)
     
             if i == selected_index:
-                pygame.draw.rect(screen, (200, 200, 100), slot_rect)
+                pygame.draw.rect(surface, (200, 200, 100), slot_rect)
     
-            font = font_manager.get_font(14)
-            number_text = font.render(str(i+1), True, (255,255,255))
+            number_text = font_manager.render(font, str(i+1), True, (255,255,255))
             number_width = number_text.get_width()
-            screen.blit(number_text, (slot_x + self.slot_size - number_width - 4, slot_y + 2))
+            surface.blit(number_text, (slot_x + self.slot_size - number_width - 4, slot_y + 2))
     
-            icon_rect = pygame.Rect(
-                slot_x + 10, slot_y + 10,
-                self.slot_size - 20, self.slot_size - 20
-            )
+            icon_rect = pygame.Rect(slot_x + 10, slot_y + 10, icon_size, icon_size)
     
-            if self.game and hasattr(self.game, 'image_manager'):
+            if has_images:
                 if "item_type" in item:
                     category = "items"
                     name = item["item_name"]
@@ -205,14 +319,9 @@ class Inventory:
                     elif item["item_type"] == "饲料": category = "feeds"
     
                     if category != "products":
-                        item_image = self.game.image_manager.load_image(category, name)
-                        item_image = pygame.transform.scale(item_image, (icon_rect.width, icon_rect.height))
-                        screen.blit(item_image, icon_rect)
+                        surface.blit(self._get_icon(category, name, icon_size), icon_rect)
                 else:
-                    tool_name = item["tool_name"]
-                    tool_image = self.game.image_manager.load_image("tools", tool_name)
-                    tool_image = pygame.transform.scale(tool_image, (icon_rect.width, icon_rect.height))
-                    screen.blit(tool_image, icon_rect)
+                    surface.blit(self._get_icon("tools", item["tool_name"], icon_size), icon_rect)
             else:
                 if "item_type" in item:
                     if item["item_type"] == "种子": color = (139, 69, 19)
@@ -225,20 +334,21 @@ class Inventory:
                     elif item["tool_name"] == "水壶": color = (0, 0, 255)
                     elif item["tool_name"] == "镰刀": color = (255, 215, 0)
                     else: color = (150, 150, 150)
-                pygame.draw.rect(screen, color, icon_rect)
+                pygame.draw.rect(surface, color, icon_rect)
     
             if "quantity" in item:
-                font = font_manager.get_font(14)
-                text = font.render(str(item["quantity"]), True, (255, 255, 255))
-                screen.blit(text, (slot_x + self.slot_size - 20, slot_y + self.slot_size - 20))
+                text = font_manager.render(font, str(item["quantity"]), True, (255, 255, 255))
+                surface.blit(text, (slot_x + self.slot_size - 20, slot_y + self.slot_size - 20))
     
             if i == selected_index:
-                pygame.draw.rect(screen, (255, 255, 0), slot_rect, 3)
+                pygame.draw.rect(surface, (255, 255, 0), slot_rect, 3)
             else:
-                pygame.draw.rect(screen, (50, 50, 50), slot_rect, 2)
+                pygame.draw.rect(surface, (50, 50, 50), slot_rect, 2)
     
             name = item.get("item_name", item.get("tool_name", ""))
             if len(name) > 8:
                 name = name[:7] + "..."
-            name_text = font.render(name, True, (255, 255, 255))
-            screen.blit(name_text, (slot_x + 5, slot_y + 5))
\ No newline at end of file
+            name_text = font_manager.render(font, name, True, (255, 255, 255))
+            surface.blit(name_text, (slot_x + 5, slot_y + 5))
+        
+        return surface
@@ -32,6 +32,7 @@ class Player:
         self.x = 0
         self.y = 0
         self.direction = "down"  # down, up, left, right
+        self._scaled_sprites = {}  # 按朝向缓存的放大精灵图
         
         # 玩家是否在房子内
         self.in_house = False
@@ -218,6 +219,38 @@ class Player:
             screen: pygame屏幕对象
             camera_offset: 相机偏移量
         """
+        # 绘制放大后的玩家精灵图
+        screen.blit(
+            self.get_sprite(), 
+            (self.x - camera_offset[0], self.y - camera_offset[1])
+        )  # 放大后的玩家图像
+    
+    def submit(self, render_queue, layer):
+        """把玩家的绘制命令提交到渲染队列
+        
+        Args:
+            render_queue: 渲染队列
+            layer: 图层
+        """
+        render_queue.submit(self.get_sprite(), self.x, self.y, layer)
+    
+    def get_sprite(self):
+        """获取当前朝向放大1.5倍后的玩家精灵图，结果按朝向缓存
+        
+        Returns:
+            放大后的玩家精灵图
+        """
+        scaled_player_sprite = self._scaled_sprites.get(self.direction)
+        if scaled_player_sprite is not None:
+            return scaled_player_sprite
+        
+        # 优先使用纹理图集中预先放大的精灵图
+        if self.game and hasattr(self.game, 'image_manager'):
+            scaled_player_sprite = self.game.image_manager.get_atlas_image('player', self.direction, 1.5)
+            if scaled_player_sprite is not None:
+                self._scaled_sprites[self.direction] = scaled_player_sprite
+                return scaled_player_sprite
+        
         # 加载玩家精灵图
         if self.game and hasattr(self.game, 'image_manager'):
             player_sprite = self.game.image_manager.load_player_sprite(self.direction)
@@ -232,9 +265,5 @@ class Player:
         scaled_width = int(original_width * 1.5)
         scaled_height = int(original_height * 1.5)
         scaled_player_sprite = pygame.transform.scale(player_sprite, (scaled_width, scaled_height))
-        
-        # 绘制放大后的玩家精灵图
-        screen.blit(
-            scaled_player_sprite, 
-            (self.x - camera_offset[0], self.y - camera_offset[1])
-        )  # 放大后的玩家图像
\ No newline at end of file
+        self._scaled_sprites[self.direction] = scaled_player_sprite
+        return scaled_player_sprite
\ No newline at end of file
@@ -197,7 +197,7 @@ class Tool:
         
         # 绘制工具等级
         font = font_manager.get_font(20)
-        level_text = font.render(f"Lv.{self.level}", True, (255, 255, 255))
+        level_text = font_manager.render(font, f"Lv.{self.level}", True, (255, 255, 255))
         screen.blit(level_text, (x + 5, y + 5))
         
         # 绘制耐久度条
@@ -0,0 +1,137 @@
+from array import array
+
+from entities.area import Area
+
+try:
+    import numpy as np
+except ImportError:  # numpy是可选依赖，只有导出掩码时需要
+    np = None
+
+
+class ZoneMap:
+    """按瓦片预先计算的区域索引
+
+    每个瓦片保存一个字节的区域类型位掩码（覆盖该瓦片的所有区域类型）和覆盖它的第一个区域的下标，
+    因此“(x, y)是否在种植区内”“(x, y)属于哪个区域”都是O(1)查询，与区域数量无关。
+    区域创建、加载或调整大小后需要调用rebuild重建（Area.resize会自动重建它所在的索引）。
+    农场网格之外的坐标没有预先计算，查询时逐个区域检查。
+    """
+
+    def __init__(self, width, height):
+        """初始化空索引
+
+        Args:
+            width: 农场宽度（瓦片数）
+            height: 农场高度（瓦片数）
+        """
+        self.width = width
+        self.height = height
+        self.areas = []
+        self.type_bits = {}  # {区域类型: 位}
+        for area_type in (Area.PLANTING, Area.BREEDING, Area.HOUSING, Area.GENERAL):
+            self._bit_for(area_type)
+        self.bits = bytearray(width * height)
+        self.owners = array("i", [-1]) * (width * height)  # 覆盖瓦片的第一个区域在areas中的下标，-1表示没有
+
+    def _bit_for(self, area_type):
+        """区域类型对应的位（新的类型按顺序分配，最多8种）"""
+        bit = self.type_bits.get(area_type)
+        if bit is None:
+            if len(self.type_bits) >= 8:
+                raise ValueError(f"区域类型过多，无法加入: {area_type}")
+            bit = self.type_bits[area_type] = 1 << len(self.type_bits)
+        return bit
+
+    def rebuild(self, areas=None):
+        """根据区域列表重建索引
+
+        Args:
+            areas: 区域列表，None表示使用上次的列表（例如某个区域调整大小后）
+        """
+        if areas is not None:
+            self.areas = areas
+        width = self.width
+        self.bits = bytearray(width * self.height)
+        self.owners = array("i", [-1]) * (width * self.height)
+        # 倒序写入，使重叠时列表中靠前的区域作为瓦片的所属区域（与逐个区域检查时先找到的区域一致）
+        for index in range(len(self.areas) - 1, -1, -1):
+            area = self.areas[index]
+            area.zone_map = self
+            bit = self._bit_for(area.area_type)
+            start_x = max(0, area.x)
+            end_x = min(width, area.x + area.width)
+            if start_x >= end_x:
+                continue
+            for y in range(max(0, area.y), min(self.height, area.y + area.height)):
+                row = y * width
+                for i in range(row + start_x, row + end_x):
+                    self.bits[i] |= bit
+                self.owners[row + start_x:row + end_x] = array("i", [index]) * (end_x - start_x)
+
+    def _in_bounds(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def contains(self, x, y, area_type):
+        """检查(x, y)是否在某种类型的区域内
+
+        Args:
+            x: X坐标（瓦片坐标）
+            y: Y坐标（瓦片坐标）
+            area_type: 区域类型
+
+        Returns:
+            是否在该类型的区域内
+        """
+        if self._in_bounds(x, y):
+            return bool(self.bits[y * self.width + x] & self.type_bits.get(area_type, 0))
+        return any(area.area_type == area_type and area.contains_point(x, y) for area in self.areas)
+
+    def area_at(self, x, y):
+        """覆盖(x, y)的区域（重叠时返回列表中靠前的区域）
+
+        Args:
+            x: X坐标（瓦片坐标）
+            y: Y坐标（瓦片坐标）
+
+        Returns:
+            区域，没有时返回None
+        """
+        if self._in_bounds(x, y):
+            index = self.owners[y * self.width + x]
+            return self.areas[index] if index >= 0 else None
+        for area in self.areas:
+            if area.contains_point(x, y):
+                return area
+        return None
+
+    def area_type_at(self, x, y):
+        """覆盖(x, y)的区域类型，没有时返回None"""
+        area = self.area_at(x, y)
+        return area.area_type if area is not None else None
+
+    def tiles(self, area_type):
+        """农场网格内某种类型区域覆盖的所有瓦片（按行排列）
+
+        Args:
+            area_type: 区域类型
+
+        Returns:
+            [(x, y), ...]
+        """
+        bit = self.type_bits.get(area_type, 0)
+        width = self.width
+        return [(index % width, index // width) for index, bits in enumerate(self.bits) if bits & bit]
+
+    def mask(self, area_type):
+        """某种类型区域覆盖的瓦片掩码，供渲染和寻路使用
+
+        Args:
+            area_type: 区域类型
+
+        Returns:
+            形状为(高度, 宽度)的布尔数组
+        """
+        if np is None:
+            raise ImportError("区域掩码需要安装numpy")
+        bits = np.frombuffer(self.bits, dtype=np.uint8).reshape(self.height, self.width)
+        return (bits & self.type_bits.get(area_type, 0)) != 0
@@ -12,7 +12,14 @@ from database.db_manager import DatabaseManager
 # 导入图像管理器
 from utils.image_manager import ImageManager
 
+# 导入字体管理器和调试面板
+from utils.font_manager import font_manager
+from utils.debug_hud import DebugHud
+from utils.profiler import profiler
+from utils.sim_clock import SimClock
+
 # 导入场景
+from scenes.loading_scene import LoadingScene
 from scenes.main_menu import MainMenu
 from scenes.farm_scene import FarmScene
 from scenes.market_scene import MarketScene
@@ -29,13 +36,32 @@ class Game:
         # 创建游戏窗口
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         self.clock = pygame.time.Clock()
+        self.frame_time = 0.0  # 上一帧的时长（秒）
+        
+        # 固定步长模拟时钟，场景的fixed_update以TIME_SCALE步/秒执行，与渲染帧率无关
+        self.sim_clock = SimClock(
+            TIME_SCALE,
+            speeds=SIM_SPEEDS,
+            max_frame_time=SIM_MAX_FRAME_TIME,
+            max_steps_per_frame=SIM_MAX_STEPS_PER_FRAME
+        )
+        dump_path = os.path.join(os.path.dirname(__file__), PROFILER_DUMP_PATH) if PROFILER_DUMP_PATH else None
+        self.debug_hud = DebugHud(self.clock, visible=DEBUG_HUD, dump_path=dump_path)
         
         # 初始化数据库
         db_path = os.path.join(os.path.dirname(__file__), "database", "game.db")
-        self.db = DatabaseManager(db_path)
+        self.db = DatabaseManager(
+            db_path,
+            write_behind=DB_WRITE_BEHIND,
+            flush_interval=DB_FLUSH_INTERVAL,
+            pragmas=DB_PROFILES[DB_PROFILE]
+        )
         
         # 初始化图像管理器
-        self.image_manager = ImageManager()
+        cache_dir = os.path.join(os.path.dirname(__file__), ASSET_CACHE_DIR) if ASSET_CACHE_DIR else None
+        self.image_manager = ImageManager(cache_dir=cache_dir)
+        if ATLAS_ENABLED and not PRELOAD_ENABLED:
+            self.image_manager.load_atlas(ATLAS_SIZES, ATLAS_PAGE_SIZE)
         
         # 设置全局图像管理器实例
         from utils.image_manager import set_image_manager
@@ -48,13 +74,17 @@ class Game:
         
         # 场景字典
         self.scenes = {
+            "loading": lambda: LoadingScene(self),
             "main_menu": lambda: MainMenu(self),
             "farm": lambda: FarmScene(self),
             "market": lambda: MarketScene(self)
         }
         
-        # 默认进入主菜单
-        self.change_scene("main_menu")
+        # 默认进入主菜单，启用预加载时先进入加载界面
+        if PRELOAD_ENABLED:
+            self.change_scene("loading", next_scene="main_menu")
+        else:
+            self.change_scene("main_menu")
     
     def change_scene(self, scene_name, **kwargs):
         """切换场景
@@ -64,8 +94,13 @@ class Game:
             **kwargs: 传递给场景的参数
         """
         if scene_name in self.scenes:
+            # 切换场景前提交所有延迟的数据库修改
+            self.db.flush()
             self.current_scene = self.scenes[scene_name]()
             self.current_scene.setup(**kwargs)
+            # 不补算加载新场景期间的时间
+            self.sim_clock.reset()
+            self.clock.tick()
         else:
             print(f"错误：场景 {scene_name} 不存在")
     
@@ -83,27 +118,54 @@ class Game:
     def run(self):
         """游戏主循环"""
         while self.running:
+            profiler.begin_frame()
+            
             # 处理事件
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                elif self.current_scene:
-                    self.current_scene.handle_event(event)
+            with profiler.scope("game.events"):
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        self.running = False
+                    elif self.debug_hud.handle_event(event):
+                        continue
+                    elif self.current_scene:
+                        self.current_scene.handle_event(event)
             
-            # 更新当前场景
-            if self.current_scene:
-                self.current_scene.update()
+            # 按固定步长推进模拟，然后每帧更新一次场景
+            with profiler.scope("game.update"):
+                steps = self.sim_clock.advance(self.frame_time)
+                scene = self.current_scene
+                fixed_update = getattr(scene, "fixed_update", None)
+                if fixed_update:
+                    for _ in range(steps):
+                        fixed_update(self.sim_clock.dt)
+                        # 模拟中切换了场景时剩余的步数不再执行
+                        if self.current_scene is not scene:
+                            break
+                if self.current_scene:
+                    self.current_scene.update()
             
             # 渲染当前场景
-            self.screen.fill(BLACK)  # 清空屏幕
-            if self.current_scene:
-                self.current_scene.render(self.screen)
+            with profiler.scope("game.render"):
+                self.screen.fill(BLACK)  # 清空屏幕
+                if self.current_scene:
+                    if hasattr(self.current_scene, "fixed_update"):
+                        self.current_scene.sim_alpha = self.sim_clock.alpha
+                    self.current_scene.render(self.screen)
+                self.debug_hud.render(self.screen, self.current_scene)
+            font_manager.end_frame()
             
             # 更新显示
-            pygame.display.flip()
+            with profiler.scope("game.flip"):
+                pygame.display.flip()
             
-            # 控制帧率
-            self.clock.tick(FPS)
+            # 按间隔提交延迟的数据库修改
+            self.db.maybe_flush()
+            
+            # 帧耗时不包括下面等待下一帧的时间
+            profiler.end_frame()
+            
+            # 控制帧率（模拟速度不受帧率影响）
+            self.frame_time = self.clock.tick(FPS) / 1000
         
         # 游戏结束，清理资源
         self.quit()
@@ -114,6 +176,10 @@ class Game:
         if hasattr(self, 'db'):
             self.db.close()
         
+        # 导出帧耗时分析样本
+        if hasattr(self, 'debug_hud') and profiler.enabled:
+            self.debug_hud.dump()
+        
         # 退出pygame
         pygame.quit()
         sys.exit()
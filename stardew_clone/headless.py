@@ -0,0 +1,219 @@
+"""无窗口模拟模式：不创建窗口、不渲染，按脚本操作农场并推进游戏天数，结果写入SQLite
+
+可以在没有显示器和GPU的CI机器上对大型农场做长时间的稳定性测试，并测量模拟吞吐量（天/秒）。
+
+用法（在stardew_clone目录下）：
+    python headless.py --days 1000 --crops 10000
+    python headless.py --db database/game.db --player-id 1 --days 7
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+
+# 使用虚拟的视频/音频驱动，模拟不需要窗口和声卡（必须在初始化pygame之前设置）
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# 游戏代码使用相对于游戏根目录的导入和资源路径
+GAME_ROOT = os.path.dirname(os.path.abspath(__file__))
+if GAME_ROOT not in sys.path:
+    sys.path.insert(0, GAME_ROOT)
+
+import pygame
+from config import *
+from database.db_manager import DatabaseManager
+
+
+class HeadlessGame:
+    """无窗口的游戏对象，提供场景模拟需要的screen/db/player_id
+
+    screen是普通的离屏表面（只用于查询尺寸），不调用pygame.display.set_mode；
+    没有image_manager，场景在headless为True时跳过装饰生成和音乐。
+    """
+
+    # 场景据此跳过只与渲染有关的准备工作
+    headless = True
+
+    def __init__(self, db_path, write_behind=DB_WRITE_BEHIND):
+        """初始化
+
+        Args:
+            db_path: 数据库文件路径
+            write_behind: 是否启用数据库延迟写入
+        """
+        pygame.init()
+        self.screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.clock = pygame.time.Clock()
+        self.db = DatabaseManager(db_path, write_behind=write_behind, pragmas=DB_PROFILES[DB_PROFILE])
+        self.player_id = None
+        self.scene_requests = []  # 场景请求切换的记录，模拟中不切换场景
+
+    def set_player(self, player_id):
+        """设置当前玩家ID
+
+        Args:
+            player_id: 玩家ID
+        """
+        self.player_id = player_id
+
+    def change_scene(self, scene_name, **kwargs):
+        """记录场景切换请求（模拟中始终停留在农场）"""
+        self.scene_requests.append(scene_name)
+
+    def quit(self):
+        """提交所有修改并关闭数据库"""
+        self.db.close()
+        pygame.quit()
+
+
+class FarmSimulation:
+    """农场模拟：每天早上按脚本在种植区内劳作，然后结束当天
+
+    脚本按游戏规则调用FarmScene.use_tool/use_item（消耗能量、只能在种植区耕种），
+    对种植区内的每个瓦片：空地用锄头耕地，耕地种下种子，成熟的作物用镰刀收获，其余作物浇水。
+    模拟中种子不从物品栏扣除。
+    """
+
+    def __init__(self, game, seed=None, sprinklers=False):
+        """初始化模拟
+
+        Args:
+            game: HeadlessGame实例（需要已设置player_id）
+            seed: 随机数种子（天气），None表示不固定
+            sprinklers: 每天早上是否给所有作物浇水（相当于洒水器，让种植区外的大片作物也能生长）
+        """
+        from scenes.farm_scene import FarmScene
+        from entities.area import Area
+
+        if seed is not None:
+            random.seed(seed)
+        self.game = game
+        self.sprinklers = sprinklers
+        self.scene = FarmScene(game)
+        self.scene.setup()
+
+        # 种植区内的瓦片，按行排列
+        self.planting_tiles = self.scene.zones.tiles(Area.PLANTING)
+        self.crop_types = list(CROP_TYPES)
+        self.stats = {"days": 0, "tilled": 0, "planted": 0, "watered": 0, "harvested": 0}
+
+    def run_day(self):
+        """模拟一天：早上劳作，然后结束当天"""
+        if self.sprinklers:
+            self.water_field()
+        for index, (x, y) in enumerate(self.planting_tiles):
+            self.work_tile(x, y, self.crop_types[index % len(self.crop_types)])
+        self.scene.end_day()
+        self.stats["days"] += 1
+
+    def run(self, days):
+        """连续模拟多天
+
+        Args:
+            days: 天数
+        """
+        for _ in range(days):
+            self.run_day()
+
+    def water_field(self):
+        """给所有未浇水的作物浇水（一条UPDATE）"""
+        for crop in self.scene.crops:
+            if not crop.is_watered and not crop.is_fully_grown():
+                crop.is_watered = True
+                self.stats["watered"] += 1
+        self.game.db.water_all_crops(self.game.player_id)
+
+    def work_tile(self, x, y, crop_type):
+        """对一个瓦片执行当天的操作
+
+        Args:
+            x: 瓦片X坐标
+            y: 瓦片Y坐标
+            crop_type: 在耕地上种植的作物类型
+        """
+        scene = self.scene
+        tile = scene.grid[y][x]
+        if tile is None:
+            scene.use_tool({"tool_name": "锄头"}, x, y)
+            if scene.grid[y][x] is not None:
+                self.stats["tilled"] += 1
+        elif tile["type"] == "tilled":
+            scene.use_item({"item_type": "种子", "item_name": f"{crop_type}种子"}, x, y)
+            if scene.grid[y][x]["type"] == "crop":
+                self.stats["planted"] += 1
+        elif tile["type"] == "crop":
+            crop = scene.crops.get(tile["id"])
+            if crop is None:
+                return
+            if crop.is_fully_grown():
+                scene.use_tool({"tool_name": "镰刀"}, x, y)
+                if scene.grid[y][x]["type"] == "tilled":
+                    self.stats["harvested"] += 1
+            elif not crop.is_watered:
+                scene.use_tool({"tool_name": "水壶"}, x, y)
+                if crop.is_watered:
+                    self.stats["watered"] += 1
+
+
+def plant_large_field(db, player_id, count):
+    """在农场网格下方种下count株作物，模拟大型农场（不占用种植区）
+
+    Args:
+        db: 数据库管理器实例
+        player_id: 玩家ID
+        count: 作物数量
+    """
+    crop_types = list(CROP_TYPES)
+    for i in range(count):
+        db.add_crop(player_id, crop_types[i % len(crop_types)], i % FARM_WIDTH, FARM_HEIGHT + i // FARM_WIDTH)
+    db.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="无窗口农场模拟")
+    parser.add_argument("--days", type=int, default=1000, help="模拟天数")
+    parser.add_argument("--crops", type=int, default=0, help="新玩家额外种下的作物数量（大型农场）")
+    parser.add_argument("--db", help="数据库文件路径，默认使用临时文件")
+    parser.add_argument("--player-id", type=int, help="继续模拟已有的玩家，默认创建新玩家")
+    parser.add_argument("--seed", type=int, default=0, help="天气随机数种子")
+    parser.add_argument("--sprinklers", action="store_true", help="每天早上给所有作物浇水")
+    args = parser.parse_args()
+
+    db_path = args.db or os.path.join(tempfile.mkdtemp(prefix="farm_headless_"), "headless.db")
+    game = HeadlessGame(db_path)
+    if args.player_id is None:
+        game.set_player(game.db.create_new_player("模拟"))
+        if args.crops:
+            plant_large_field(game.db, game.player_id, args.crops)
+    else:
+        game.set_player(args.player_id)
+
+    setup_start = time.perf_counter()
+    simulation = FarmSimulation(game, seed=args.seed, sprinklers=args.sprinklers)
+    start_day = simulation.scene.day
+    setup_time = time.perf_counter() - setup_start
+
+    start = time.perf_counter()
+    simulation.run(args.days)
+    elapsed = time.perf_counter() - start
+
+    # 确认结果已经持久化
+    persisted_day = game.db.get_player(game.player_id)["day"]
+    flush_stats = game.db.flush()
+    game.quit()
+
+    print(f"数据库: {db_path}")
+    print(f"玩家: {game.player_id}，作物: {len(simulation.scene.crops)}，场景加载: {setup_time * 1000:.1f} ms")
+    print(f"模拟 {args.days} 天（第 {start_day} 天到第 {persisted_day} 天）: {elapsed:.2f} s，{args.days / elapsed:.1f} 天/秒")
+    print("操作: " + "，".join(f"{name} {count}" for name, count in simulation.stats.items()))
+    print(f"数据库提交: {flush_stats['flush_count']} 次，共 {flush_stats['total_rows']} 行")
+    if persisted_day != start_day + args.days:
+        print(f"错误：数据库中的天数 {persisted_day} 与模拟结果 {start_day + args.days} 不一致")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
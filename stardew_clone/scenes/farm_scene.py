@@ -2,14 +2,22 @@ import pygame
 import datetime
 import random
 import math
-from config import FARM_WIDTH, FARM_HEIGHT, TILE_SIZE, ENERGY_COSTS
+from config import FARM_WIDTH, FARM_HEIGHT, TILE_SIZE, ENERGY_COSTS, RENDER_CHUNK_SIZE, RENDER_MAX_CACHED_CHUNKS, DAY_LENGTH, CROP_FIELD_ENABLED
 from entities.inventory import Inventory
 from entities.crop import Crop
+from entities.crop_field import CropField
+from entities.crop_registry import CropRegistry
+from entities.farm_grid import FarmGrid
 from entities.animal import Animal
 from entities.area import Area
+from entities.zone_map import ZoneMap
 from utils.font_manager import font_manager
 from utils.audio_manager import audio_manager
 from utils.image_manager import image_manager
+from utils.tile_map_renderer import TileMapRenderer
+from utils.sprite_layer import SpriteLayer
+from utils.render_queue import RenderQueue
+from utils.profiler import profiler
 
 class FarmScene:
     """农场场景，游戏的主要场景"""
@@ -27,8 +35,15 @@ class FarmScene:
         self.font = font_manager.get_font(20)
         self.font_medium = font_manager.get_font(28)
         
-        # 农场网格
-        self.grid = [[None for _ in range(FARM_WIDTH)] for _ in range(FARM_HEIGHT)]
+        # 农场网格（每个瓦片一个字节的状态码，grid[y][x]仍返回None或瓦片视图）
+        self.grid = FarmGrid(FARM_WIDTH, FARM_HEIGHT)
+        
+        # 农场地面的分块渲染器，瓦片变化时通过set_tile/invalidate_tile标记重绘
+        self.tile_renderer = TileMapRenderer(
+            FARM_WIDTH, FARM_HEIGHT, TILE_SIZE,
+            chunk_size=RENDER_CHUNK_SIZE,
+            max_cached_chunks=RENDER_MAX_CACHED_CHUNKS
+        )
         
         # 玩家
         self.player = None
@@ -36,8 +51,11 @@ class FarmScene:
         # 物品栏
         self.inventory = None
         
-        # 作物列表
-        self.crops = []
+        # 作物登记表（可按ID和瓦片坐标O(1)查找）
+        self.crops = CropRegistry()
+        
+        # 作物的列式存储（启用且安装了numpy时），结束当天时向量化计算生长
+        self.crop_field = None
         
         # 动物列表
         self.animals = []
@@ -45,20 +63,34 @@ class FarmScene:
         # 区域列表
         self.areas = []
         
+        # 按瓦片预先计算的区域索引，区域创建或加载后重建
+        self.zones = ZoneMap(FARM_WIDTH, FARM_HEIGHT)
+        
         # 装饰树木列表
         self.trees = []
         
         # 农场外的花草装饰列表
         self.decorations = []
         
+        # 预先变换好的树木和花草精灵，按视口裁剪后绘制
+        self.tree_layer = SpriteLayer(bucket_size=TILE_SIZE * RENDER_CHUNK_SIZE)
+        self.decoration_layer = SpriteLayer(bucket_size=TILE_SIZE * RENDER_CHUNK_SIZE)
+        
+        # 区域、作物、动物、房屋和玩家的渲染队列，render_stats为上一帧的渲染统计
+        self.render_queue = RenderQueue()
+        self.render_stats = self.render_queue.stats
+        
         # 相机偏移
         self.camera_x = 0
         self.camera_y = 0
         
-        # 游戏时间
+        # 游戏时间（由fixed_update按固定步长推进）
         self.game_time = 0  # 游戏内分钟数
         self.day = 1
         
+        # 渲染插值系数（0到1），由游戏主循环在渲染前根据模拟时钟设置
+        self.sim_alpha = 1.0
+        
         # 天气系统
         self.weather = "晴天"  # 默认为晴天，可选值："晴天"、"雨天"
         self.rain_drops = []  # 雨滴效果
@@ -74,15 +106,21 @@ class FarmScene:
         self.menu_options = ["前往市场", "睡觉 (结束当天)", "保存并退出"]
         self.selected_menu_option = 0
     
+    def set_tile(self, x, y, tile):
+        """设置网格中的瓦片，并标记其所在的渲染区块需要重绘
+        
+        Args:
+            x: 瓦片X坐标
+            y: 瓦片Y坐标
+            tile: 瓦片数据，None表示空地
+        """
+        self.grid.set(x, y, tile)
+        self.tile_renderer.invalidate_tile(x, y)
+    
     def save_tilled_land(self):
         """保存所有耕地状态到数据库或存档文件"""
         # 示例：保存为玩家自定义表或json字段，具体实现需结合你的db_manager
-        tilled_list = []
-        for y in range(FARM_HEIGHT):
-            for x in range(FARM_WIDTH):
-                tile = self.grid[y][x]
-                if tile and tile["type"] == "tilled":
-                    tilled_list.append({"x": x, "y": y, "watered": tile.get("watered", False)})
+        tilled_list = [{"x": x, "y": y, "watered": watered} for x, y, watered in self.grid.tilled_tiles()]
         self.db.save_tilled_land(self.game.player_id, tilled_list)
     
     def load_areas(self):
@@ -152,7 +190,7 @@ class FarmScene:
             for info in tilled_list:
                 x, y = info["x"], info["y"]
                 if 0 <= x < FARM_WIDTH and 0 <= y < FARM_HEIGHT:
-                    self.grid[y][x] = {"type": "tilled", "watered": info.get("watered", False)}
+                    self.grid.set_tilled(x, y, bool(info.get("watered", False)))
     
     def setup(self, **kwargs):
         """设置场景参数
@@ -169,6 +207,9 @@ class FarmScene:
             self.day = player_data["day"]
         else:
             self.day = 1
+        # 恢复天气
+        if player_data and player_data.get("weather"):
+            self.weather = player_data["weather"]
         
         # 初始化物品栏
         self.inventory = Inventory(self.db, self.game.player_id, game=self.game)
@@ -186,6 +227,16 @@ class FarmScene:
         # 如果没有区域，创建默认区域
         if not self.areas:
             self.create_default_areas()
+        self.zones.rebuild(self.areas)
+        
+        # 读档时正在下雨：初始化雨滴并浇灌所有作物
+        if self.weather == "雨天":
+            self.init_rain_drops()
+            self.auto_water_crops()
+        
+        # 无窗口模拟模式（见headless.py）只运行模拟，不需要装饰和音乐
+        if getattr(self.game, "headless", False):
+            return
             
         # 生成装饰树木
         self.generate_trees()
@@ -198,25 +249,19 @@ class FarmScene:
     
     def load_crops(self):
         """从数据库加载作物"""
-        self.crops = []
-        crops_data = self.db.get_crops(self.game.player_id)
+        # 一次查询取回所有作物行，直接用行数据构建对象
+        self.crops = CropRegistry(Crop.load_for_player(self.db, self.game.player_id, game=self.game))
+        if CROP_FIELD_ENABLED and CropField.available():
+            self.crop_field = CropField.from_crops(self.crops)
         
-        for crop_data in crops_data:
-            crop = Crop(self.db, crop_data["id"], load_from_db=True, game=self.game)
-            self.crops.append(crop)
-            
+        for crop in self.crops:
             # 更新农场网格
             if 0 <= crop.x < FARM_WIDTH and 0 <= crop.y < FARM_HEIGHT:
-                self.grid[crop.y][crop.x] = {"type": "crop", "id": crop.id}
+                self.grid.set_crop(crop.x, crop.y, crop.id)
     
     def load_animals(self):
         """从数据库加载动物"""
-        self.animals = []
-        animals_data = self.db.get_animals(self.game.player_id)
-        
-        for animal_data in animals_data:
-            animal = Animal(self.db, animal_data["id"], load_from_db=True, game=self.game)
-            self.animals.append(animal)
+        self.animals = Animal.load_for_player(self.db, self.game.player_id, game=self.game)
             
     def generate_trees(self):
         """生成装饰性树木
@@ -279,6 +324,17 @@ class FarmScene:
                             nx, ny = x + dx, y + dy
                             if 0 <= nx < FARM_WIDTH and 0 <= ny < FARM_HEIGHT:
                                 occupied[ny][nx] = True
+        
+        # 树木生成后不再变化，一次性完成缩放
+        self.tree_layer.clear()
+        for tree in self.trees:
+            x, y = tree["position"]
+            image = tree["image"]
+            width = int(image.get_width() * tree["size"])
+            height = int(image.get_height() * tree["size"])
+            scaled_image = pygame.transform.scale(image, (width, height))
+            self.tree_layer.add(scaled_image, x * TILE_SIZE - width // 4, y * TILE_SIZE - height // 2, data=tree)
+        self.tree_layer.build()
     
     def generate_decorations(self):
         """生成农场外的花草装饰
@@ -376,6 +432,28 @@ class FarmScene:
                 "rotation": random.uniform(0, 360),  # 随机旋转角度
                 "z_index": random.randint(0, 2)  # 随机深度，用于层次感
             })
+        
+        # 装饰生成后不再变化，一次性完成缩放和旋转，并按z_index排序
+        self.decoration_layer.clear()
+        for decoration in self.decorations:
+            x, y = decoration["position"]
+            image = decoration["image"]
+            width = int(image.get_width() * decoration["size"])
+            height = int(image.get_height() * decoration["size"])
+            scaled_image = pygame.transform.scale(image, (width, height))
+            rotated_image = pygame.transform.rotate(scaled_image, decoration["rotation"])
+            
+            # 缩放后的尺寸用于雨天的闪光效果
+            decoration["width"] = width
+            decoration["height"] = height
+            self.decoration_layer.add(
+                rotated_image,
+                x * TILE_SIZE - rotated_image.get_width() // 2,
+                y * TILE_SIZE - rotated_image.get_height() // 2,
+                z_index=decoration["z_index"],
+                data=decoration
+            )
+        self.decoration_layer.build()
     
     def render_trees(self, screen):
         """渲染装饰性树木
@@ -383,28 +461,7 @@ class FarmScene:
         Args:
             screen: pygame屏幕对象
         """
-        for tree in self.trees:
-            x, y = tree["position"]
-            image = tree["image"]
-            size = tree["size"]
-            
-            # 计算屏幕位置
-            screen_x = x * TILE_SIZE - self.camera_x
-            screen_y = y * TILE_SIZE - self.camera_y
-            
-            # 扩大渲染范围，确保即使玩家移动到农场边界外，树木仍然可见
-            if (-TILE_SIZE * 5 < screen_x < screen.get_width() + TILE_SIZE * 5 and
-                -TILE_SIZE * 5 < screen_y < screen.get_height() + TILE_SIZE * 5):
-                
-                # 计算缩放后的尺寸
-                width = int(image.get_width() * size)
-                height = int(image.get_height() * size)
-                
-                # 缩放图像
-                scaled_image = pygame.transform.scale(image, (width, height))
-                
-                # 绘制树木
-                screen.blit(scaled_image, (screen_x - width // 4, screen_y - height // 2))
+        self.tree_layer.render(screen, self.camera_x, self.camera_y)
     
     def render_decorations(self, screen):
         """渲染农场外的花草装饰
@@ -412,47 +469,27 @@ class FarmScene:
         Args:
             screen: pygame屏幕对象
         """
-        # 按z_index排序装饰元素，确保正确的层次感
-        sorted_decorations = sorted(self.decorations, key=lambda x: x["z_index"])
+        # 装饰已按z_index排序，只绘制与屏幕相交的部分
+        visible = self.decoration_layer.render(screen, self.camera_x, self.camera_y)
         
-        for decoration in sorted_decorations:
-            x, y = decoration["position"]
-            image = decoration["image"]
-            size = decoration["size"]
-            rotation = decoration["rotation"]
-            
-            # 计算屏幕位置
-            screen_x = x * TILE_SIZE - self.camera_x
-            screen_y = y * TILE_SIZE - self.camera_y
-            
-            # 扩大渲染范围，确保即使玩家移动到农场边界外，装饰元素仍然可见
-            if (-TILE_SIZE * 15 < screen_x < screen.get_width() + TILE_SIZE * 15 and
-                -TILE_SIZE * 15 < screen_y < screen.get_height() + TILE_SIZE * 15):
-                
-                # 计算缩放后的尺寸
-                width = int(image.get_width() * size)
-                height = int(image.get_height() * size)
-                
-                # 缩放图像
-                scaled_image = pygame.transform.scale(image, (width, height))
-                
-                # 旋转图像
-                rotated_image = pygame.transform.rotate(scaled_image, rotation)
-                
-                # 获取旋转后的矩形，以便正确定位
-                rot_rect = rotated_image.get_rect(center=(width//2, height//2))
-                
-                # 绘制装饰元素
-                screen.blit(rotated_image, (screen_x - rot_rect.width//2, screen_y - rot_rect.height//2))
+        # 如果是雨天，为花朵添加雨滴效果
+        if self.weather == "雨天":
+            for sprite in visible:
+                decoration = sprite["data"]
+                if "flower" not in decoration["type"]:
+                    continue
                 
-                # 如果是雨天，为花朵添加雨滴效果
-                if self.weather == "雨天" and "flower" in decoration["type"]:
-                    # 随机添加雨滴效果（闪光点）
-                    if random.random() < 0.05:  # 5%的概率在每一帧添加闪光
-                        drop_x = screen_x + random.randint(0, width) - width//2
-                        drop_y = screen_y + random.randint(0, height//2) - height//4
-                        drop_size = random.randint(1, 3)
-                        pygame.draw.circle(screen, (220, 220, 255), (drop_x, drop_y), drop_size)
+                # 随机添加雨滴效果（闪光点）
+                if random.random() < 0.05:  # 5%的概率在每一帧添加闪光
+                    x, y = decoration["position"]
+                    width = decoration["width"]
+                    height = decoration["height"]
+                    screen_x = x * TILE_SIZE - self.camera_x
+                    screen_y = y * TILE_SIZE - self.camera_y
+                    drop_x = screen_x + random.randint(0, width) - width//2
+                    drop_y = screen_y + random.randint(0, height//2) - height//4
+                    drop_size = random.randint(1, 3)
+                    pygame.draw.circle(screen, (220, 220, 255), (drop_x, drop_y), drop_size)
     
     def handle_event(self, event):
         """处理输入事件
@@ -496,6 +533,11 @@ class FarmScene:
             # 打开菜单
             elif event.key == pygame.K_ESCAPE:
                 self.show_menu = True
+            # 切换时间快进倍数
+            elif event.key == pygame.K_TAB:
+                sim_clock = getattr(self.game, "sim_clock", None)
+                if sim_clock:
+                    self.show_status(f"时间流速: x{sim_clock.cycle_speed()}")
         # 新增：处理鼠标点击动物
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             mouse_x, mouse_y = event.pos
@@ -508,13 +550,7 @@ class FarmScene:
                     # 检查是否在饲养区内
                     tile_x = int(animal.x / TILE_SIZE)
                     tile_y = int(animal.y / TILE_SIZE)
-                    in_breeding_area = False
-                    for area in self.areas:
-                        if area.area_type == Area.BREEDING and area.contains_point(tile_x, tile_y):
-                            in_breeding_area = True
-                            break
-                    
-                    if not in_breeding_area:
+                    if not self.zones.contains(tile_x, tile_y, Area.BREEDING):
                         self.show_status(f"{animal.name}不在饲养区内，无法互动！")
                         return
                     
@@ -524,7 +560,7 @@ class FarmScene:
                         result = animal.collect_product()
                         if result:
                             product_name, qty, exp = result
-                            self.db.add_inventory_item(self.game.player_id, product_name, qty, "动物产品")
+                            self.inventory.add_item(product_name, qty, "动物产品")
                             self.show_status(f"收获{animal.name}的{product_name}！")
                             return
                     
@@ -657,13 +693,7 @@ class FarmScene:
         
         if tool["tool_name"] == "锄头":
             # 严格检查是否在种植区内
-            in_planting_area = False
-            for area in self.areas:
-                if area.area_type == Area.PLANTING and area.contains_point(tile_x, tile_y):
-                    in_planting_area = True
-                    break
-            
-            if not in_planting_area:
+            if not self.zones.contains(tile_x, tile_y, Area.PLANTING):
                 self.show_status("只能在种植区内使用锄头！")
                 return
                 
@@ -673,9 +703,9 @@ class FarmScene:
                 return
             
             # 检查瓦片是否为空
-            if self.grid[tile_y][tile_x] is None:
-                # 耕地
-                self.grid[tile_y][tile_x] = {"type": "tilled", "watered": False}
+            if self.grid.code(tile_x, tile_y) == FarmGrid.EMPTY:
+                # 耕地（雨天新耕的地直接是湿的）
+                self.set_tile(tile_x, tile_y, {"type": "tilled", "watered": self.weather == "雨天"})
                 # 播放锄地音效
                 audio_manager.play_sound("hoe")
                 self.show_status("耕地成功！")
@@ -689,26 +719,26 @@ class FarmScene:
                 return
             
             # 检查是否有作物或耕地
-            tile = self.grid[tile_y][tile_x]
-            if tile and tile["type"] == "tilled":
+            code = self.grid.code(tile_x, tile_y)
+            if code == FarmGrid.TILLED or code == FarmGrid.WATERED:
                 # 浇水
-                tile["watered"] = True
+                self.grid.set_tilled(tile_x, tile_y, watered=True)
+                self.tile_renderer.invalidate_tile(tile_x, tile_y)
                 # 播放浇水音效
                 audio_manager.play_sound("water")
                 self.show_status("浇水成功！")
-            elif tile and tile["type"] == "crop":
+            elif code == FarmGrid.CROP:
                 # 找到对应的作物对象
-                for crop in self.crops:
-                    if crop.id == tile["id"]:
-                        if crop.is_fully_grown():
-                            self.show_status("这株作物已经成熟，不需要浇水！")
-                        elif crop.water():
-                            # 播放浇水音效
-                            audio_manager.play_sound("water")
-                            self.show_status("浇水成功！")
-                        else:
-                            self.show_status("这株作物今天已经浇过水了！")
-                        break
+                crop = self.crops.get(self.grid.crop_id(tile_x, tile_y))
+                if crop is not None:
+                    if crop.is_fully_grown():
+                        self.show_status("这株作物已经成熟，不需要浇水！")
+                    elif crop.water():
+                        # 播放浇水音效
+                        audio_manager.play_sound("water")
+                        self.show_status("浇水成功！")
+                    else:
+                        self.show_status("这株作物今天已经浇过水了！")
             else:
                 self.show_status("这里没有需要浇水的地方！")
         
@@ -719,38 +749,39 @@ class FarmScene:
                 return
             
             # 检查是否有成熟的作物
-            tile = self.grid[tile_y][tile_x]
-            if tile and tile["type"] == "crop":
+            crop_id = self.grid.crop_id(tile_x, tile_y)
+            if crop_id is not None:
                 # 找到对应的作物对象
-                for i, crop in enumerate(self.crops):
-                    if crop.id == tile["id"] and crop.is_fully_grown():
-                        # 收获作物
-                        harvest_result = crop.harvest()
-                        if harvest_result:
-                            crop_name, quantity, exp = harvest_result
-                            
-                            # 添加到物品栏
-                            self.player.add_item(crop_name, quantity, "作物")
-                            
-                            # 增加经验
-                            level_up = self.player.add_exp(exp)
-                            
-                            # 从列表中移除作物
-                            self.crops.pop(i)
-                            
-                            # 清除网格
-                            self.grid[tile_y][tile_x] = {"type": "tilled", "watered": False}
-                            
-                            # 播放收获音效
-                            audio_manager.play_sound("axe")
-                            
-                            if level_up:
-                                # 播放升级音效
-                                audio_manager.play_sound("success")
-                                self.show_status(f"收获了 {crop_name}！升级了！")
-                            else:
-                                self.show_status(f"收获了 {crop_name}！+{exp}经验")
-                        break
+                crop = self.crops.get(crop_id)
+                if crop is not None and crop.is_fully_grown():
+                    # 收获作物
+                    harvest_result = crop.harvest()
+                    if harvest_result:
+                        crop_name, quantity, exp = harvest_result
+                        
+                        # 添加到物品栏
+                        self.inventory.add_item(crop_name, quantity, "作物")
+                        
+                        # 增加经验
+                        level_up = self.player.add_exp(exp)
+                        
+                        # 从登记表中移除作物
+                        self.crops.remove(crop)
+                        if self.crop_field is not None:
+                            self.crop_field.remove(crop)
+                        
+                        # 清除网格
+                        self.set_tile(tile_x, tile_y, {"type": "tilled", "watered": self.weather == "雨天"})
+                        
+                        # 播放收获音效
+                        audio_manager.play_sound("axe")
+                        
+                        if level_up:
+                            # 播放升级音效
+                            audio_manager.play_sound("success")
+                            self.show_status(f"收获了 {crop_name}！升级了！")
+                        else:
+                            self.show_status(f"收获了 {crop_name}！+{exp}经验")
                 else:
                     self.show_status("这株作物还没有成熟！")
             else:
@@ -770,19 +801,13 @@ class FarmScene:
             
         if item["item_type"] == "种子":
             # 严格检查是否在种植区内
-            in_planting_area = False
-            for area in self.areas:
-                if area.area_type == Area.PLANTING and area.contains_point(tile_x, tile_y):
-                    in_planting_area = True
-                    break
-            
-            if not in_planting_area:
+            if not self.zones.contains(tile_x, tile_y, Area.PLANTING):
                 self.show_status("只能在种植区内种植作物！")
                 return
                 
             # 检查瓦片是否为耕地
-            tile = self.grid[tile_y][tile_x]
-            if tile and tile["type"] == "tilled":
+            code = self.grid.code(tile_x, tile_y)
+            if code == FarmGrid.TILLED or code == FarmGrid.WATERED:
                 # 获取作物类型（去掉"种子"后缀）
                 if "item_name" not in item:
                     self.show_status("种子信息不完整！")
@@ -800,18 +825,21 @@ class FarmScene:
                     game=self.game
                 )
                 
-                # 添加到作物列表
-                self.crops.append(crop)
+                # 添加到作物登记表
+                self.crops.add(crop)
+                if self.crop_field is not None:
+                    self.crop_field.add(crop)
+                
+                # 雨天种下的作物直接浇水
+                if self.weather == "雨天":
+                    crop.water()
                 
                 # 更新网格
-                self.grid[tile_y][tile_x] = {"type": "crop", "id": crop.id}
+                self.set_tile(tile_x, tile_y, {"type": "crop", "id": crop.id})
                 
                 # 从物品栏移除种子
                 if "id" in item:
                     self.inventory.remove_item(item["id"], 1)
-                    
-                    # 刷新物品栏
-                    self.inventory.refresh()
                 
                 # 播放种植音效
                 audio_manager.play_sound("plant")
@@ -828,31 +856,35 @@ class FarmScene:
             # 从物品栏移除食物
             if "id" in item:
                 self.inventory.remove_item(item["id"], 1)
-                
-                # 刷新物品栏
-                self.inventory.refresh()
             
             self.show_status(f"恢复了 {energy_restore} 点能量！")
     
-    def update(self):
-        """更新场景状态"""
+    def fixed_update(self, dt):
+        """按固定步长推进模拟，每步为游戏内1分钟
+        
+        Args:
+            dt: 步长对应的现实时间（秒）
+        """
         # 更新游戏时间
         self.game_time += 1
         
         # 检查是否需要结束当天（游戏时间超过一天）
-        if self.game_time >= 24 * 60:  # 24小时 * 60分钟
-            self.end_day()
+        if self.game_time >= DAY_LENGTH:
+            with profiler.scope("farm.end_day"):
+                self.end_day()
         
+        # 更新雨滴效果（浇水只在开始下雨时执行一次，见auto_water_crops）
+        if self.weather == "雨天":
+            self.update_rain_drops(dt)
+    
+    def update(self):
+        """更新场景状态（每帧一次）"""
         # 检查玩家是否进入房屋
         player_tile_x = int(self.player.x / TILE_SIZE)
         player_tile_y = int(self.player.y / TILE_SIZE)
         
         # 检查玩家是否在住宅区内
-        self.player.in_house = False
-        for area in self.areas:
-            if area.area_type == Area.HOUSING and area.contains_point(player_tile_x, player_tile_y):
-                self.player.in_house = True
-                break
+        self.player.in_house = self.zones.contains(player_tile_x, player_tile_y, Area.HOUSING)
         
         # 更新相机位置（始终跟随玩家，保持玩家在屏幕中心）
         screen_width = self.game.screen.get_width()
@@ -861,30 +893,31 @@ class FarmScene:
         # 相机直接跟随玩家，不受农场边界限制
         self.camera_x = self.player.x - screen_width // 2
         self.camera_y = self.player.y - screen_height // 2
-        
-        # 更新雨滴效果
-        if self.weather == "雨天":
-            self.update_rain_drops(1)  # 传入默认时间增量
-            # 雨天自动浇水
-            self.auto_water_crops()
     
     def auto_water_crops(self):
-        """雨天自动浇水所有耕地和作物"""
+        """雨天自动浇水所有耕地和作物
+        
+        只在开始下雨（读档或新的一天）时调用一次，而不是每帧调用；
+        雨天期间新耕的地和新种的作物在创建时直接浇水。
+        重复调用是安全的：只会修改尚未浇水的耕地和作物。
+        """
         if self.weather != "雨天":
             return
             
-        # 遍历所有耕地，将其标记为已浇水
-        for y in range(FARM_HEIGHT):
-            for x in range(FARM_WIDTH):
-                tile = self.grid[y][x]
-                if tile and tile["type"] == "tilled":
-                    tile["watered"] = True
-        
-        # 遍历所有作物，将其标记为已浇水
-        for crop in self.crops:
-            crop.is_watered = True
-            # 更新数据库中的浇水状态
-            self.db.update_crop(crop.id, is_watered=True)
+        # 把所有未浇水的耕地标记为已浇水（整张网格一次查询）
+        for x, y in self.grid.water_tilled():
+            self.tile_renderer.invalidate_tile(x, y)
+        
+        # 遍历所有未浇水的作物，将其标记为已浇水
+        if self.crop_field is not None:
+            self.crop_field.water_all()
+        else:
+            for crop in self.crops:
+                if not crop.is_watered:
+                    crop.is_watered = True
+        
+        # 用一条UPDATE更新数据库中所有未浇水的作物
+        self.db.water_all_crops(self.game.player_id)
     
     def init_rain_drops(self):
         """初始化雨滴效果"""
@@ -900,10 +933,11 @@ class FarmScene:
             # 随机生成雨滴大小和速度
             size = random.randint(1, 3)
             speed = random.randint(self.rain_speed - 2, self.rain_speed + 2)
-            # 添加雨滴
+            # 添加雨滴（prev_y为上一步的位置，用于渲染插值）
             self.rain_drops.append({
                 "x": x,
                 "y": y,
+                "prev_y": y,
                 "size": size,
                 "speed": speed
             })
@@ -912,7 +946,7 @@ class FarmScene:
         """更新雨滴位置
         
         Args:
-            dt: 时间增量
+            dt: 时间增量（秒）
         """
         if self.weather != "雨天":
             return
@@ -920,14 +954,18 @@ class FarmScene:
         import random
         screen_width, screen_height = self.game.screen.get_size()
         
+        # 雨滴速度为每1/60秒下落的像素数
+        distance = dt * 60
+        
         # 更新每个雨滴的位置
         for drop in self.rain_drops:
             # 雨滴下落
-            drop["y"] += drop["speed"]
+            drop["prev_y"] = drop["y"]
+            drop["y"] += drop["speed"] * distance
             
-            # 如果雨滴超出屏幕底部，重新放置到顶部
+            # 如果雨滴超出屏幕底部，重新放置到顶部（不在两个位置之间插值）
             if drop["y"] > screen_height:
-                drop["y"] = random.randint(-20, 0)
+                drop["y"] = drop["prev_y"] = random.randint(-20, 0)
                 drop["x"] = random.randint(0, screen_width)
     
     def render_rain_drops(self, screen):
@@ -941,14 +979,16 @@ class FarmScene:
             
         import pygame
         
-        # 绘制每个雨滴
+        # 绘制每个雨滴（在上一步和当前步的位置之间插值）
+        alpha = self.sim_alpha
         for drop in self.rain_drops:
+            y = drop["prev_y"] + (drop["y"] - drop["prev_y"]) * alpha
             # 使用浅蓝色绘制雨滴
             pygame.draw.line(
                 screen,
                 (200, 200, 255),  # 浅蓝色
-                (drop["x"], drop["y"]),
-                (drop["x"], drop["y"] + drop["size"] * 2),
+                (drop["x"], y),
+                (drop["x"], y + drop["size"] * 2),
                 drop["size"]
             )
     
@@ -958,13 +998,13 @@ class FarmScene:
         self.game_time = 0
         self.day += 1
         
-        # 如果是雨天，确保所有作物都被浇水
-        if self.weather == "雨天":
-            self.auto_water_crops()
-        
         # 作物生长
-        for crop in self.crops:
-            crop.grow()
+        if self.crop_field is not None:
+            # 列式存储：向量化计算所有作物的生长，只把变化的行一次性写回数据库
+            self.crop_field.write_back(self.db, self.crop_field.advance_day())
+        else:
+            for crop in self.crops:
+                crop.grow()
         
         # 动物年龄增长和产出重置
         for animal in self.animals:
@@ -993,6 +1033,9 @@ class FarmScene:
         # 保存天数和天气
         self.db.update_player(self.game.player_id, day=self.day, weather=self.weather)
         
+        # 一天结束时把当天所有修改在一个事务中提交
+        self.db.flush()
+        
         weather_text = "雨天" if self.weather == "雨天" else "晴天"
         self.show_status(f"新的一天开始了！第 {self.day} 天，今天是{weather_text}。")
     
@@ -1017,99 +1060,30 @@ class FarmScene:
         screen.fill(grass_color)
         
         # 绘制农场外的花草装饰（在农场背景之前绘制，确保它们在最底层）
-        self.render_decorations(screen)
-        
-        # 绘制农场背景（像素风格草地）
-        for y in range(FARM_HEIGHT):
-            for x in range(FARM_WIDTH):
-                # 计算屏幕位置
-                screen_x = x * TILE_SIZE - self.camera_x
-                screen_y = y * TILE_SIZE - self.camera_y
-                
-                # 扩大渲染范围，确保即使玩家移动到农场边界外，农场边界仍然可见
-                if (-TILE_SIZE * 5 < screen_x < screen.get_width() + TILE_SIZE * 5 and
-                    -TILE_SIZE * 5 < screen_y < screen.get_height() + TILE_SIZE * 5):
-                    # 绘制像素风格草地 - 雨天时颜色更深
-                    grass_color = (124, 218, 124) if self.weather == "雨天" else (144, 238, 144)
-                    grass_rect = pygame.Rect(screen_x, screen_y, TILE_SIZE, TILE_SIZE)
-                    pygame.draw.rect(screen, grass_color, grass_rect)  # 浅绿色草地
-                    
-                    # 添加草地纹理（小白点）
-                    if (x + y) % 7 == 0:  # 随机分布小白点
-                        dot_size = 2
-                        dot_x = screen_x + (x * 13) % (TILE_SIZE - dot_size)
-                        dot_y = screen_y + (y * 17) % (TILE_SIZE - dot_size)
-                        dot_color = (200, 235, 200) if self.weather == "雨天" else (220, 255, 220)
-                        pygame.draw.rect(screen, dot_color, (dot_x, dot_y, dot_size, dot_size))
-                    
-                    # 绘制耕地
-                    tile = self.grid[y][x]
-                    if tile and tile["type"] == "tilled":
-                        tilled_rect = pygame.Rect(
-                            screen_x + 2, screen_y + 2, 
-                            TILE_SIZE - 4, TILE_SIZE - 4
-                        )
-                        pygame.draw.rect(screen, (139, 69, 19), tilled_rect)  # 棕色
-                        
-                        # 如果已浇水，绘制深色
-                        if tile.get("watered", False):
-                            watered_rect = pygame.Rect(
-                                screen_x + 4, screen_y + 4, 
-                                TILE_SIZE - 8, TILE_SIZE - 8
-                            )
-                            pygame.draw.rect(screen, (101, 67, 33), watered_rect)  # 深棕色
-                
-                # 绘制木栅栏边界
-                # 左边界
-                if x == 0:
-                    fence_color = (139, 69, 19)  # 棕色木栅栏
-                    # 绘制垂直木栅栏
-                    fence_width = TILE_SIZE // 8
-                    pygame.draw.rect(screen, fence_color, (screen_x, screen_y, fence_width, TILE_SIZE))
-                    # 添加木栅栏细节
-                    if y % 2 == 0:
-                        pygame.draw.rect(screen, (160, 82, 45), (screen_x, screen_y + TILE_SIZE // 4, fence_width, TILE_SIZE // 8))
-                
-                # 右边界
-                if x == FARM_WIDTH - 1:
-                    fence_color = (139, 69, 19)  # 棕色木栅栏
-                    # 绘制垂直木栅栏
-                    fence_width = TILE_SIZE // 8
-                    pygame.draw.rect(screen, fence_color, (screen_x + TILE_SIZE - fence_width, screen_y, fence_width, TILE_SIZE))
-                    # 添加木栅栏细节
-                    if y % 2 == 0:
-                        pygame.draw.rect(screen, (160, 82, 45), (screen_x + TILE_SIZE - fence_width, screen_y + TILE_SIZE // 4, fence_width, TILE_SIZE // 8))
-                
-                # 上边界
-                if y == 0:
-                    fence_color = (139, 69, 19)  # 棕色木栅栏
-                    # 绘制水平木栅栏
-                    fence_height = TILE_SIZE // 8
-                    pygame.draw.rect(screen, fence_color, (screen_x, screen_y, TILE_SIZE, fence_height))
-                    # 添加木栅栏细节
-                    if x % 2 == 0:
-                        pygame.draw.rect(screen, (160, 82, 45), (screen_x + TILE_SIZE // 4, screen_y, TILE_SIZE // 8, fence_height))
-                
-                # 下边界
-                if y == FARM_HEIGHT - 1:
-                    fence_color = (139, 69, 19)  # 棕色木栅栏
-                    # 绘制水平木栅栏
-                    fence_height = TILE_SIZE // 8
-                    pygame.draw.rect(screen, fence_color, (screen_x, screen_y + TILE_SIZE - fence_height, TILE_SIZE, fence_height))
-                    # 添加木栅栏细节
-                    if x % 2 == 0:
-                        pygame.draw.rect(screen, (160, 82, 45), (screen_x + TILE_SIZE // 4, screen_y + TILE_SIZE - fence_height, TILE_SIZE // 8, fence_height))
+        with profiler.scope("farm.render.decorations"):
+            self.render_decorations(screen)
+        
+        # 绘制农场背景（像素风格草地、耕地和栅栏），只blit与相机相交的预绘制区块
+        with profiler.scope("farm.render.tiles"):
+            self.tile_renderer.render(screen, self.grid, self.weather == "雨天", self.camera_x, self.camera_y)
         
         # 绘制装饰树木（在区域和作物之前，确保它们在背景层）
-        self.render_trees(screen)
+        with profiler.scope("farm.render.trees"):
+            self.render_trees(screen)
+        
+        # 区域、作物、动物、房屋和玩家提交到渲染队列，按图层批量绘制
+        queue = self.render_queue
+        queue.begin(self.camera_x, self.camera_y, screen.get_width(), screen.get_height())
         
-        # 绘制区域边界
+        # 绘制区域边界（住宅区在房屋图层绘制）
         for area in self.areas:
-            area.render(screen, (self.camera_x, self.camera_y))
+            if area.area_type != Area.HOUSING:
+                area.submit(queue, RenderQueue.LAYER_AREAS)
         
         # 绘制作物
-        for crop in self.crops:
-            crop.render(screen, TILE_SIZE, (self.camera_x, self.camera_y))
+        with profiler.scope("farm.render.crops"):
+            for crop in self.crops:
+                crop.submit(queue, TILE_SIZE, RenderQueue.LAYER_CROPS)
         
         # 绘制动物
         for i, animal in enumerate(self.animals):
@@ -1130,27 +1104,26 @@ class FarmScene:
                     animal.x = (i % 5) * TILE_SIZE * 2 + TILE_SIZE * 2
                     animal.y = (i // 5) * TILE_SIZE * 2 + TILE_SIZE * 8
                 animal.save()  # 保存动物位置到数据库
-            animal.render(screen, animal.x, animal.y, TILE_SIZE * 1.5, (self.camera_x, self.camera_y))
+            animal.submit(queue, animal.x, animal.y, TILE_SIZE * 1.5, RenderQueue.LAYER_ANIMALS)
             
         # 单独绘制住宅区的房屋，确保房屋显示在最上层
         for area in self.areas:
             if area.area_type == Area.HOUSING:
-                # 使用区域的render方法绘制房屋
-                # 区域类已经包含了加载和渲染房屋图像的逻辑
+                # 区域类已经包含了加载和合成房屋图像的逻辑
                 # 这样可以确保使用SVG图像而不是简单的矩形
-                area.render(screen, (self.camera_x, self.camera_y))
-                
-                # 注意：不再使用矩形绘制房屋，而是使用SVG图像
-                # 这样可以避免出现看起来像人脸的问题
-        
-
+                area.submit(queue, RenderQueue.LAYER_HOUSES)
         
         # 绘制玩家（如果不在房子内）- 确保在房屋渲染之后绘制
-        if not hasattr(self.player, 'in_house') or not self.player.in_house:
-            self.player.render(screen, (self.camera_x, self.camera_y))
-        else:
+        player_in_house = hasattr(self.player, 'in_house') and self.player.in_house
+        if not player_in_house:
+            self.player.submit(queue, RenderQueue.LAYER_PLAYER)
+        
+        with profiler.scope("farm.render.flush"):
+            self.render_stats = queue.flush(screen)
+        
+        if player_in_house:
             # 玩家在房子内，显示提示信息
-            house_text = self.font_medium.render("玩家在房子内", True, (255, 255, 255))
+            house_text = font_manager.render(self.font_medium, "玩家在房子内", True, (255, 255, 255))
             text_rect = house_text.get_rect(center=(screen.get_width() // 2, 50))
             screen.blit(house_text, text_rect)
         
@@ -1159,7 +1132,8 @@ class FarmScene:
             self.render_rain_drops(screen)
         
         # 绘制UI
-        self.render_ui(screen)
+        with profiler.scope("farm.render.ui"):
+            self.render_ui(screen)
         
         # 绘制菜单（如果打开）
         if self.show_menu:
@@ -1181,7 +1155,8 @@ class FarmScene:
         info_y = 10
         
         # 玩家名称和等级
-        name_text = self.font_medium.render(
+        name_text = font_manager.render(
+            self.font_medium,
             f"{self.player.name} (等级 {self.player.level})", 
             True, 
             (255, 255, 255)
@@ -1215,7 +1190,8 @@ class FarmScene:
             )
         
         # 经验文本
-        exp_text = self.font.render(
+        exp_text = font_manager.render(
+            self.font,
             f"经验: {self.player.exp}", 
             True, 
             (255, 255, 255)
@@ -1223,7 +1199,8 @@ class FarmScene:
         screen.blit(exp_text, (exp_x, exp_y + exp_bar_height + 5))
         
         # 金钱
-        money_text = self.font.render(
+        money_text = font_manager.render(
+            self.font,
             f"金钱: {self.player.money}", 
             True, 
             (255, 255, 0)
@@ -1259,7 +1236,8 @@ class FarmScene:
             )
         
         # 能量文本
-        energy_text = self.font.render(
+        energy_text = font_manager.render(
+            self.font,
             f"能量: {int(self.player.energy)}/{self.player.max_energy}", 
             True, 
             (255, 255, 255)
@@ -1269,8 +1247,11 @@ class FarmScene:
         # 游戏时间
         hours = self.game_time // 60
         minutes = self.game_time % 60
-        time_text = self.font.render(
-            f"时间: {hours:02d}:{minutes:02d} (第 {self.day} 天)", 
+        sim_clock = getattr(self.game, "sim_clock", None)
+        speed_text = f" x{sim_clock.speed}" if sim_clock and sim_clock.speed != 1 else ""
+        time_text = font_manager.render(
+            self.font,
+            f"时间: {hours:02d}:{minutes:02d} (第 {self.day} 天){speed_text}", 
             True, 
             (255, 255, 255)
         )
@@ -1278,7 +1259,8 @@ class FarmScene:
         
         # 状态消息
         if self.status_message and pygame.time.get_ticks() < self.status_time:
-            status_text = self.font_medium.render(
+            status_text = font_manager.render(
+                self.font_medium,
                 self.status_message, 
                 True, 
                 (255, 255, 255)
@@ -1312,7 +1294,7 @@ class FarmScene:
         pygame.draw.rect(screen, (100, 100, 100), (menu_x, menu_y, menu_width, menu_height), 3)
         
         # 菜单标题
-        title_text = self.font_medium.render("菜单", True, (255, 255, 255))
+        title_text = font_manager.render(self.font_medium, "菜单", True, (255, 255, 255))
         title_rect = title_text.get_rect(center=(menu_x + menu_width // 2, menu_y + 30))
         screen.blit(title_text, title_rect)
         
@@ -1333,11 +1315,11 @@ class FarmScene:
             else:
                 color = (200, 200, 200)  # 灰色
             
-            option_text = self.font.render(option, True, color)
+            option_text = font_manager.render(self.font, option, True, color)
             option_rect = option_text.get_rect(center=(menu_x + menu_width // 2, option_y))
             screen.blit(option_text, option_rect)
         
         # 提示
-        hint_text = self.font.render("按上下键选择，Enter确认，Esc取消", True, (200, 200, 200))
+        hint_text = font_manager.render(self.font, "按上下键选择，Enter确认，Esc取消", True, (200, 200, 200))
         hint_rect = hint_text.get_rect(center=(menu_x + menu_width // 2, menu_y + menu_height - 30))
         screen.blit(hint_text, hint_rect)
\ No newline at end of file
@@ -0,0 +1,87 @@
+import pygame
+from config import ATLAS_ENABLED, ATLAS_SIZES, ATLAS_PAGE_SIZE, SVG_SIZES, PRELOAD_WORKERS, PRELOAD_FRAME_BUDGET_MS
+from utils.font_manager import font_manager
+from utils.asset_preloader import AssetPreloader
+
+class LoadingScene:
+    """资源加载场景，在后台预加载图像并显示进度，完成后进入下一个场景"""
+    
+    def __init__(self, game):
+        """初始化加载场景
+        
+        Args:
+            game: 游戏实例
+        """
+        self.game = game
+        self.font_large = font_manager.get_font(48)
+        self.font_small = font_manager.get_font(24)
+        
+        self.preloader = None
+        self.next_scene = "main_menu"
+        self.next_kwargs = {}
+    
+    def setup(self, next_scene="main_menu", **kwargs):
+        """开始预加载
+        
+        Args:
+            next_scene: 加载完成后进入的场景
+            **kwargs: 传递给下一个场景的参数
+        """
+        self.next_scene = next_scene
+        self.next_kwargs = kwargs
+        
+        manifest = AssetPreloader.build_manifest(
+            self.game.image_manager,
+            atlas_sizes=ATLAS_SIZES if ATLAS_ENABLED else None,
+            atlas_page_size=ATLAS_PAGE_SIZE,
+            svg_sizes=SVG_SIZES
+        )
+        self.preloader = AssetPreloader(
+            self.game.image_manager, manifest,
+            max_workers=PRELOAD_WORKERS,
+            frame_budget_ms=PRELOAD_FRAME_BUDGET_MS
+        )
+        self.preloader.start()
+    
+    def handle_event(self, event):
+        """处理输入事件
+        
+        Args:
+            event: pygame事件
+        """
+        pass
+    
+    def update(self):
+        """处理已解码的资源，全部完成后切换场景"""
+        if self.preloader.update():
+            self.game.change_scene(self.next_scene, **self.next_kwargs)
+    
+    def render(self, screen):
+        """渲染加载进度
+        
+        Args:
+            screen: pygame屏幕对象
+        """
+        screen.fill((100, 180, 100))
+        center_x = screen.get_width() // 2
+        center_y = screen.get_height() // 2
+        
+        # 标题
+        title = font_manager.render(self.font_large, "加载中...", True, (255, 255, 255))
+        screen.blit(title, title.get_rect(center=(center_x, center_y - 60)))
+        
+        # 进度条
+        bar_width = screen.get_width() // 2
+        bar_rect = pygame.Rect(center_x - bar_width // 2, center_y, bar_width, 24)
+        pygame.draw.rect(screen, (60, 100, 60), bar_rect)
+        fill_rect = bar_rect.copy()
+        fill_rect.width = int(bar_width * self.preloader.progress)
+        pygame.draw.rect(screen, (255, 223, 0), fill_rect)
+        pygame.draw.rect(screen, (255, 255, 255), bar_rect, 2)
+        
+        # 进度文字
+        status = f"{self.preloader.loaded}/{self.preloader.total}"
+        if self.preloader.current:
+            status += f"  {AssetPreloader.describe(self.preloader.current)}"
+        text = font_manager.render(self.font_small, status, True, (255, 255, 255))
+        screen.blit(text, text.get_rect(center=(center_x, center_y + 50)))
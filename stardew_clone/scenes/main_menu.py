@@ -7,6 +7,11 @@ from utils.audio_manager import audio_manager
 class MainMenu:
     """游戏主菜单场景"""
     
+    # 静态背景缓存 {(窗口宽度, 窗口高度): 表面}，切换回主菜单时可以复用
+    _backdrop_cache = {}
+    # 半透明纯色表面缓存 {(尺寸, 颜色): 表面}
+    _surface_cache = {}
+    
     def __init__(self, game):
         """初始化主菜单
         
@@ -129,21 +134,46 @@ class MainMenu:
         """更新场景状态"""
         pass
     
-    def render(self, screen):
-        """渲染场景
+    @classmethod
+    def get_backdrop(cls, width, height):
+        """获取静态背景（渐变、草地、栅栏、房屋和阴影），每种窗口尺寸只绘制一次
         
         Args:
-            screen: pygame屏幕对象
+            width: 窗口宽度
+            height: 窗口高度
+            
+        Returns:
+            背景表面
         """
+        key = (width, height)
+        if key not in cls._backdrop_cache:
+            cls._backdrop_cache[key] = cls._build_backdrop(width, height)
+        return cls._backdrop_cache[key]
+    
+    @staticmethod
+    def _build_backdrop(width, height):
+        """绘制静态背景
+        
+        Args:
+            width: 窗口宽度
+            height: 窗口高度
+            
+        Returns:
+            背景表面
+        """
+        backdrop = pygame.Surface((width, height))
+        if pygame.display.get_surface() is not None:
+            backdrop = backdrop.convert()
+        
         # 绘制渐变背景
-        for y in range(screen.get_height()):
+        for y in range(height):
             # 从顶部的深绿色渐变到底部的浅绿色
-            gradient_color = (100, 180 + (y * 50 // screen.get_height()), 100)
-            pygame.draw.line(screen, gradient_color, (0, y), (screen.get_width(), y))
+            gradient_color = (100, 180 + (y * 50 // height), 100)
+            pygame.draw.line(backdrop, gradient_color, (0, y), (width, y))
         
         # 绘制像素风格草地
-        for y in range(0, screen.get_height(), 64):
-            for x in range(0, screen.get_width(), 64):
+        for y in range(0, height, 64):
+            for x in range(0, width, 64):
                 # 绘制草地纹理
                 grass_rect = pygame.Rect(x, y, 64, 64)
                 # 添加半透明的纹理层
@@ -159,7 +189,7 @@ class MainMenu:
                                    (grass_x, grass_y + grass_height), 
                                    (grass_x, grass_y), 2)
                 
-                screen.blit(texture, grass_rect)
+                backdrop.blit(texture, grass_rect)
         
         # 绘制装饰性木栅栏边界
         fence_color = (120, 60, 20)  # 深棕色木栅栏
@@ -172,51 +202,51 @@ class MainMenu:
         shadow_offset = 4
         
         # 绘制栅栏柱子
-        for x in range(0, screen.get_width(), 120):
+        for x in range(0, width, 120):
             # 上边界柱子
-            pygame.draw.rect(screen, fence_color, (x, 0, fence_post_size, fence_post_size))
-            pygame.draw.rect(screen, fence_highlight, (x+2, 2, fence_post_size-4, 5))
+            pygame.draw.rect(backdrop, fence_color, (x, 0, fence_post_size, fence_post_size))
+            pygame.draw.rect(backdrop, fence_highlight, (x+2, 2, fence_post_size-4, 5))
             
             # 下边界柱子
-            post_y = screen.get_height() - fence_post_size
+            post_y = height - fence_post_size
             shadow = pygame.Surface((fence_post_size+shadow_offset, shadow_offset), pygame.SRCALPHA)
             shadow.fill(shadow_color)
-            screen.blit(shadow, (x-shadow_offset//2, post_y+fence_post_size))
-            pygame.draw.rect(screen, fence_color, (x, post_y, fence_post_size, fence_post_size))
-            pygame.draw.rect(screen, fence_highlight, (x+2, post_y+2, fence_post_size-4, 5))
+            backdrop.blit(shadow, (x-shadow_offset//2, post_y+fence_post_size))
+            pygame.draw.rect(backdrop, fence_color, (x, post_y, fence_post_size, fence_post_size))
+            pygame.draw.rect(backdrop, fence_highlight, (x+2, post_y+2, fence_post_size-4, 5))
         
-        for y in range(0, screen.get_height(), 120):
+        for y in range(0, height, 120):
             # 左边界柱子
-            pygame.draw.rect(screen, fence_color, (0, y, fence_post_size, fence_post_size))
-            pygame.draw.rect(screen, fence_highlight, (2, y+2, 5, fence_post_size-4))
+            pygame.draw.rect(backdrop, fence_color, (0, y, fence_post_size, fence_post_size))
+            pygame.draw.rect(backdrop, fence_highlight, (2, y+2, 5, fence_post_size-4))
             
             # 右边界柱子
-            post_x = screen.get_width() - fence_post_size
+            post_x = width - fence_post_size
             shadow = pygame.Surface((shadow_offset, fence_post_size+shadow_offset), pygame.SRCALPHA)
             shadow.fill(shadow_color)
-            screen.blit(shadow, (post_x+fence_post_size, y-shadow_offset//2))
-            pygame.draw.rect(screen, fence_color, (post_x, y, fence_post_size, fence_post_size))
-            pygame.draw.rect(screen, fence_highlight, (post_x+2, y+2, 5, fence_post_size-4))
+            backdrop.blit(shadow, (post_x+fence_post_size, y-shadow_offset//2))
+            pygame.draw.rect(backdrop, fence_color, (post_x, y, fence_post_size, fence_post_size))
+            pygame.draw.rect(backdrop, fence_highlight, (post_x+2, y+2, 5, fence_post_size-4))
         
         # 绘制栅栏横条
         # 上边界
-        pygame.draw.rect(screen, fence_color, (0, fence_post_size//2-fence_width//2, screen.get_width(), fence_width))
+        pygame.draw.rect(backdrop, fence_color, (0, fence_post_size//2-fence_width//2, width, fence_width))
         # 下边界
-        pygame.draw.rect(screen, fence_color, (0, screen.get_height()-fence_post_size//2-fence_width//2, screen.get_width(), fence_width))
+        pygame.draw.rect(backdrop, fence_color, (0, height-fence_post_size//2-fence_width//2, width, fence_width))
         # 左边界
-        pygame.draw.rect(screen, fence_color, (fence_post_size//2-fence_width//2, 0, fence_width, screen.get_height()))
+        pygame.draw.rect(backdrop, fence_color, (fence_post_size//2-fence_width//2, 0, fence_width, height))
         # 右边界
-        pygame.draw.rect(screen, fence_color, (screen.get_width()-fence_post_size//2-fence_width//2, 0, fence_width, screen.get_height()))
+        pygame.draw.rect(backdrop, fence_color, (width-fence_post_size//2-fence_width//2, 0, fence_width, height))
         
         # 绘制像素风格小房子作为装饰
-        house_x = screen.get_width() // 2 - 120
+        house_x = width // 2 - 120
         house_y = 160
         
         # 绘制房屋阴影
         shadow_color = (50, 50, 50, 100)
         shadow = pygame.Surface((240, 20), pygame.SRCALPHA)
         shadow.fill(shadow_color)
-        screen.blit(shadow, (house_x - 10, house_y + 140))
+        backdrop.blit(shadow, (house_x - 10, house_y + 140))
         
         # 绘制房屋主体（带纹理的浅棕色）
         house_width = 220
@@ -225,11 +255,11 @@ class MainMenu:
         
         # 绘制墙壁底色
         wall_color = (210, 180, 140)
-        pygame.draw.rect(screen, wall_color, house_rect)
+        pygame.draw.rect(backdrop, wall_color, house_rect)
         
         # 添加墙壁纹理
         for i in range(0, house_width, 20):
-            pygame.draw.line(screen, (190, 160, 120), (house_x + i, house_y), (house_x + i, house_y + house_height), 2)
+            pygame.draw.line(backdrop, (190, 160, 120), (house_x + i, house_y), (house_x + i, house_y + house_height), 2)
         
         # 绘制房屋屋顶（带纹理的深棕色）
         roof_height = 50
@@ -239,13 +269,13 @@ class MainMenu:
             (house_x + house_width + 20, house_y),  # 右下
             (house_x + house_width // 2, house_y - roof_height)  # 顶部
         ]
-        pygame.draw.polygon(screen, (139, 69, 19), roof_points)  # 深棕色屋顶
+        pygame.draw.polygon(backdrop, (139, 69, 19), roof_points)  # 深棕色屋顶
         
         # 添加屋顶纹理
         for i in range(1, 4):
             y_offset = roof_height * i // 4
             x_offset = 20 * i
-            pygame.draw.line(screen, (120, 60, 20), 
+            pygame.draw.line(backdrop, (120, 60, 20), 
                            (house_x - 20 + x_offset, house_y - y_offset), 
                            (house_x + house_width + 20 - x_offset, house_y - y_offset), 
                            2)
@@ -255,30 +285,19 @@ class MainMenu:
         chimney_height = 40
         chimney_x = house_x + house_width - 60
         chimney_y = house_y - 30
-        pygame.draw.rect(screen, (120, 60, 20), (chimney_x, chimney_y - chimney_height, chimney_width, chimney_height))
-        
-        # 添加烟雾效果（根据当前时间变化）
-        import time
-        current_time = int(time.time() * 2) % 10
-        for i in range(3):
-            smoke_size = 10 + (i * 5) + (current_time % 5)
-            smoke_x = chimney_x + chimney_width // 2 - smoke_size // 2
-            smoke_y = chimney_y - chimney_height - 10 - (i * 15) - (current_time % 10)
-            smoke = pygame.Surface((smoke_size, smoke_size), pygame.SRCALPHA)
-            smoke.fill((255, 255, 255, 100 - i * 20))
-            screen.blit(smoke, (smoke_x, smoke_y))
+        pygame.draw.rect(backdrop, (120, 60, 20), (chimney_x, chimney_y - chimney_height, chimney_width, chimney_height))
         
         # 绘制门（带纹理和把手）
         door_width = 40
         door_height = 70
         door_x = house_x + house_width // 2 - door_width // 2
         door_y = house_y + house_height - door_height
-        pygame.draw.rect(screen, (101, 67, 33), (door_x, door_y, door_width, door_height))  # 棕色门
+        pygame.draw.rect(backdrop, (101, 67, 33), (door_x, door_y, door_width, door_height))  # 棕色门
         
         # 门框
-        pygame.draw.rect(screen, (80, 50, 20), (door_x, door_y, door_width, door_height), 3)
+        pygame.draw.rect(backdrop, (80, 50, 20), (door_x, door_y, door_width, door_height), 3)
         # 门把手
-        pygame.draw.circle(screen, (220, 220, 180), (door_x + door_width - 10, door_y + door_height // 2), 5)
+        pygame.draw.circle(backdrop, (220, 220, 180), (door_x + door_width - 10, door_y + door_height // 2), 5)
         
         # 绘制窗户（带窗框和反光效果）
         window_size = 36
@@ -287,32 +306,32 @@ class MainMenu:
         # 左窗户
         left_window_x = house_x + 40
         left_window_y = house_y + 40
-        pygame.draw.rect(screen, (80, 50, 20), (left_window_x-2, left_window_y-2, window_size+4, window_size+4))  # 窗框
-        pygame.draw.rect(screen, window_color, (left_window_x, left_window_y, window_size, window_size))
+        pygame.draw.rect(backdrop, (80, 50, 20), (left_window_x-2, left_window_y-2, window_size+4, window_size+4))  # 窗框
+        pygame.draw.rect(backdrop, window_color, (left_window_x, left_window_y, window_size, window_size))
         # 窗户十字框
-        pygame.draw.line(screen, (80, 50, 20), (left_window_x, left_window_y + window_size//2), (left_window_x + window_size, left_window_y + window_size//2), 2)
-        pygame.draw.line(screen, (80, 50, 20), (left_window_x + window_size//2, left_window_y), (left_window_x + window_size//2, left_window_y + window_size), 2)
+        pygame.draw.line(backdrop, (80, 50, 20), (left_window_x, left_window_y + window_size//2), (left_window_x + window_size, left_window_y + window_size//2), 2)
+        pygame.draw.line(backdrop, (80, 50, 20), (left_window_x + window_size//2, left_window_y), (left_window_x + window_size//2, left_window_y + window_size), 2)
         # 窗户反光
-        pygame.draw.line(screen, (255, 255, 255, 150), (left_window_x + 5, left_window_y + 5), (left_window_x + 15, left_window_y + 5), 2)
+        pygame.draw.line(backdrop, (255, 255, 255, 150), (left_window_x + 5, left_window_y + 5), (left_window_x + 15, left_window_y + 5), 2)
         
         # 右窗户
         right_window_x = house_x + house_width - 40 - window_size
         right_window_y = house_y + 40
-        pygame.draw.rect(screen, (80, 50, 20), (right_window_x-2, right_window_y-2, window_size+4, window_size+4))  # 窗框
-        pygame.draw.rect(screen, window_color, (right_window_x, right_window_y, window_size, window_size))
+        pygame.draw.rect(backdrop, (80, 50, 20), (right_window_x-2, right_window_y-2, window_size+4, window_size+4))  # 窗框
+        pygame.draw.rect(backdrop, window_color, (right_window_x, right_window_y, window_size, window_size))
         # 窗户十字框
-        pygame.draw.line(screen, (80, 50, 20), (right_window_x, right_window_y + window_size//2), (right_window_x + window_size, right_window_y + window_size//2), 2)
-        pygame.draw.line(screen, (80, 50, 20), (right_window_x + window_size//2, right_window_y), (right_window_x + window_size//2, right_window_y + window_size), 2)
+        pygame.draw.line(backdrop, (80, 50, 20), (right_window_x, right_window_y + window_size//2), (right_window_x + window_size, right_window_y + window_size//2), 2)
+        pygame.draw.line(backdrop, (80, 50, 20), (right_window_x + window_size//2, right_window_y), (right_window_x + window_size//2, right_window_y + window_size), 2)
         # 窗户反光
-        pygame.draw.line(screen, (255, 255, 255, 150), (right_window_x + 5, right_window_y + 5), (right_window_x + 15, right_window_y + 5), 2)
+        pygame.draw.line(backdrop, (255, 255, 255, 150), (right_window_x + 5, right_window_y + 5), (right_window_x + 15, right_window_y + 5), 2)
         
         # 绘制花坛
         flower_box_width = 50
         flower_box_height = 20
         # 左花坛
-        pygame.draw.rect(screen, (120, 60, 20), (left_window_x - 5, left_window_y + window_size + 5, window_size + 10, flower_box_height))
+        pygame.draw.rect(backdrop, (120, 60, 20), (left_window_x - 5, left_window_y + window_size + 5, window_size + 10, flower_box_height))
         # 右花坛
-        pygame.draw.rect(screen, (120, 60, 20), (right_window_x - 5, right_window_y + window_size + 5, window_size + 10, flower_box_height))
+        pygame.draw.rect(backdrop, (120, 60, 20), (right_window_x - 5, right_window_y + window_size + 5, window_size + 10, flower_box_height))
         
         # 添加花朵
         flower_colors = [(255, 50, 50), (255, 255, 50), (255, 150, 50), (200, 50, 255)]
@@ -320,30 +339,78 @@ class MainMenu:
             # 左花坛的花
             flower_x = left_window_x + 5 + (i * 10)
             flower_y = left_window_y + window_size + 5
-            pygame.draw.circle(screen, flower_colors[i % len(flower_colors)], (flower_x, flower_y), 5)
-            pygame.draw.rect(screen, (50, 150, 50), (flower_x-1, flower_y, 2, 10))
+            pygame.draw.circle(backdrop, flower_colors[i % len(flower_colors)], (flower_x, flower_y), 5)
+            pygame.draw.rect(backdrop, (50, 150, 50), (flower_x-1, flower_y, 2, 10))
             
             # 右花坛的花
             flower_x = right_window_x + 5 + (i * 10)
             flower_y = right_window_y + window_size + 5
-            pygame.draw.circle(screen, flower_colors[(i+2) % len(flower_colors)], (flower_x, flower_y), 5)
-            pygame.draw.rect(screen, (50, 150, 50), (flower_x-1, flower_y, 2, 10))
+            pygame.draw.circle(backdrop, flower_colors[(i+2) % len(flower_colors)], (flower_x, flower_y), 5)
+            pygame.draw.rect(backdrop, (50, 150, 50), (flower_x-1, flower_y, 2, 10))
+        
+        return backdrop
+    
+    @staticmethod
+    def _filled_surface(size, color):
+        """获取填充了半透明颜色的表面（按尺寸和颜色缓存，调用者不能修改）
+        
+        Args:
+            size: 尺寸元组 (width, height)
+            color: RGBA颜色
+            
+        Returns:
+            表面
+        """
+        key = (size, color)
+        surface = MainMenu._surface_cache.get(key)
+        if surface is None:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            surface.fill(color)
+            MainMenu._surface_cache[key] = surface
+        return surface
+    
+    def render(self, screen):
+        """渲染场景
+        
+        Args:
+            screen: pygame屏幕对象
+        """
+        # 绘制静态背景（每种窗口尺寸只绘制一次）
+        screen.blit(self.get_backdrop(screen.get_width(), screen.get_height()), (0, 0))
+        
+        # 烟囱位置（与背景中的房屋一致）
+        house_x = screen.get_width() // 2 - 120
+        house_y = 160
+        house_width = 220
+        chimney_width = 20
+        chimney_height = 40
+        chimney_x = house_x + house_width - 60
+        chimney_y = house_y - 30
+        
+        # 添加烟雾效果（根据当前时间变化）
+        import time
+        current_time = int(time.time() * 2) % 10
+        for i in range(3):
+            smoke_size = 10 + (i * 5) + (current_time % 5)
+            smoke_x = chimney_x + chimney_width // 2 - smoke_size // 2
+            smoke_y = chimney_y - chimney_height - 10 - (i * 15) - (current_time % 10)
+            smoke = self._filled_surface((smoke_size, smoke_size), (255, 255, 255, 100 - i * 20))
+            screen.blit(smoke, (smoke_x, smoke_y))
         
         # 渲染标题（带阴影效果）
         title = "星露谷物语克隆版"
         # 阴影
-        shadow_text = self.font_large.render(title, True, (50, 50, 50))
+        shadow_text = font_manager.render(self.font_large, title, True, (50, 50, 50))
         shadow_rect = shadow_text.get_rect(center=(screen.get_width() // 2 + 4, 104))
         screen.blit(shadow_text, shadow_rect)
         # 主标题
-        title_text = self.font_large.render(title, True, (255, 255, 200))
+        title_text = font_manager.render(self.font_large, title, True, (255, 255, 200))
         title_rect = title_text.get_rect(center=(screen.get_width() // 2, 100))
         screen.blit(title_text, title_rect)
         
         if self.input_active:
             # 绘制半透明背景
-            overlay = pygame.Surface((screen.get_width(), screen.get_height()), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 100))
+            overlay = self._filled_surface(screen.get_size(), (0, 0, 0, 100))
             screen.blit(overlay, (0, 0))
             
             # 绘制输入面板背景
@@ -352,8 +419,7 @@ class MainMenu:
             panel_y = 350
             
             # 面板阴影
-            shadow = pygame.Surface((panel_width + 10, panel_height + 10), pygame.SRCALPHA)
-            shadow.fill((0, 0, 0, 100))
+            shadow = self._filled_surface((panel_width + 10, panel_height + 10), (0, 0, 0, 100))
             screen.blit(shadow, (panel_x - 5 + 8, panel_y - 5 + 8))
             
             # 面板主体
@@ -366,7 +432,7 @@ class MainMenu:
             pygame.draw.rect(screen, (180, 150, 100), title_bg, border_top_left_radius=10, border_top_right_radius=10)
             
             # 绘制提示文本
-            prompt_text = self.font_medium.render("请输入你的名字", True, (255, 255, 255))
+            prompt_text = font_manager.render(self.font_medium, "请输入你的名字", True, (255, 255, 255))
             prompt_rect = prompt_text.get_rect(center=(panel_x + panel_width // 2, panel_y + 25))
             screen.blit(prompt_text, prompt_rect)
             
@@ -376,26 +442,25 @@ class MainMenu:
             pygame.draw.rect(screen, (100, 100, 100), input_box, 2, border_radius=5)
             
             # 绘制输入文本
-            input_text = self.font_small.render(self.input_text, True, (0, 0, 0))
+            input_text = font_manager.render(self.font_small, self.input_text, True, (0, 0, 0))
             # 添加闪烁的光标效果
             cursor_text = self.input_text
             if int(pygame.time.get_ticks() / 500) % 2 == 0:  # 每0.5秒闪烁一次
                 cursor_text += "|"
-            input_text_with_cursor = self.font_small.render(cursor_text, True, (0, 0, 0))
+            input_text_with_cursor = font_manager.render(self.font_small, cursor_text, True, (0, 0, 0))
             
             # 确保文本在输入框内居中显示
             text_rect = input_text_with_cursor.get_rect(midleft=(input_box.left + 10, input_box.centery))
             screen.blit(input_text_with_cursor, text_rect)
             
             # 添加提示信息
-            hint_text = self.font_small.render("按回车确认，ESC取消", True, (100, 100, 100))
+            hint_text = font_manager.render(self.font_small, "按回车确认，ESC取消", True, (100, 100, 100))
             hint_rect = hint_text.get_rect(center=(panel_x + panel_width // 2, panel_y + 150))
             screen.blit(hint_text, hint_rect)
         
         elif self.player_selection_active:
             # 绘制半透明背景
-            overlay = pygame.Surface((screen.get_width(), screen.get_height()), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 100))
+            overlay = self._filled_surface(screen.get_size(), (0, 0, 0, 100))
             screen.blit(overlay, (0, 0))
             
             # 绘制选择面板背景
@@ -404,8 +469,7 @@ class MainMenu:
             panel_y = 200
             
             # 面板阴影
-            shadow = pygame.Surface((panel_width + 10, panel_height + 10), pygame.SRCALPHA)
-            shadow.fill((0, 0, 0, 100))
+            shadow = self._filled_surface((panel_width + 10, panel_height + 10), (0, 0, 0, 100))
             screen.blit(shadow, (panel_x - 5 + 8, panel_y - 5 + 8))
             
             # 面板主体
@@ -418,7 +482,7 @@ class MainMenu:
             pygame.draw.rect(screen, (180, 150, 100), title_bg, border_top_left_radius=10, border_top_right_radius=10)
             
             # 渲染标题
-            title_text = self.font_medium.render("选择角色", True, (255, 255, 255))
+            title_text = font_manager.render(self.font_medium, "选择角色", True, (255, 255, 255))
             title_rect = title_text.get_rect(center=(panel_x + panel_width // 2, panel_y + 25))
             screen.blit(title_text, title_rect)
             
@@ -467,17 +531,17 @@ class MainMenu:
                     screen.blit(level_icon, (panel_x + 60, y_pos - 10))  # 调整位置
                     
                     # 等级文本 - 使用更小的字体
-                    level_text = font_level.render(str(player['level']), True, (0, 0, 0))
+                    level_text = font_manager.render(font_level, str(player['level']), True, (0, 0, 0))
                     level_rect = level_text.get_rect(center=(panel_x + 60 + 10, y_pos - 10 + 10))  # 调整位置
                     screen.blit(level_text, level_rect)
                     
                     # 玩家名称 - 使用更小的字体
-                    player_text = font_player.render(player['name'], True, (50, 50, 50))
+                    player_text = font_manager.render(font_player, player['name'], True, (50, 50, 50))
                     player_rect = player_text.get_rect(midleft=(panel_x + 100, y_pos))
                     screen.blit(player_text, player_rect)
             else:
                 # 没有玩家时显示提示
-                no_player_text = self.font_small.render("没有保存的角色", True, (100, 100, 100))
+                no_player_text = font_manager.render(self.font_small, "没有保存的角色", True, (100, 100, 100))
                 no_player_rect = no_player_text.get_rect(center=(panel_x + panel_width // 2, panel_y + 150))
                 screen.blit(no_player_text, no_player_rect)
             
@@ -505,12 +569,12 @@ class MainMenu:
             enter_key = pygame.Rect(start_x, panel_y + panel_height - 37, key_size * 2, key_size)
             pygame.draw.rect(screen, (220, 220, 220), enter_key, border_radius=5)
             pygame.draw.rect(screen, (100, 100, 100), enter_key, 2, border_radius=5)
-            enter_text = font_hint.render("↵", True, (0, 0, 0))
+            enter_text = font_manager.render(font_hint, "↵", True, (0, 0, 0))
             enter_rect = enter_text.get_rect(center=enter_key.center)
             screen.blit(enter_text, enter_rect)
             
             # Enter键文本
-            select_text = font_hint.render("选择", True, (255, 255, 255))
+            select_text = font_manager.render(font_hint, "选择", True, (255, 255, 255))
             select_rect = select_text.get_rect(midleft=(enter_key.right + 5, enter_key.centery))
             screen.blit(select_text, select_rect)
             
@@ -521,12 +585,12 @@ class MainMenu:
             esc_key = pygame.Rect(start_x - 30, panel_y + panel_height - 37, key_size, key_size)
             pygame.draw.rect(screen, (220, 220, 220), esc_key, border_radius=5)
             pygame.draw.rect(screen, (100, 100, 100), esc_key, 2, border_radius=5)
-            esc_text = font_hint.render("Esc", True, (0, 0, 0))
+            esc_text = font_manager.render(font_hint, "Esc", True, (0, 0, 0))
             esc_rect = esc_text.get_rect(center=esc_key.center)
             screen.blit(esc_text, esc_rect)
             
             # Esc键文本
-            back_text = font_hint.render("返回", True, (255, 255, 255))
+            back_text = font_manager.render(font_hint, "返回", True, (255, 255, 255))
             back_rect = back_text.get_rect(midleft=(esc_key.right + 5, esc_key.centery))
             screen.blit(back_text, back_rect)
             
@@ -537,12 +601,12 @@ class MainMenu:
             d_key = pygame.Rect(start_x, panel_y + panel_height - 37, key_size, key_size)
             pygame.draw.rect(screen, (220, 220, 220), d_key, border_radius=5)
             pygame.draw.rect(screen, (100, 100, 100), d_key, 2, border_radius=5)
-            d_text = font_hint.render("D", True, (0, 0, 0))
+            d_text = font_manager.render(font_hint, "D", True, (0, 0, 0))
             d_rect = d_text.get_rect(center=d_key.center)
             screen.blit(d_text, d_rect)
             
             # D键文本
-            delete_text = font_hint.render("删除", True, (255, 255, 255))
+            delete_text = font_manager.render(font_hint, "删除", True, (255, 255, 255))
             delete_rect = delete_text.get_rect(midleft=(d_key.right + 5, d_key.centery))
             screen.blit(delete_text, delete_rect)
         
@@ -554,8 +618,7 @@ class MainMenu:
             menu_y = 350
             
             # 菜单背景
-            menu_bg = pygame.Surface((menu_width, menu_height), pygame.SRCALPHA)
-            menu_bg.fill((0, 0, 0, 80))
+            menu_bg = self._filled_surface((menu_width, menu_height), (0, 0, 0, 80))
             screen.blit(menu_bg, (menu_x, menu_y))
             pygame.draw.rect(screen, (255, 255, 255, 50), (menu_x, menu_y, menu_width, menu_height), 2, border_radius=10)
             
@@ -598,11 +661,11 @@ class MainMenu:
                 
                 # 选项文本 - 选中时使用金色，未选中时使用白色
                 text_color = (255, 215, 0) if i == self.selected_option else (255, 255, 255)
-                option_text = self.font_medium.render(option, True, text_color)
+                option_text = font_manager.render(self.font_medium, option, True, text_color)
                 
                 # 为选中项添加文字阴影效果
                 if i == self.selected_option:
-                    shadow_text = self.font_medium.render(option, True, (100, 50, 0))
+                    shadow_text = font_manager.render(self.font_medium, option, True, (100, 50, 0))
                     shadow_rect = shadow_text.get_rect(center=(menu_x + menu_width // 2 + 2, y_pos + 2))
                     screen.blit(shadow_text, shadow_rect)
                 
@@ -610,7 +673,7 @@ class MainMenu:
                 screen.blit(option_text, option_rect)
             
             # 添加控制提示
-            hint_text = self.font_small.render("使用↑↓键选择，回车确认", True, (220, 220, 220))
+            hint_text = font_manager.render(self.font_small, "使用↑↓键选择，回车确认", True, (220, 220, 220))
             hint_rect = hint_text.get_rect(center=(screen.get_width() // 2, menu_y + menu_height + 30))
             screen.blit(hint_text, hint_rect)
 
@@ -94,13 +94,7 @@ class MarketScene:
             # 加载工具列表
             for tool_name, tool_info in TOOL_TYPES.items():
                 # 检查玩家是否已拥有该工具
-                has_tool = False
-                for tool in self.inventory.tools:
-                    if tool["tool_name"] == tool_name:
-                        has_tool = True
-                        break
-                
-                if not has_tool:
+                if not self.inventory.has_tool(tool_name):
                     self.items_for_sale.append({
                         "name": tool_name,
                         "price": 500,  # 基础工具价格
@@ -318,7 +312,7 @@ class MarketScene:
         screen.fill((50, 50, 80))  # 深蓝色背景
         
         # 绘制标题
-        title_text = self.font_large.render("市场", True, (255, 255, 255))
+        title_text = font_manager.render(self.font_large, "市场", True, (255, 255, 255))
         screen.blit(title_text, (WINDOW_WIDTH // 2 - title_text.get_width() // 2, 20))
         
         # 绘制标签
@@ -328,7 +322,7 @@ class MarketScene:
             tab_color = (100, 100, 200) if tab == self.current_tab else (70, 70, 120)
             pygame.draw.rect(screen, tab_color, (tab_x, 80, tab_width, 40))
             
-            tab_text = self.font_medium.render(tab, True, (255, 255, 255))
+            tab_text = font_manager.render(self.font_medium, tab, True, (255, 255, 255))
             screen.blit(tab_text, (tab_x + tab_width // 2 - tab_text.get_width() // 2, 90))
         
         # 绘制商品列表
@@ -348,33 +342,33 @@ class MarketScene:
             pygame.draw.rect(screen, item_color, (list_x, item_y, list_width, item_height))
             
             # 绘制商品名称
-            name_text = self.font_medium.render(item["name"], True, (255, 255, 255))
+            name_text = font_manager.render(self.font_medium, item["name"], True, (255, 255, 255))
             screen.blit(name_text, (list_x + 10, item_y + 10))
             
             # 绘制商品价格
             if self.current_tab == "出售":
                 # 显示考虑等级加成后的最终价格
                 final_price = item.get("final_price", item["price"])
-                price_text = self.font.render(f"售价: {final_price} 金币 (数量: {item['quantity']})", True, (255, 255, 0))
+                price_text = font_manager.render(self.font, f"售价: {final_price} 金币 (数量: {item['quantity']})", True, (255, 255, 0))
             else:
-                price_text = self.font.render(f"价格: {item['price']} 金币", True, (255, 255, 0))
+                price_text = font_manager.render(self.font, f"价格: {item['price']} 金币", True, (255, 255, 0))
             screen.blit(price_text, (list_x + 10, item_y + 35))
             
             # 绘制商品描述
-            desc_text = self.font.render(item["description"], True, (200, 200, 200))
+            desc_text = font_manager.render(self.font, item["description"], True, (200, 200, 200))
             screen.blit(desc_text, (list_x + 300, item_y + 20))
         
         # 绘制玩家信息
-        money_text = self.font_medium.render(f"金钱: {self.player.money} 金币", True, (255, 255, 0))
+        money_text = font_manager.render(self.font_medium, f"金钱: {self.player.money} 金币", True, (255, 255, 0))
         screen.blit(money_text, (50, WINDOW_HEIGHT - 100))
         
         # 绘制操作提示
-        controls_text = self.font.render("方向键: 选择商品  回车: 购买/出售  ESC: 返回农场", True, (255, 255, 255))
+        controls_text = font_manager.render(self.font, "方向键: 选择商品  回车: 购买/出售  ESC: 返回农场", True, (255, 255, 255))
         screen.blit(controls_text, (WINDOW_WIDTH // 2 - controls_text.get_width() // 2, WINDOW_HEIGHT - 50))
         
         # 绘制状态消息
         if self.status_message and pygame.time.get_ticks() < self.status_time:
-            status_text = self.font_medium.render(self.status_message, True, (255, 255, 255))
+            status_text = font_manager.render(self.font_medium, self.status_message, True, (255, 255, 255))
             status_rect = status_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 150))
             
             # 绘制背景
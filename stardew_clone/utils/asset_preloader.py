@@ -0,0 +1,203 @@
+import os
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class AssetPreloader:
+    """后台资源预加载器
+
+    按清单在线程池中读取并解码图像（文件读取和PNG解码可以与主线程重叠），
+    解码结果在主线程中按时间片分批调用convert_alpha并放入ImageManager的缓存，
+    这样进入场景后的第一帧不会因为加载图像而卡顿。
+
+    清单中的每一项为 (类型, 参数1, 参数2)：
+        ("atlas", 尺寸配置, 图集边长)  纹理图集
+        ("png", 类别, 名称)            assets/images/类别/名称.png
+        ("svg", 路径, 尺寸)            SVG图像
+    """
+
+    def __init__(self, image_manager, manifest, max_workers=4, frame_budget_ms=8):
+        """初始化预加载器
+
+        Args:
+            image_manager: 图像管理器
+            manifest: 资源清单
+            max_workers: 解码线程数
+            frame_budget_ms: 每帧在主线程处理解码结果的时间上限（毫秒）
+        """
+        self.image_manager = image_manager
+        self.manifest = list(manifest)
+        self.max_workers = max_workers
+        self.frame_budget = frame_budget_ms / 1000
+
+        self.executor = None
+        self.results = queue.Queue()  # 线程池完成的 (清单项, 解码结果, 异常)
+        self.loaded = 0               # 已完成的项数（包括失败的）
+        self.failed = []              # 加载失败的 (清单项, 异常)
+        self.current = None           # 最近完成的清单项，用于在加载界面显示
+
+    @staticmethod
+    def build_manifest(image_manager, atlas_sizes=None, atlas_page_size=1024, svg_sizes=None):
+        """生成资源清单
+
+        使用纹理图集时，图集已包含的类别不再单独预加载原图（原图很大，只在没有合适尺寸时才按需加载）。
+
+        Args:
+            image_manager: 图像管理器
+            atlas_sizes: 纹理图集的尺寸配置，None表示不使用图集
+            atlas_page_size: 图集边长
+            svg_sizes: SVG及其输出尺寸 {路径: [尺寸, ...]}
+
+        Returns:
+            资源清单
+        """
+        manifest = []
+        if atlas_sizes:
+            manifest.append(("atlas", atlas_sizes, atlas_page_size))
+
+        base_path = image_manager.base_path
+        for category in sorted(os.listdir(base_path)):
+            category_path = os.path.join(base_path, category)
+            if not os.path.isdir(category_path) or (atlas_sizes and category in atlas_sizes):
+                continue
+            for filename in sorted(os.listdir(category_path)):
+                if filename.endswith(".png"):
+                    manifest.append(("png", category, filename[:-4]))
+
+        for path, sizes in (svg_sizes or {}).items():
+            for size in sizes:
+                manifest.append(("svg", path, size))
+        return manifest
+
+    @staticmethod
+    def describe(entry):
+        """清单项的显示名称
+
+        Args:
+            entry: 清单项
+
+        Returns:
+            显示名称
+        """
+        kind, arg1, arg2 = entry
+        if kind == "atlas":
+            return "纹理图集"
+        if kind == "png":
+            return f"{arg1}/{arg2}.png"
+        return f"{arg1} {arg2}" if arg2 else arg1
+
+    @property
+    def total(self):
+        """清单总项数"""
+        return len(self.manifest)
+
+    @property
+    def progress(self):
+        """加载进度（0到1）"""
+        return self.loaded / self.total if self.manifest else 1.0
+
+    @property
+    def done(self):
+        """是否全部完成"""
+        return self.loaded >= self.total
+
+    def start(self):
+        """把清单中的所有项提交到线程池"""
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="asset-preloader")
+        for entry in self.manifest:
+            future = self.executor.submit(self._decode, entry)
+            future.add_done_callback(lambda future, entry=entry: self._on_decoded(entry, future))
+
+    def _decode(self, entry):
+        """在线程池中解码一项资源
+
+        Args:
+            entry: 清单项
+
+        Returns:
+            未转换像素格式的解码结果
+        """
+        kind, arg1, arg2 = entry
+        if kind == "atlas":
+            return self.image_manager.build_atlas(arg1, arg2, convert=False)
+        if kind == "png":
+            return self.image_manager.decode_image(arg1, arg2)
+        if kind == "svg":
+            return self.image_manager.decode_svg(arg1, arg2)
+        raise ValueError(f"未知的资源类型: {kind}")
+
+    def _on_decoded(self, entry, future):
+        """线程池回调，把结果交给主线程"""
+        exception = future.exception()
+        self.results.put((entry, None if exception else future.result(), exception))
+
+    def update(self):
+        """在主线程处理已解码的资源，单次调用不超过每帧时间预算
+
+        Returns:
+            是否全部完成
+        """
+        deadline = time.perf_counter() + self.frame_budget
+        while not self.done:
+            try:
+                self._handle_result(*self.results.get_nowait())
+            except queue.Empty:
+                break
+            if time.perf_counter() >= deadline:
+                break
+
+        if self.done:
+            self.shutdown()
+        return self.done
+
+    def run_until_done(self):
+        """阻塞直到所有资源加载完成（不显示加载界面时使用）"""
+        if self.executor is None:
+            self.start()
+        while not self.done:
+            self._handle_result(*self.results.get())
+        self.shutdown()
+
+    def _handle_result(self, entry, result, exception):
+        """处理一项解码结果
+
+        Args:
+            entry: 清单项
+            result: 解码结果
+            exception: 解码时抛出的异常，成功时为None
+        """
+        if exception is None:
+            try:
+                self._finish(entry, result)
+            except Exception as e:
+                exception = e
+        if exception is not None:
+            # 失败的资源保留原来的按需加载（包括占位符）逻辑
+            print(f"预加载资源失败 {self.describe(entry)}: {exception}")
+            self.failed.append((entry, exception))
+
+        self.loaded += 1
+        self.current = entry
+
+    def _finish(self, entry, result):
+        """在主线程转换像素格式并放入图像管理器
+
+        Args:
+            entry: 清单项
+            result: 解码结果
+        """
+        kind, arg1, arg2 = entry
+        if kind == "atlas":
+            result.convert_pages()
+            self.image_manager.set_atlas(result)
+        elif kind == "png":
+            self.image_manager.finish_image(arg1, arg2, result)
+        elif kind == "svg":
+            self.image_manager.finish_svg(arg1, arg2, result)
+
+    def shutdown(self):
+        """关闭线程池"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
@@ -0,0 +1,46 @@
+"""预先生成磁盘资源缓存
+
+把config.SVG_SIZES中列出的SVG按所有用到的尺寸栅格化，并打包纹理图集，
+之后游戏启动时直接读取缓存，不再导入cairosvg或逐个解码原图。
+
+用法（在stardew_clone目录下）：
+    python -m utils.bake_assets
+"""
+import os
+import sys
+import time
+
+from config import ASSET_CACHE_DIR, ATLAS_ENABLED, ATLAS_SIZES, ATLAS_PAGE_SIZE, SVG_SIZES
+from utils.image_manager import ImageManager
+
+
+def main():
+    if not ASSET_CACHE_DIR:
+        print("ASSET_CACHE_DIR 未设置，不使用磁盘缓存")
+        return 1
+    
+    cache_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ASSET_CACHE_DIR)
+    manager = ImageManager(cache_dir=cache_dir)
+    
+    failed = 0
+    for path, sizes in SVG_SIZES.items():
+        for size in sizes:
+            try:
+                cache_hit = manager.bake_svg(path, size)
+            except Exception as e:
+                print(f"失败  {path} {size}: {e}")
+                failed += 1
+                continue
+            print(f"{'已缓存' if cache_hit else '已生成'}  {path} {size or '原始尺寸'}")
+    
+    if ATLAS_ENABLED:
+        start = time.perf_counter()
+        atlas = manager.load_atlas(ATLAS_SIZES, ATLAS_PAGE_SIZE)
+        print(f"纹理图集  {len(atlas.regions)} 个区域，{len(atlas.pages)} 页，{(time.perf_counter() - start) * 1000:.0f} ms")
+    
+    print(f"缓存目录: {cache_dir}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+import pygame
+from utils.font_manager import font_manager
+from utils.profiler import profiler
+
+
+class DebugHud:
+    """调试信息面板（按F3切换）
+
+    在屏幕右上角显示帧率、每帧文字渲染耗时和文字缓存命中率。
+    按F4开关帧耗时分析，开启时额外显示最近帧耗时的p50/p95/p99和耗时最多的计时范围；
+    按F5把分析样本导出到文件。
+    显示的文字每隔一段时间才刷新，避免数值每帧变化导致文字缓存不断未命中。
+    """
+
+    # 显示的计时范围数量
+    MAX_SCOPES = 8
+
+    def __init__(self, clock, visible=False, refresh_interval=500, dump_path=None):
+        """初始化调试面板
+
+        Args:
+            clock: 游戏主循环的pygame.time.Clock
+            visible: 是否默认显示
+            refresh_interval: 文字刷新间隔（毫秒）
+            dump_path: 按F5时导出分析样本的路径
+        """
+        self.clock = clock
+        self.dump_path = dump_path
+        self.visible = visible
+        self.refresh_interval = refresh_interval
+        self.font = font_manager.get_font(16)
+        self.lines = []
+        self.panel = None  # 半透明背景，尺寸不变时复用
+        self.last_refresh = -refresh_interval
+
+    def handle_event(self, event):
+        """处理切换按键
+
+        Args:
+            event: pygame事件
+
+        Returns:
+            事件是否已被处理
+        """
+        if event.type != pygame.KEYDOWN:
+            return False
+        if event.key == pygame.K_F3:
+            self.visible = not self.visible
+        elif event.key == pygame.K_F4:
+            profiler.set_enabled(not profiler.enabled)
+            if profiler.enabled:
+                profiler.clear()
+                self.visible = True
+        elif event.key == pygame.K_F5:
+            self.dump()
+        else:
+            return False
+        self.last_refresh = -self.refresh_interval
+        return True
+
+    def dump(self):
+        """导出帧耗时分析样本"""
+        if not self.dump_path or not profiler.samples:
+            return
+        try:
+            count = profiler.dump(self.dump_path)
+            print(f"已导出 {count} 帧分析样本到 {self.dump_path}")
+        except OSError as e:
+            print(f"无法导出分析样本 {self.dump_path}: {e}")
+
+    def refresh(self, scene=None):
+        """重新生成显示的文字
+
+        Args:
+            scene: 当前场景，提供render_stats时一并显示绘制统计
+        """
+        stats = font_manager.get_stats()
+        self.lines = [
+            f"FPS: {self.clock.get_fps():.1f}",
+            f"文字渲染: {stats['frame_time_ms']:.2f} ms/帧",
+            f"文字缓存: {stats['hit_rate'] * 100:.1f}% 命中 ({stats['cached']}/{font_manager.text_cache_size})"
+        ]
+        render_stats = getattr(scene, "render_stats", None)
+        if render_stats:
+            self.lines.append(f"绘制: {render_stats['drawn']}/{render_stats['submitted']} ({render_stats['draw_calls']}次)")
+
+        if profiler.enabled:
+            percentiles = profiler.frame_percentiles()
+            self.lines.append(f"帧耗时 p50/p95/p99: {percentiles[50]:.1f} / {percentiles[95]:.1f} / {percentiles[99]:.1f} ms")
+            for name, elapsed in profiler.scope_averages()[:self.MAX_SCOPES]:
+                self.lines.append(f"  {name}: {elapsed:.2f} ms")
+        else:
+            self.lines.append("F4: 帧耗时分析")
+
+    def render(self, screen, scene=None):
+        """绘制调试面板
+
+        Args:
+            screen: pygame屏幕对象
+            scene: 当前场景
+        """
+        if not self.visible:
+            return
+
+        now = pygame.time.get_ticks()
+        if now - self.last_refresh >= self.refresh_interval:
+            self.refresh(scene)
+            self.last_refresh = now
+
+        surfaces = [font_manager.render(self.font, line, True, (255, 255, 255)) for line in self.lines]
+        width = max(surface.get_width() for surface in surfaces) + 16
+        height = sum(surface.get_height() for surface in surfaces) + 12
+        x = screen.get_width() - width - 10
+
+        if self.panel is None or self.panel.get_size() != (width, height):
+            self.panel = pygame.Surface((width, height), pygame.SRCALPHA)
+            self.panel.fill((0, 0, 0, 160))
+        screen.blit(self.panel, (x, 10))
+
+        y = 16
+        for surface in surfaces:
+            screen.blit(surface, (x + 8, y))
+            y += surface.get_height()
@@ -1,14 +1,34 @@
 import os
+import time
 import pygame
+from collections import OrderedDict
+from config import TEXT_CACHE_SIZE
 
 class FontManager:
     """字体管理器，用于统一管理游戏中的字体"""
 
-    def __init__(self, font_path="assets/fonts/YShiMinchoCL-Regular.ttf"):
-        """初始化字体管理器"""
+    def __init__(self, font_path="assets/fonts/YShiMinchoCL-Regular.ttf", text_cache_size=TEXT_CACHE_SIZE):
+        """初始化字体管理器
+
+        Args:
+            font_path: 字体文件路径
+            text_cache_size: 文字表面缓存的最大条目数
+        """
         self.fonts = {}
+        self.font_keys = {}  # {id(字体): (大小, 粗体)}，用于由字体对象得到缓存键
         self.font_path = font_path if os.path.exists(font_path) else None
 
+        # 文字表面的LRU缓存：{(文字, 大小, 颜色, 抗锯齿, 粗体): 表面}
+        self.text_cache = OrderedDict()
+        self.text_cache_size = text_cache_size
+
+        # 缓存统计
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._frame_time = 0.0          # 当前帧render调用的累计耗时（秒）
+        self.last_frame_time_ms = 0.0   # 上一帧render调用的累计耗时（毫秒）
+
     def get_font(self, size, bold=False):
         """获取指定大小的字体"""
         key = f"{size}_{bold}"
@@ -26,9 +46,82 @@ class FontManager:
             except Exception as e:
                 print(f"字体加载失败: {e}")
                 self.fonts[key] = pygame.font.Font(None, size)
+            self.font_keys[id(self.fonts[key])] = (size, bold)
 
         return self.fonts[key]
 
+    def render(self, font, text, antialias, color):
+        """渲染文字，结果按(文字, 大小, 颜色, 抗锯齿, 粗体)缓存
+
+        参数顺序与pygame的font.render相同。返回的表面在调用者之间共享，不能修改。
+
+        Args:
+            font: 通过get_font获取的字体
+            text: 文字
+            antialias: 是否抗锯齿
+            color: 文字颜色
+
+        Returns:
+            文字表面
+        """
+        start = time.perf_counter()
+        font_key = self.font_keys.get(id(font))
+        if font_key is None:
+            # 不是由字体管理器创建的字体，无法确定缓存键
+            surface = font.render(text, antialias, color)
+            self.misses += 1
+        else:
+            key = (text, font_key[0], tuple(color), antialias, font_key[1])
+            surface = self.text_cache.get(key)
+            if surface is not None:
+                self.text_cache.move_to_end(key)
+                self.hits += 1
+            else:
+                surface = font.render(text, antialias, color)
+                self.text_cache[key] = surface
+                self.misses += 1
+                if len(self.text_cache) > self.text_cache_size:
+                    self.text_cache.popitem(last=False)
+                    self.evictions += 1
+        self._frame_time += time.perf_counter() - start
+        return surface
+
+    def render_text(self, text, size, color, antialias=True, bold=False):
+        """按字体大小渲染文字（带缓存）
+
+        Args:
+            text: 文字
+            size: 字体大小
+            color: 文字颜色
+            antialias: 是否抗锯齿
+            bold: 是否粗体
+
+        Returns:
+            文字表面
+        """
+        return self.render(self.get_font(size, bold), text, antialias, color)
+
+    def end_frame(self):
+        """结束一帧，记录本帧文字渲染的累计耗时"""
+        self.last_frame_time_ms = self._frame_time * 1000
+        self._frame_time = 0.0
+
+    def get_stats(self):
+        """获取文字缓存统计
+
+        Returns:
+            统计字典
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+            "cached": len(self.text_cache),
+            "frame_time_ms": self.last_frame_time_ms
+        }
+
 
 # 创建全局字体管理器实例
-font_manager = FontManager()
\ No newline at end of file
+font_manager = FontManager()
@@ -1,17 +1,75 @@
 import pygame
 import os
 import io
-import cairosvg
+import hashlib
+from utils.texture_atlas import TextureAtlas
 
 class ImageManager:
     """图像管理器，负责加载和缓存游戏中使用的图像资源"""
     
-    def __init__(self):
-        """初始化图像管理器"""
+    def __init__(self, cache_dir=None):
+        """初始化图像管理器
+        
+        Args:
+            cache_dir: 磁盘资源缓存目录（SVG栅格化结果和纹理图集），None表示不使用磁盘缓存
+        """
+        self.cache_dir = cache_dir
         self.images = {}
         self.sprites = {}
+        self.scaled_images = {}  # {(类别, 名称, 尺寸): 缩放后的图像}
+        self.atlas = None  # 预先缩放的纹理图集，见load_atlas
         self.base_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets', 'images')
     
+    def load_atlas(self, sizes, page_size=1024):
+        """加载纹理图集，之后按图集中的尺寸获取图像时不再解码和缩放原图
+        
+        Args:
+            sizes: 每个类别需要的尺寸 {类别: [尺寸, ...]}
+            page_size: 图集边长
+            
+        Returns:
+            TextureAtlas实例
+        """
+        self.atlas = self.build_atlas(sizes, page_size)
+        return self.atlas
+    
+    def build_atlas(self, sizes, page_size=1024, convert=True):
+        """从磁盘缓存加载或重新打包纹理图集，但不设置为当前图集
+        
+        Args:
+            sizes: 每个类别需要的尺寸 {类别: [尺寸, ...]}
+            page_size: 图集边长
+            convert: 是否转换图集页的像素格式，在后台线程加载时传False
+            
+        Returns:
+            TextureAtlas实例
+        """
+        cache_dir = os.path.join(self.cache_dir, 'atlas') if self.cache_dir else None
+        return TextureAtlas.load_or_build(self.base_path, sizes, page_size, cache_dir, convert)
+    
+    def set_atlas(self, atlas):
+        """设置使用的纹理图集
+        
+        Args:
+            atlas: TextureAtlas实例
+        """
+        self.atlas = atlas
+    
+    def get_atlas_image(self, category, name, size):
+        """从纹理图集获取图像
+        
+        Args:
+            category: 图像类别
+            name: 图像名称
+            size: 尺寸元组 (width, height)，或图集配置中的缩放倍数
+            
+        Returns:
+            图像对象，没有加载图集或图集中没有该尺寸时返回None
+        """
+        if self.atlas is None:
+            return None
+        return self.atlas.get(category, name, size)
+    
     def load_image(self, category, name):
         """加载单个图像
         
@@ -50,6 +108,77 @@ class ImageManager:
         
         return self.images[key]
     
+    def load_scaled_image(self, category, name, size):
+        """加载并缩放图像，缩放结果按(类别, 名称, 尺寸)缓存
+        
+        Args:
+            category: 图像类别
+            name: 图像名称
+            size: 目标尺寸元组 (width, height)
+            
+        Returns:
+            缩放后的图像对象
+        """
+        key = (category, name, size)
+        scaled = self.scaled_images.get(key)
+        if scaled is None:
+            scaled = self.get_atlas_image(category, name, size)
+        if scaled is None:
+            scaled = pygame.transform.scale(self.load_image(category, name), size)
+            self.scaled_images[key] = scaled
+        return scaled
+    
+    def decode_image(self, category, name):
+        """解码PNG图像但不转换像素格式，可以在后台线程调用
+        
+        Args:
+            category: 图像类别
+            name: 图像名称
+            
+        Returns:
+            未转换的图像对象
+        """
+        image_path = os.path.join(self.base_path, category, f"{name}.png")
+        with open(image_path, 'rb') as f:
+            data = f.read()
+        return pygame.image.load(io.BytesIO(data), image_path)
+    
+    def finish_image(self, category, name, surface):
+        """在主线程转换预加载的图像并放入缓存，之后load_image/load_player_sprite直接返回它
+        
+        Args:
+            category: 图像类别
+            name: 图像名称
+            surface: decode_image返回的图像
+        """
+        key = f"{category}/{name}"
+        self.images[key] = surface.convert_alpha()
+        if category == 'player':
+            self.sprites[key] = self.images[key]
+    
+    def decode_svg(self, path, size=None):
+        """栅格化SVG但不转换像素格式，可以在后台线程调用
+        
+        Args:
+            path: SVG文件路径（相对于images目录）
+            size: 可选的输出尺寸元组 (width, height)
+            
+        Returns:
+            未转换的图像对象
+        """
+        png_data, _ = self._rasterize_svg(os.path.join(self.base_path, path), self._normalize_svg_size(size))
+        return pygame.image.load(io.BytesIO(png_data))
+    
+    def finish_svg(self, path, size, surface):
+        """在主线程转换预加载的SVG图像并放入缓存，之后load_svg直接返回它
+        
+        Args:
+            path: SVG文件路径（相对于images目录）
+            size: 输出尺寸
+            surface: decode_svg返回的图像
+        """
+        self.images[f"svg/{path}_{self._normalize_svg_size(size)}"] = surface.convert_alpha()
+    
     def load_player_sprite(self, direction):
         """加载玩家精灵图
         
@@ -102,17 +231,27 @@ class ImageManager:
 
         return stage_images
             
-    def load_svg(self, path, size=None):
+    def load_svg(self, path, size=None, placeholder=True):
         """加载SVG图像并转换为pygame表面
         
+        栅格化结果按(SVG内容哈希, 尺寸)保存在磁盘缓存目录中，缓存命中时不会导入cairosvg。
+        
         Args:
             path: SVG文件路径（相对于images目录）
             size: 可选的输出尺寸元组 (width, height)
+            placeholder: 加载失败时是否返回占位符，为False时返回None
             
         Returns:
             转换后的pygame表面
         """
+        size = self._normalize_svg_size(size)
         key = f"svg/{path}_{size}"
+        if not placeholder and key not in self.images:
+            try:
+                self.finish_svg(path, size, self.decode_svg(path, size))
+            except Exception as e:
+                print(f"无法加载SVG图像 {path}: {e}")
+                return None
         if key not in self.images:
             try:
                 # 构建完整的SVG文件路径
@@ -120,12 +259,7 @@ class ImageManager:
                 
                 # 尝试使用cairosvg将SVG转换为PNG
                 try:
-                    # 如果指定了尺寸，使用指定尺寸
-                    if size:
-                        width, height = size
-                        png_data = cairosvg.svg2png(url=svg_path, output_width=width, output_height=height)
-                    else:
-                        png_data = cairosvg.svg2png(url=svg_path)
+                    png_data, _ = self._rasterize_svg(svg_path, size)
                     
                     # 从内存加载PNG数据
                     png_file = io.BytesIO(png_data)
@@ -157,8 +291,82 @@ class ImageManager:
                 self.images[key] = placeholder
         
         return self.images[key]
+    
+    def bake_svg(self, path, size=None):
+        """预先栅格化SVG并写入磁盘缓存，不创建pygame表面
         
-        return stage_images
+        Args:
+            path: SVG文件路径（相对于images目录）
+            size: 可选的输出尺寸元组 (width, height)
+            
+        Returns:
+            是否命中已有缓存
+        """
+        _, cache_hit = self._rasterize_svg(os.path.join(self.base_path, path), self._normalize_svg_size(size))
+        return cache_hit
+    
+    @staticmethod
+    def _normalize_svg_size(size):
+        """把输出尺寸统一为整数元组，None表示使用SVG的原始尺寸"""
+        if not size:
+            return None
+        width, height = size
+        return (int(width), int(height))
+    
+    def _rasterize_svg(self, svg_path, size):
+        """把SVG栅格化为PNG数据，优先读取磁盘缓存
+        
+        缓存文件名由SVG内容的SHA1和输出尺寸组成，SVG内容变化后自动使用新的缓存文件。
+        cairosvg只在缓存未命中时导入。
+        
+        Args:
+            svg_path: SVG文件完整路径
+            size: 整数尺寸元组或None
+            
+        Returns:
+            (PNG数据, 是否命中缓存)
+            
+        Raises:
+            ImportError: 缓存未命中、cairosvg不可用且指定了输出尺寸
+        """
+        cache_path = None
+        if self.cache_dir:
+            with open(svg_path, 'rb') as f:
+                svg_sha = hashlib.sha1(f.read()).hexdigest()
+            size_name = f"{size[0]}x{size[1]}" if size else "original"
+            cache_path = os.path.join(self.cache_dir, 'svg', f"{svg_sha}_{size_name}.png")
+            try:
+                with open(cache_path, 'rb') as f:
+                    return f.read(), True
+            except OSError:
+                pass
+        
+        try:
+            import cairosvg
+        except (ImportError, OSError) as e:
+            if size:
+                raise ImportError(f"cairosvg不可用: {e}") from e
+            # 没有cairosvg时使用SDL_image自带的SVG解码器，它只能按原始尺寸栅格化
+            buffer = io.BytesIO()
+            pygame.image.save(pygame.image.load(svg_path), buffer, "svg.png")
+            png_data = buffer.getvalue()
+        else:
+            if size:
+                width, height = size
+                png_data = cairosvg.svg2png(url=svg_path, output_width=width, output_height=height)
+            else:
+                png_data = cairosvg.svg2png(url=svg_path)
+        
+        if cache_path:
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                # 先写临时文件再替换，避免中断时留下不完整的缓存
+                with open(cache_path + '.tmp', 'wb') as f:
+                    f.write(png_data)
+                os.replace(cache_path + '.tmp', cache_path)
+            except OSError as e:
+                print(f"无法写入SVG缓存 {cache_path}: {e}")
+        return png_data, False
 
 # 创建全局图像管理器实例
 # 不再在这里创建单例实例，而是在game.py中创建
@@ -0,0 +1,212 @@
+import csv
+import json
+import os
+import time
+from collections import deque
+from config import PROFILER_ENABLED, PROFILER_HISTORY, PROFILER_WINDOW
+
+
+class _NullScope:
+    """关闭分析时使用的空计时范围，进入和退出都不做任何事"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class _Scope:
+    """计时范围，退出时把耗时累加到分析器当前帧的记录中"""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        elapsed = time.perf_counter() - self.start
+        scopes = self.profiler.current_scopes
+        scopes[self.name] = scopes.get(self.name, 0.0) + elapsed
+        return False
+
+
+class FrameProfiler:
+    """帧耗时分析器
+
+    场景和实体可以用命名的计时范围记录各部分的耗时：
+
+        with profiler.scope("farm.render.crops"):
+            ...
+
+    同名范围在一帧内多次进入时耗时累加，嵌套范围各自记录包含子范围在内的耗时。
+    游戏主循环每帧调用begin_frame和end_frame，分析器保留最近若干帧的样本，
+    用于计算帧耗时的p50/p95/p99，以及导出CSV/JSON做离线分析。
+
+    关闭时scope返回共享的空范围，begin_frame/end_frame直接返回，几乎没有开销。
+    """
+
+    def __init__(self, enabled=False, history=3600, window=300):
+        """初始化分析器
+
+        Args:
+            enabled: 是否启用
+            history: 保留的帧样本数（用于导出）
+            window: 计算百分位数时使用的最近帧数
+        """
+        self.enabled = enabled
+        self.window = window
+        self.samples = deque(maxlen=history)  # [(帧序号, 帧耗时秒, {范围名: 耗时秒})]
+        self.current_scopes = {}
+        self.frame_index = 0
+        self._frame_start = None
+
+    def set_enabled(self, enabled):
+        """启用或关闭分析，关闭时丢弃未结束的帧
+
+        Args:
+            enabled: 是否启用
+        """
+        self.enabled = enabled
+        self.current_scopes = {}
+        self._frame_start = None
+
+    def scope(self, name):
+        """获取命名的计时范围，用于with语句
+
+        Args:
+            name: 范围名称，建议使用“模块.阶段.部分”的形式，如farm.render.tiles
+
+        Returns:
+            上下文管理器
+        """
+        if not self.enabled:
+            return _NULL_SCOPE
+        return _Scope(self, name)
+
+    def begin_frame(self):
+        """开始一帧"""
+        if not self.enabled:
+            return
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """结束一帧，记录本帧总耗时和各范围的耗时"""
+        if not self.enabled or self._frame_start is None:
+            return
+        frame_time = time.perf_counter() - self._frame_start
+        self.samples.append((self.frame_index, frame_time, self.current_scopes))
+        self.current_scopes = {}
+        self.frame_index += 1
+        self._frame_start = None
+
+    def clear(self):
+        """清空已记录的样本"""
+        self.samples.clear()
+        self.current_scopes = {}
+        self.frame_index = 0
+
+    def _recent(self):
+        """最近window帧的样本"""
+        count = min(self.window, len(self.samples))
+        return [self.samples[i] for i in range(len(self.samples) - count, len(self.samples))]
+
+    @staticmethod
+    def _percentile(sorted_values, percent):
+        """最近秩法计算百分位数
+
+        Args:
+            sorted_values: 已排序的数值列表
+            percent: 百分位（0到100）
+
+        Returns:
+            百分位数，列表为空时返回0
+        """
+        if not sorted_values:
+            return 0.0
+        index = max(0, min(len(sorted_values) - 1, int(len(sorted_values) * percent / 100 + 0.5) - 1))
+        return sorted_values[index]
+
+    def frame_percentiles(self, percents=(50, 95, 99)):
+        """最近帧耗时的百分位数
+
+        Args:
+            percents: 需要的百分位
+
+        Returns:
+            {百分位: 毫秒}
+        """
+        frame_times = sorted(sample[1] for sample in self._recent())
+        return {percent: self._percentile(frame_times, percent) * 1000 for percent in percents}
+
+    def scope_averages(self):
+        """最近帧中各范围的平均每帧耗时
+
+        Returns:
+            [(范围名, 毫秒)]，按耗时从高到低排序
+        """
+        recent = self._recent()
+        if not recent:
+            return []
+        totals = {}
+        for _, _, scopes in recent:
+            for name, elapsed in scopes.items():
+                totals[name] = totals.get(name, 0.0) + elapsed
+        averages = [(name, total * 1000 / len(recent)) for name, total in totals.items()]
+        averages.sort(key=lambda item: item[1], reverse=True)
+        return averages
+
+    def dump(self, path):
+        """把帧样本导出到文件，按扩展名选择CSV或JSON格式
+
+        CSV每行一帧，列为frame、frame_ms和所有出现过的范围名（毫秒）；
+        JSON为每帧一个对象的列表。
+
+        Args:
+            path: 输出文件路径（.csv或.json）
+
+        Returns:
+            导出的帧数
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        samples = list(self.samples)
+        if path.endswith(".json"):
+            rows = [
+                {
+                    "frame": index,
+                    "frame_ms": frame_time * 1000,
+                    "scopes": {name: elapsed * 1000 for name, elapsed in scopes.items()}
+                }
+                for index, frame_time, scopes in samples
+            ]
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(rows, f, ensure_ascii=False, indent=1)
+        else:
+            names = sorted({name for _, _, scopes in samples for name in scopes})
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["frame", "frame_ms"] + names)
+                for index, frame_time, scopes in samples:
+                    writer.writerow(
+                        [index, f"{frame_time * 1000:.4f}"]
+                        + [f"{scopes[name] * 1000:.4f}" if name in scopes else "" for name in names]
+                    )
+        return len(samples)
+
+
+# 创建全局帧耗时分析器实例
+profiler = FrameProfiler(PROFILER_ENABLED, PROFILER_HISTORY, PROFILER_WINDOW)
@@ -0,0 +1,158 @@
+import pygame
+
+
+class RenderQueue:
+    """实体渲染队列
+
+    实体每帧把绘制命令（表面, 世界坐标, 图层）提交到队列，队列在flush时按图层排序一次，
+    剔除与相机视口不相交的命令，然后每个图层只调用一次screen.blits批量绘制。
+    同一图层内保持提交顺序。
+
+    无法表示为单个表面的绘制（例如直接绘制图元的实体）可以用submit_draw提交绘制函数，
+    它会在所在位置打断当前批次，保证绘制顺序不变。
+    """
+
+    # 图层，数值小的先绘制
+    LAYER_AREAS = 0    # 区域边界
+    LAYER_CROPS = 1    # 作物
+    LAYER_ANIMALS = 2  # 动物
+    LAYER_HOUSES = 3   # 房屋
+    LAYER_PLAYER = 4   # 玩家
+
+    def __init__(self):
+        """初始化渲染队列"""
+        self.commands = []  # [(图层, 表面或None, 世界坐标或绘制函数)]
+        self.camera_x = 0
+        self.camera_y = 0
+        self.view_rect = pygame.Rect(0, 0, 0, 0)
+        self._culled_on_submit = 0  # 提交前就被剔除的命令数量
+
+        # 上一帧的渲染统计
+        self.stats = {
+            "submitted": 0,   # 提交的命令数
+            "drawn": 0,       # 实际绘制的命令数
+            "culled": 0,      # 被视口剔除的命令数
+            "draw_calls": 0   # blits和绘制函数的调用次数
+        }
+
+    def begin(self, camera_x, camera_y, view_width, view_height):
+        """开始新的一帧
+
+        Args:
+            camera_x: 相机X偏移
+            camera_y: 相机Y偏移
+            view_width: 视口宽度
+            view_height: 视口高度
+        """
+        self.commands.clear()
+        self.camera_x = int(camera_x)
+        self.camera_y = int(camera_y)
+        self.view_rect = pygame.Rect(self.camera_x, self.camera_y, view_width, view_height)
+        self._culled_on_submit = 0
+
+    def cull(self, x, y, width, height):
+        """提交前检查一个范围是否在视口之外，用于跳过不可见实体的准备工作
+
+        Args:
+            x: 世界X坐标（像素）
+            y: 世界Y坐标（像素）
+            width: 宽度
+            height: 高度
+
+        Returns:
+            是否被剔除
+        """
+        view_rect = self.view_rect
+        if x + width <= view_rect.left or x >= view_rect.right or y + height <= view_rect.top or y >= view_rect.bottom:
+            self._culled_on_submit += 1
+            return True
+        return False
+
+    def submit(self, surface, x, y, layer):
+        """提交一个表面绘制命令
+
+        Args:
+            surface: 要绘制的表面
+            x: 世界X坐标（像素）
+            y: 世界Y坐标（像素）
+            layer: 图层
+        """
+        self.commands.append((layer, surface, (int(x), int(y))))
+
+    def submit_draw(self, draw, layer, rect=None):
+        """提交一个绘制函数
+
+        Args:
+            draw: 绘制函数，调用方式为 draw(screen, camera_offset)
+            layer: 图层
+            rect: 绘制范围（世界坐标），提供时用于视口剔除
+        """
+        if rect is not None and not self.view_rect.colliderect(rect):
+            self._culled_on_submit += 1
+            return
+        self.commands.append((layer, None, draw))
+
+    def flush(self, screen):
+        """按图层绘制所有命令并清空队列
+
+        Args:
+            screen: pygame屏幕对象
+
+        Returns:
+            本帧的渲染统计
+        """
+        camera_x = self.camera_x
+        camera_y = self.camera_y
+        view_left = self.view_rect.left
+        view_top = self.view_rect.top
+        view_right = self.view_rect.right
+        view_bottom = self.view_rect.bottom
+
+        # sort是稳定排序，同一图层内保持提交顺序
+        commands = self.commands
+        commands.sort(key=lambda command: command[0])
+
+        drawn = 0
+        culled = self._culled_on_submit
+        draw_calls = 0
+        batch = []
+        batch_layer = None
+        for layer, surface, target in commands:
+            if layer != batch_layer:
+                if batch:
+                    screen.blits(batch, doreturn=False)
+                    draw_calls += 1
+                    batch = []
+                batch_layer = layer
+
+            if surface is None:
+                # 绘制函数打断当前批次
+                if batch:
+                    screen.blits(batch, doreturn=False)
+                    draw_calls += 1
+                    batch = []
+                target(screen, (camera_x, camera_y))
+                draw_calls += 1
+                drawn += 1
+                continue
+
+            x, y = target
+            width, height = surface.get_size()
+            if x + width <= view_left or x >= view_right or y + height <= view_top or y >= view_bottom:
+                culled += 1
+                continue
+            batch.append((surface, (x - camera_x, y - camera_y)))
+            drawn += 1
+
+        if batch:
+            screen.blits(batch, doreturn=False)
+            draw_calls += 1
+
+        self.stats = {
+            "submitted": len(commands) + self._culled_on_submit,
+            "drawn": drawn,
+            "culled": culled,
+            "draw_calls": draw_calls
+        }
+        commands.clear()
+        return self.stats
@@ -0,0 +1,78 @@
+class SimClock:
+    """固定步长的模拟时钟
+
+    游戏主循环每帧把pygame.time.Clock.tick()返回的帧间隔交给advance，时钟把时间累加到累加器中，
+    按固定步长换算出本帧需要执行的模拟步数。这样模拟速度只取决于现实时间而不是帧率：
+    掉帧时下一帧会补算多步，渲染帧率降低也不影响游戏内时间的流逝。
+
+    累加器中剩余不足一步的时间用alpha表示（0到1），渲染时可以据此在上一步和当前步之间插值。
+
+    快进时按倍数放大计入的时间。为了避免卡顿后一次补算过多（越补越慢），
+    单帧计入的时间和执行的步数都有上限，超出的时间会被丢弃。
+    """
+
+    def __init__(self, tick_rate, speeds=(1,), max_frame_time=0.25, max_steps_per_frame=2000):
+        """初始化时钟
+
+        Args:
+            tick_rate: 正常速度下每秒的模拟步数
+            speeds: 可切换的快进倍数，第一个为默认倍数
+            max_frame_time: 单帧计入的最长时间（秒）
+            max_steps_per_frame: 单帧最多执行的模拟步数
+        """
+        self.tick_rate = tick_rate
+        self.dt = 1.0 / tick_rate
+        self.speeds = list(speeds)
+        self.speed = self.speeds[0]
+        self.max_frame_time = max_frame_time
+        self.max_steps_per_frame = max_steps_per_frame
+
+        self.accumulator = 0.0   # 尚未模拟的时间（秒）
+        self.steps = 0           # 累计执行的模拟步数
+        self.dropped_time = 0.0  # 因超过单帧上限而丢弃的时间（秒）
+
+    @property
+    def alpha(self):
+        """当前时刻在上一步和下一步之间的位置（0到1），用于渲染插值"""
+        return max(0.0, min(1.0, self.accumulator / self.dt))
+
+    def reset(self):
+        """清空累加器（切换场景或长时间加载后调用，避免补算加载期间的时间）"""
+        self.accumulator = 0.0
+
+    def set_speed(self, speed):
+        """设置快进倍数
+
+        Args:
+            speed: 倍数
+        """
+        self.speed = speed
+
+    def cycle_speed(self):
+        """切换到下一个快进倍数
+
+        Returns:
+            新的倍数
+        """
+        index = self.speeds.index(self.speed) if self.speed in self.speeds else -1
+        self.speed = self.speeds[(index + 1) % len(self.speeds)]
+        return self.speed
+
+    def advance(self, frame_time):
+        """累加一帧的时间，计算本帧需要执行的模拟步数
+
+        Args:
+            frame_time: 距上一帧的现实时间（秒）
+
+        Returns:
+            模拟步数
+        """
+        self.accumulator += min(frame_time, self.max_frame_time) * self.speed
+        # 加上很小的容差，避免浮点误差使恰好一步的时间被算成0步
+        steps = int(self.accumulator / self.dt + 1e-9)
+        self.accumulator -= steps * self.dt
+        if steps > self.max_steps_per_frame:
+            self.dropped_time += (steps - self.max_steps_per_frame) * self.dt
+            steps = self.max_steps_per_frame
+        self.steps += steps
+        return steps
@@ -0,0 +1,117 @@
+import pygame
+
+
+class SpriteLayer:
+    """静态精灵图层
+
+    用于生成后不再变化的装饰物（树木、花草等）。精灵在加入图层时就已经完成缩放和旋转，
+    按z_index排好序保存在数组中，并按世界坐标划分到固定大小的空间桶里。
+    每帧只需查询与视口相交的桶，按原有顺序blit，不再做任何图像变换。
+    """
+
+    def __init__(self, bucket_size=256):
+        """初始化图层
+
+        Args:
+            bucket_size: 空间桶的边长（像素）
+        """
+        self.bucket_size = bucket_size
+        self.sprites = []   # 按(z_index, 加入顺序)排序的精灵
+        self.buckets = {}   # {(桶X, 桶Y): [精灵下标, ...]}
+        self._pending = []  # 尚未建立索引的精灵
+
+        # 渲染统计
+        self.visible_count = 0  # 上一帧绘制的精灵数
+
+    def clear(self):
+        """清空图层"""
+        self.sprites = []
+        self.buckets = {}
+        self._pending = []
+        self.visible_count = 0
+
+    def add(self, surface, x, y, z_index=0, data=None):
+        """加入一个已经变换好的精灵
+
+        Args:
+            surface: 精灵表面（已缩放/旋转）
+            x: 精灵左上角的世界X坐标（像素）
+            y: 精灵左上角的世界Y坐标（像素）
+            z_index: 深度，数值小的先绘制
+            data: 附加数据（例如装饰字典），渲染时原样返回
+
+        Returns:
+            精灵字典
+        """
+        sprite = {
+            "surface": surface,
+            "rect": surface.get_rect(topleft=(int(x), int(y))),
+            "z_index": z_index,
+            "data": data
+        }
+        self._pending.append(sprite)
+        return sprite
+
+    def build(self):
+        """对新加入的精灵排序并重建空间索引"""
+        if not self._pending:
+            return
+
+        # sort是稳定排序，相同z_index的精灵保持加入顺序
+        self.sprites.extend(self._pending)
+        self._pending = []
+        self.sprites.sort(key=lambda sprite: sprite["z_index"])
+
+        self.buckets = {}
+        size = self.bucket_size
+        for index, sprite in enumerate(self.sprites):
+            rect = sprite["rect"]
+            for by in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                for bx in range(rect.left // size, (rect.right - 1) // size + 1):
+                    self.buckets.setdefault((bx, by), []).append(index)
+
+    def query(self, view_rect):
+        """查询与视口相交的精灵
+
+        Args:
+            view_rect: 视口矩形（世界坐标）
+
+        Returns:
+            按绘制顺序排列的精灵列表
+        """
+        self.build()
+
+        size = self.bucket_size
+        indices = set()
+        for by in range(view_rect.top // size, (view_rect.bottom - 1) // size + 1):
+            for bx in range(view_rect.left // size, (view_rect.right - 1) // size + 1):
+                bucket = self.buckets.get((bx, by))
+                if bucket:
+                    indices.update(bucket)
+
+        # 精灵数组已按z_index排序，按下标排序即可恢复绘制顺序
+        sprites = self.sprites
+        return [sprites[i] for i in sorted(indices) if sprites[i]["rect"].colliderect(view_rect)]
+
+    def render(self, screen, camera_x, camera_y):
+        """绘制与屏幕相交的精灵
+
+        Args:
+            screen: pygame屏幕对象
+            camera_x: 相机X偏移
+            camera_y: 相机Y偏移
+
+        Returns:
+            本帧绘制的精灵列表
+        """
+        camera_x = int(camera_x)
+        camera_y = int(camera_y)
+        view_rect = pygame.Rect(camera_x, camera_y, screen.get_width(), screen.get_height())
+        visible = self.query(view_rect)
+
+        screen.blits(
+            [(sprite["surface"], (sprite["rect"].x - camera_x, sprite["rect"].y - camera_y)) for sprite in visible],
+            doreturn=False
+        )
+        self.visible_count = len(visible)
+        return visible
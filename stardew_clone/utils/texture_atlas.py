@@ -0,0 +1,255 @@
+import pygame
+import os
+import json
+import hashlib
+
+
+class TextureAtlas:
+    """纹理图集
+
+    把assets/images下各类别的PNG按游戏实际绘制的尺寸预先缩放，
+    用货架算法（按高度排序逐行摆放）打包到一张或几张图集表面中，并记录每个图像的区域索引。
+
+    图集可以保存到磁盘缓存目录，缓存键由所有源文件的路径、修改时间和尺寸配置计算，
+    任一源文件变化都会使缓存失效。缓存命中时启动只需解码图集PNG，而不是逐个解码原图。
+    """
+
+    # 缓存格式版本，修改保存格式时递增
+    FORMAT_VERSION = 1
+
+    # 图集中相邻图像之间的间隔（像素）
+    PADDING = 1
+
+    def __init__(self, pages, regions, key=None):
+        """初始化图集
+
+        Args:
+            pages: 图集表面列表
+            regions: 区域索引 {(类别, 名称, 尺寸): (图集页下标, pygame.Rect)}
+            key: 缓存键
+        """
+        self.pages = pages
+        self.regions = regions
+        self.key = key
+        self._subsurfaces = {}  # 区域对应的子表面缓存
+
+    def get(self, category, name, size):
+        """获取图集中的图像
+
+        Args:
+            category: 图像类别
+            name: 图像名称
+            size: 尺寸元组 (width, height)，或配置中的缩放倍数
+
+        Returns:
+            与图集共享像素的子表面，不在图集中时返回None
+        """
+        key = (category, name, size)
+        surface = self._subsurfaces.get(key)
+        if surface is None:
+            region = self.regions.get(key)
+            if region is None:
+                return None
+            page_index, rect = region
+            surface = self.pages[page_index].subsurface(rect)
+            self._subsurfaces[key] = surface
+        return surface
+
+    def convert_pages(self):
+        """把图集页转换为与屏幕相同的像素格式（需要在主线程、设置显示模式之后调用）"""
+        if pygame.display.get_surface() is not None:
+            self.pages = [page.convert_alpha() for page in self.pages]
+            self._subsurfaces = {}
+
+    @staticmethod
+    def list_sources(base_path, sizes):
+        """列出需要打包的源文件
+
+        Args:
+            base_path: 图像根目录
+            sizes: 每个类别需要的尺寸 {类别: [尺寸, ...]}
+
+        Returns:
+            [(类别, 名称, 文件路径)]，按类别和名称排序
+        """
+        sources = []
+        for category in sorted(sizes):
+            category_path = os.path.join(base_path, category)
+            if not os.path.isdir(category_path):
+                continue
+            for filename in sorted(os.listdir(category_path)):
+                if filename.endswith(".png"):
+                    sources.append((category, filename[:-4], os.path.join(category_path, filename)))
+        return sources
+
+    @classmethod
+    def compute_key(cls, base_path, sizes, page_size):
+        """计算缓存键
+
+        Args:
+            base_path: 图像根目录
+            sizes: 每个类别需要的尺寸
+            page_size: 图集边长
+
+        Returns:
+            缓存键（十六进制字符串）
+        """
+        digest = hashlib.sha1()
+        digest.update(json.dumps([cls.FORMAT_VERSION, page_size, sorted(sizes.items())]).encode("utf-8"))
+        for category, name, path in cls.list_sources(base_path, sizes):
+            stat = os.stat(path)
+            digest.update(f"{category}/{name}:{stat.st_mtime_ns}:{stat.st_size}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    @classmethod
+    def build(cls, base_path, sizes, page_size=1024):
+        """解码源图像，缩放并打包成图集
+
+        Args:
+            base_path: 图像根目录
+            sizes: 每个类别需要的尺寸 {类别: [尺寸, ...]}，整数为正方形边长，浮点数为缩放倍数
+            page_size: 图集边长
+
+        Returns:
+            TextureAtlas实例
+        """
+        # 解码并缩放所有图像
+        images = []  # [(区域键列表, 缩放后的表面)]
+        for category, name, path in cls.list_sources(base_path, sizes):
+            try:
+                image = pygame.image.load(path)
+            except pygame.error as e:
+                print(f"无法加载图像 {path}: {e}")
+                continue
+
+            for size in sizes[category]:
+                if isinstance(size, float):
+                    target = (int(image.get_width() * size), int(image.get_height() * size))
+                    # 按缩放倍数配置的图像同时可以用实际尺寸查询
+                    keys = [(category, name, size), (category, name, target)]
+                else:
+                    target = (size, size)
+                    keys = [(category, name, target)]
+                if target[0] + cls.PADDING > page_size or target[1] + cls.PADDING > page_size:
+                    print(f"图像 {category}/{name} 缩放后超出图集大小，已跳过")
+                    continue
+                images.append((keys, pygame.transform.scale(image, target)))
+
+        # 货架算法：按高度从高到低逐行摆放，当前页放不下时开启新的一页
+        images.sort(key=lambda item: (item[1].get_height(), item[1].get_width()), reverse=True)
+        pages = []
+        regions = {}
+        page = None
+        shelf_x = shelf_y = shelf_height = 0
+        for keys, image in images:
+            width, height = image.get_size()
+            if page is not None and shelf_x + width > page_size:
+                # 换到下一行
+                shelf_y += shelf_height + cls.PADDING
+                shelf_x = shelf_height = 0
+            if page is None or shelf_y + height > page_size:
+                page = pygame.Surface((page_size, page_size), pygame.SRCALPHA)
+                pages.append(page)
+                shelf_x = shelf_y = shelf_height = 0
+
+            # 图集页初始全透明，BLEND_RGBA_MAX等于原样复制像素（包括alpha）
+            page.blit(image, (shelf_x, shelf_y), special_flags=pygame.BLEND_RGBA_MAX)
+            rect = pygame.Rect(shelf_x, shelf_y, width, height)
+            for key in keys:
+                regions[key] = (len(pages) - 1, rect)
+            shelf_x += width + cls.PADDING
+            shelf_height = max(shelf_height, height)
+
+        return cls(pages, regions, key=cls.compute_key(base_path, sizes, page_size))
+
+    def save(self, cache_dir):
+        """把图集保存到缓存目录
+
+        Args:
+            cache_dir: 缓存目录
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        page_files = []
+        for index, page in enumerate(self.pages):
+            filename = f"atlas_{index}.png"
+            pygame.image.save(page, os.path.join(cache_dir, filename))
+            page_files.append(filename)
+
+        index_data = {
+            "key": self.key,
+            "pages": page_files,
+            "regions": [
+                [category, name, size if isinstance(size, float) else list(size), page_index, rect.x, rect.y, rect.w, rect.h]
+                for (category, name, size), (page_index, rect) in self.regions.items()
+            ]
+        }
+        # 最后写入索引，并用替换保证索引和图集页一致
+        index_path = os.path.join(cache_dir, "atlas.json")
+        with open(index_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(index_data, f, ensure_ascii=False)
+        os.replace(index_path + ".tmp", index_path)
+
+    @classmethod
+    def load(cls, cache_dir, key, convert=True):
+        """从缓存目录加载图集
+
+        Args:
+            cache_dir: 缓存目录
+            key: 期望的缓存键
+            convert: 是否对图集页调用convert_alpha（只能在主线程调用）
+
+        Returns:
+            TextureAtlas实例，缓存不存在或已失效时返回None
+        """
+        index_path = os.path.join(cache_dir, "atlas.json")
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                index_data = json.load(f)
+            if index_data.get("key") != key:
+                return None
+
+            pages = []
+            for filename in index_data["pages"]:
+                page = pygame.image.load(os.path.join(cache_dir, filename))
+                if convert and pygame.display.get_surface() is not None:
+                    page = page.convert_alpha()
+                pages.append(page)
+
+            regions = {}
+            for category, name, size, page_index, x, y, w, h in index_data["regions"]:
+                size = size if isinstance(size, float) else tuple(size)
+                regions[(category, name, size)] = (page_index, pygame.Rect(x, y, w, h))
+        except (OSError, ValueError, KeyError, pygame.error):
+            return None
+
+        return cls(pages, regions, key=key)
+
+    @classmethod
+    def load_or_build(cls, base_path, sizes, page_size=1024, cache_dir=None, convert=True):
+        """优先从磁盘缓存加载图集，缓存未命中时重新打包并写回缓存
+
+        Args:
+            base_path: 图像根目录
+            sizes: 每个类别需要的尺寸
+            page_size: 图集边长
+            cache_dir: 缓存目录，None表示不使用磁盘缓存
+            convert: 是否对图集页调用convert_alpha，在后台线程加载时传False，之后在主线程调用convert_pages
+
+        Returns:
+            TextureAtlas实例
+        """
+        if cache_dir:
+            atlas = cls.load(cache_dir, cls.compute_key(base_path, sizes, page_size), convert)
+            if atlas is not None:
+                return atlas
+
+        atlas = cls.build(base_path, sizes, page_size)
+        if convert:
+            atlas.convert_pages()
+
+        if cache_dir:
+            try:
+                atlas.save(cache_dir)
+            except (OSError, pygame.error) as e:
+                print(f"无法保存纹理图集缓存 {cache_dir}: {e}")
+        return atlas
@@ -0,0 +1,169 @@
+import pygame
+from collections import OrderedDict
+
+
+class TileMapRenderer:
+    """分块瓦片地图渲染器
+
+    把农场地面（草地、纹理点、耕地、浇水痕迹、栅栏）按固定大小的区块预先绘制到离屏表面上，
+    每帧只需要把与相机相交的几个区块blit到屏幕。某个瓦片变化时只重绘它所在的区块，
+    因此每帧的开销只和屏幕大小有关，和农场面积无关。
+    """
+
+    # 草地和纹理颜色：(晴天, 雨天)
+    GRASS_COLORS = ((144, 238, 144), (124, 218, 124))
+    DOT_COLORS = ((220, 255, 220), (200, 235, 200))
+    TILLED_COLOR = (139, 69, 19)
+    WATERED_COLOR = (101, 67, 33)
+    FENCE_COLOR = (139, 69, 19)
+    FENCE_DETAIL_COLOR = (160, 82, 45)
+
+    def __init__(self, width, height, tile_size, chunk_size=8, max_cached_chunks=64):
+        """初始化渲染器
+
+        Args:
+            width: 农场宽度（瓦片数）
+            height: 农场高度（瓦片数）
+            tile_size: 瓦片像素大小
+            chunk_size: 每个区块的边长（瓦片数）
+            max_cached_chunks: 最多缓存的区块表面数量，超出时淘汰最久未使用的区块
+        """
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
+        self.chunk_size = chunk_size
+        self.max_cached_chunks = max_cached_chunks
+
+        self.chunks = OrderedDict()  # {(区块X, 区块Y): 表面}，按最近使用排序
+        self.dirty = set()           # 需要重绘的区块
+        self.rainy = None            # 区块绘制时的天气
+
+        # 渲染统计
+        self.chunks_drawn = 0   # 上一帧blit的区块数
+        self.chunks_baked = 0   # 上一帧重绘的区块数
+
+    def invalidate_tile(self, x, y):
+        """标记某个瓦片所在的区块需要重绘
+
+        Args:
+            x: 瓦片X坐标
+            y: 瓦片Y坐标
+        """
+        self.dirty.add((x // self.chunk_size, y // self.chunk_size))
+
+    def invalidate_all(self):
+        """丢弃所有区块缓存（例如天气变化时）"""
+        self.chunks.clear()
+        self.dirty.clear()
+
+    def render(self, screen, grid, rainy, camera_x, camera_y):
+        """渲染与相机相交的区块
+
+        Args:
+            screen: pygame屏幕对象
+            grid: 农场网格（FarmGrid）
+            rainy: 是否下雨（影响草地颜色）
+            camera_x: 相机X偏移
+            camera_y: 相机Y偏移
+        """
+        if rainy != self.rainy:
+            self.invalidate_all()
+            self.rainy = rainy
+
+        chunk_px = self.chunk_size * self.tile_size
+        chunks_x = (self.width + self.chunk_size - 1) // self.chunk_size
+        chunks_y = (self.height + self.chunk_size - 1) // self.chunk_size
+
+        # 与屏幕相交的区块范围
+        first_cx = max(0, int(camera_x // chunk_px))
+        first_cy = max(0, int(camera_y // chunk_px))
+        last_cx = min(chunks_x - 1, int((camera_x + screen.get_width()) // chunk_px))
+        last_cy = min(chunks_y - 1, int((camera_y + screen.get_height()) // chunk_px))
+
+        self.chunks_drawn = 0
+        self.chunks_baked = 0
+        for cy in range(first_cy, last_cy + 1):
+            for cx in range(first_cx, last_cx + 1):
+                key = (cx, cy)
+                surface = self.chunks.get(key)
+                if surface is None or key in self.dirty:
+                    surface = self._bake_chunk(cx, cy, grid)
+                    self.chunks[key] = surface
+                    self.dirty.discard(key)
+                    self.chunks_baked += 1
+                self.chunks.move_to_end(key)
+                screen.blit(surface, (cx * chunk_px - camera_x, cy * chunk_px - camera_y))
+                self.chunks_drawn += 1
+
+        # 淘汰最久未使用的区块
+        while len(self.chunks) > self.max_cached_chunks:
+            old_key, _ = self.chunks.popitem(last=False)
+            self.dirty.discard(old_key)
+
+    def _bake_chunk(self, cx, cy, grid):
+        """绘制一个区块
+
+        Args:
+            cx: 区块X坐标
+            cy: 区块Y坐标
+            grid: 农场网格（FarmGrid）
+
+        Returns:
+            区块表面
+        """
+        tile_size = self.tile_size
+        start_x = cx * self.chunk_size
+        start_y = cy * self.chunk_size
+        end_x = min(start_x + self.chunk_size, self.width)
+        end_y = min(start_y + self.chunk_size, self.height)
+
+        surface = pygame.Surface(((end_x - start_x) * tile_size, (end_y - start_y) * tile_size))
+        weather_index = 1 if self.rainy else 0
+        surface.fill(self.GRASS_COLORS[weather_index])
+        dot_color = self.DOT_COLORS[weather_index]
+
+        fence_size = tile_size // 8
+        for y in range(start_y, end_y):
+            for x in range(start_x, end_x):
+                # 区块内坐标
+                px = (x - start_x) * tile_size
+                py = (y - start_y) * tile_size
+
+                # 添加草地纹理（小白点）
+                if (x + y) % 7 == 0:
+                    dot_size = 2
+                    dot_x = px + (x * 13) % (tile_size - dot_size)
+                    dot_y = py + (y * 17) % (tile_size - dot_size)
+                    pygame.draw.rect(surface, dot_color, (dot_x, dot_y, dot_size, dot_size))
+
+                # 绘制耕地
+                code = grid.code(x, y)
+                if code == grid.TILLED or code == grid.WATERED:
+                    pygame.draw.rect(surface, self.TILLED_COLOR, (px + 2, py + 2, tile_size - 4, tile_size - 4))
+                    # 如果已浇水，绘制深色
+                    if code == grid.WATERED:
+                        pygame.draw.rect(surface, self.WATERED_COLOR, (px + 4, py + 4, tile_size - 8, tile_size - 8))
+
+                # 绘制木栅栏边界
+                # 左边界
+                if x == 0:
+                    pygame.draw.rect(surface, self.FENCE_COLOR, (px, py, fence_size, tile_size))
+                    if y % 2 == 0:
+                        pygame.draw.rect(surface, self.FENCE_DETAIL_COLOR, (px, py + tile_size // 4, fence_size, tile_size // 8))
+                # 右边界
+                if x == self.width - 1:
+                    pygame.draw.rect(surface, self.FENCE_COLOR, (px + tile_size - fence_size, py, fence_size, tile_size))
+                    if y % 2 == 0:
+                        pygame.draw.rect(surface, self.FENCE_DETAIL_COLOR, (px + tile_size - fence_size, py + tile_size // 4, fence_size, tile_size // 8))
+                # 上边界
+                if y == 0:
+                    pygame.draw.rect(surface, self.FENCE_COLOR, (px, py, tile_size, fence_size))
+                    if x % 2 == 0:
+                        pygame.draw.rect(surface, self.FENCE_DETAIL_COLOR, (px + tile_size // 4, py, tile_size // 8, fence_size))
+                # 下边界
+                if y == self.height - 1:
+                    pygame.draw.rect(surface, self.FENCE_COLOR, (px, py + tile_size - fence_size, tile_size, fence_size))
+                    if x % 2 == 0:
+                        pygame.draw.rect(surface, self.FENCE_DETAIL_COLOR, (px + tile_size // 4, py + tile_size - fence_size, tile_size // 8, fence_size))
+
+        return surface